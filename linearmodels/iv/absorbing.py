@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Hashable, Iterable
-from typing import Any, DefaultDict, TypeVar, Union, cast
+from collections import OrderedDict, defaultdict
+from collections.abc import Hashable, Iterable, Mapping
+import os
+import pathlib
+import tempfile
+from typing import Any, DefaultDict, NamedTuple, TypeVar, Union, cast
 import warnings
 
 from numpy import (
@@ -19,11 +22,13 @@ from numpy import (
     int16,
     int32,
     int64,
+    load,
     nanmean,
     ndarray,
     ones,
     ptp,
     require,
+    save,
     sqrt,
     squeeze,
     where,
@@ -32,7 +37,6 @@ from numpy import (
 from numpy.linalg import lstsq
 from pandas import Categorical, CategoricalDtype, DataFrame, Series
 import scipy.sparse as sp
-from scipy.sparse.linalg import lsmr
 
 from linearmodels.iv.common import f_statistic, find_constant
 from linearmodels.iv.data import IVData
@@ -45,15 +49,22 @@ from linearmodels.iv.model import (
 )
 from linearmodels.iv.results import AbsorbingLSResults
 from linearmodels.panel.utility import (
+    DEMEAN_METHODS,
     AbsorbingEffectWarning,
     absorbing_warn_msg,
     check_absorbed,
     dummy_matrix,
+    general_group_demean,
     not_absorbed,
     preconditioner,
 )
 from linearmodels.shared.exceptions import missing_warning
 from linearmodels.shared.hypotheses import InvalidTestStatistic, WaldTestStatistic
+from linearmodels.shared.linalg import (
+    BLOCK_LSMR_MIN_COLUMNS,
+    block_lsmr,
+    column_lsmr,
+)
 from linearmodels.shared.utility import DataFrameWrapper, SeriesWrapper
 from linearmodels.typing import AnyPandas, BoolArray, Float64Array
 from linearmodels.typing.data import ArrayLike
@@ -66,7 +77,323 @@ except ImportError:
 Hasher = TypeVar("Hasher", bound=hash_func)
 
 
-_VARIABLE_CACHE: DefaultDict[Hashable, dict[str, ndarray]] = defaultdict(dict)
+class CacheStatistics(NamedTuple):
+    """
+    Typed namedtuple holding absorbed variable cache statistics
+
+    Parameters
+    ----------
+    hits : int
+        Number of lookups that found a cached variable
+    misses : int
+        Number of lookups that did not find a cached variable
+    evictions : int
+        Number of variables removed to remain within the byte budget
+    entries : int
+        Number of cached variables
+    nbytes : int
+        Total size of the cached variables in bytes
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+
+class AbsorbingCache:
+    """
+    Base class for caches of absorbed variables used by lsmr_annihilate
+
+    Entries are keyed by the hash of the absorbed regressors and the digest
+    of the variable. Subclasses implement ``_get``, ``_put``, ``_clear``,
+    ``_entries`` and ``_nbytes``.
+    """
+
+    def __init__(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _get(self, regressor_hash: Hashable, digest: str) -> ndarray | None:
+        raise NotImplementedError
+
+    def _put(self, regressor_hash: Hashable, digest: str, value: ndarray) -> None:
+        raise NotImplementedError
+
+    def _clear(self) -> None:
+        raise NotImplementedError
+
+    def _entries(self) -> int:
+        raise NotImplementedError
+
+    def _nbytes(self) -> int:
+        raise NotImplementedError
+
+    def get(self, regressor_hash: Hashable, digest: str) -> ndarray | None:
+        """
+        Retrieve a cached variable
+
+        Parameters
+        ----------
+        regressor_hash : Hashable
+            Hash of the absorbed regressors
+        digest : str
+            Digest of the variable
+
+        Returns
+        -------
+        {ndarray, None}
+            The cached residual, or None if not in the cache
+        """
+        value = self._get(regressor_hash, digest)
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
+
+    def put(self, regressor_hash: Hashable, digest: str, value: ndarray) -> None:
+        """
+        Store a variable in the cache
+
+        Parameters
+        ----------
+        regressor_hash : Hashable
+            Hash of the absorbed regressors
+        digest : str
+            Digest of the variable
+        value : ndarray
+            Residual to store
+        """
+        self._put(regressor_hash, digest, value)
+
+    def clear(self) -> None:
+        """Remove all cached variables"""
+        self._clear()
+
+    def reset_statistics(self) -> None:
+        """Reset the hit, miss and eviction counters"""
+        self._hits = self._misses = self._evictions = 0
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """Hit, miss and eviction counters and the current size of the cache"""
+        return CacheStatistics(
+            self._hits, self._misses, self._evictions, self._entries(), self._nbytes()
+        )
+
+
+class MemoryCache(AbsorbingCache):
+    """
+    In-memory least-recently-used cache of absorbed variables
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size of the cached variables in bytes. The least
+        recently used variables are evicted when the budget is exceeded.
+        If None, the cache is unbounded. The default is 1 GiB.
+
+    Notes
+    -----
+    ``len(cache)`` is the number of distinct sets of absorbed regressors
+    with cached variables.
+    """
+
+    def __init__(self, max_bytes: int | None = 2**30) -> None:
+        super().__init__()
+        self._max_bytes = max_bytes
+        self._store: OrderedDict[tuple[Hashable, str], ndarray] = OrderedDict()
+        self._counts: DefaultDict[Hashable, int] = defaultdict(int)
+        self._size = 0
+
+    @property
+    def max_bytes(self) -> int | None:
+        """Maximum total size of the cached variables in bytes"""
+        return self._max_bytes
+
+    def _get(self, regressor_hash: Hashable, digest: str) -> ndarray | None:
+        key = (regressor_hash, digest)
+        if key not in self._store:
+            return None
+        self._store.move_to_end(key)
+        return self._store[key]
+
+    def _remove(self, key: tuple[Hashable, str]) -> None:
+        value = self._store.pop(key)
+        self._size -= value.nbytes
+        self._counts[key[0]] -= 1
+        if self._counts[key[0]] == 0:
+            del self._counts[key[0]]
+
+    def _put(self, regressor_hash: Hashable, digest: str, value: ndarray) -> None:
+        key = (regressor_hash, digest)
+        if key in self._store:
+            self._remove(key)
+        if self._max_bytes is not None and value.nbytes > self._max_bytes:
+            return
+        self._store[key] = value
+        self._size += value.nbytes
+        self._counts[regressor_hash] += 1
+        while self._max_bytes is not None and self._size > self._max_bytes:
+            self._remove(next(iter(self._store)))
+            self._evictions += 1
+
+    def _clear(self) -> None:
+        self._store.clear()
+        self._counts.clear()
+        self._size = 0
+
+    def _entries(self) -> int:
+        return len(self._store)
+
+    def _nbytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, regressor_hash: Hashable) -> bool:
+        return regressor_hash in self._counts
+
+    def __getitem__(self, regressor_hash: Hashable) -> dict[str, ndarray]:
+        return {
+            digest: value
+            for (key, digest), value in self._store.items()
+            if key == regressor_hash
+        }
+
+    def __setitem__(
+        self, regressor_hash: Hashable, values: Mapping[str, ndarray]
+    ) -> None:
+        for digest, value in values.items():
+            self._put(regressor_hash, digest, value)
+
+
+class DiskCache(AbsorbingCache):
+    """
+    On-disk cache of absorbed variables that can be shared across processes
+
+    Parameters
+    ----------
+    path : {str, PathLike}
+        Directory used to store the cached variables. Created if it does not
+        exist.
+    max_bytes : int
+        Maximum total size of the cached variables in bytes. The least
+        recently used variables are evicted when the budget is exceeded.
+        If None, the cache is unbounded.
+
+    Notes
+    -----
+    Each variable is stored as a .npy file in a sub-directory named using
+    a digest of the regressor hash. Cached variables are returned as
+    read-only memory-mapped arrays. Files are written to a temporary name
+    and then atomically renamed, so that multiple processes can safely
+    share a cache directory. The hit, miss and eviction counters are local
+    to the process.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_bytes: int | None = None):
+        super().__init__()
+        self._path = pathlib.Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Directory containing the cached variables"""
+        return self._path
+
+    @property
+    def max_bytes(self) -> int | None:
+        """Maximum total size of the cached variables in bytes"""
+        return self._max_bytes
+
+    def _file(self, regressor_hash: Hashable, digest: str) -> pathlib.Path:
+        hasher = hash_func()
+        hasher.update(repr(regressor_hash).encode("utf8"))
+        return self._path / hasher.hexdigest() / f"{digest}.npy"
+
+    def _files(self) -> list[pathlib.Path]:
+        return [f for f in self._path.glob("*/*.npy") if f.is_file()]
+
+    def _get(self, regressor_hash: Hashable, digest: str) -> ndarray | None:
+        file = self._file(regressor_hash, digest)
+        try:
+            value = load(file, mmap_mode="r")
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+        return value
+
+    def _put(self, regressor_hash: Hashable, digest: str, value: ndarray) -> None:
+        file = self._file(regressor_hash, digest)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                save(tmp, ascontiguousarray(value))
+            os.replace(tmp_name, file)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
+        if self._max_bytes is not None:
+            self._evict()
+
+    def _evict(self) -> None:
+        assert self._max_bytes is not None
+        files = []
+        for file in self._files():
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+        files.sort(key=lambda v: v[0])
+        total = sum(size for _, size, _ in files)
+        for _, size, file in files:
+            if total <= self._max_bytes:
+                break
+            try:
+                file.unlink()
+                self._evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def _clear(self) -> None:
+        for file in self._files():
+            try:
+                file.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _entries(self) -> int:
+        return len(self._files())
+
+    def _nbytes(self) -> int:
+        total = 0
+        for file in self._files():
+            try:
+                total += file.stat().st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    def __len__(self) -> int:
+        return len({file.parent for file in self._files()})
+
+
+_VARIABLE_CACHE: AbsorbingCache = MemoryCache()
+
+_BLOCK_LSMR_OPTIONS = {"atol", "btol", "conlim", "maxiter", "show"}
 
 
 def _reset(hasher: Hasher) -> Hasher:
@@ -77,6 +404,46 @@ def _reset(hasher: Hasher) -> Hasher:
         return hash_func()
 
 
+def get_cache() -> AbsorbingCache:
+    """
+    Get the cache used to store absorbed variables
+
+    Returns
+    -------
+    AbsorbingCache
+        The cache currently in use
+    """
+    return _VARIABLE_CACHE
+
+
+def set_cache(cache: AbsorbingCache) -> AbsorbingCache:
+    """
+    Set the cache used to store absorbed variables
+
+    Parameters
+    ----------
+    cache : AbsorbingCache
+        The cache to use, for example a MemoryCache with a byte budget or a
+        DiskCache shared by a pool of workers.
+
+    Returns
+    -------
+    AbsorbingCache
+        The cache previously in use
+
+    Examples
+    --------
+    >>> from linearmodels.iv.absorbing import DiskCache, set_cache
+    >>> previous = set_cache(DiskCache("absorbed-cache", max_bytes=2**33))
+    """
+    global _VARIABLE_CACHE
+    if not isinstance(cache, AbsorbingCache):
+        raise TypeError("cache must be an AbsorbingCache")
+    previous = _VARIABLE_CACHE
+    _VARIABLE_CACHE = cache
+    return previous
+
+
 def clear_cache() -> None:
     """Clear the absorbed variable cache"""
     _VARIABLE_CACHE.clear()
@@ -87,6 +454,9 @@ def lsmr_annihilate(
     y: Float64Array,
     use_cache: bool = True,
     x_hash: Hashable | None = None,
+    cache: AbsorbingCache | None = None,
+    block: bool | None = None,
+    n_jobs: int | None = 1,
     **lsmr_options: bool | float | str | ArrayLike | None | dict[str, Any],
 ) -> Float64Array:
     r"""
@@ -103,6 +473,18 @@ def lsmr_annihilate(
         and retrieved if available.
     x_hash : object
         Hashable object representing the values in x
+    cache : AbsorbingCache
+        Cache used to store and retrieve residuals. If None, the cache set
+        using set_cache is used.
+    block : bool
+        Flag indicating whether to solve for all columns jointly using
+        block_lsmr. If None, block_lsmr is used when at least
+        BLOCK_LSMR_MIN_COLUMNS columns are not in the cache and
+        lsmr_options only contains atol, btol, conlim, maxiter or show.
+    n_jobs : {int, None}
+        Number of threads used to absorb columns, or blocks of columns, in
+        parallel. -1 uses all CPUs. The residuals do not depend on the
+        number of threads.
     lsmr_options: dict
         Dictionary of options to pass to scipy.sparse.linalg.lsmr
 
@@ -119,34 +501,62 @@ def lsmr_annihilate(
 
         \hat{\epsilon}_{j} = y_{j} - x^\prime \hat{\beta}
 
-    where :math:`\hat{\beta}` is computed using lsmr.
+    where :math:`\hat{\beta}` is computed using lsmr, or using
+    block_lsmr which advances many columns together using sparse
+    matrix-matrix products.
     """
     if y.shape[1] == 0:
         return empty_like(y)
     use_cache = use_cache and x_hash is not None
     regressor_hash = x_hash if x_hash is not None else ""
+    cache = _VARIABLE_CACHE if cache is None else cache
     default_opts: dict[
         str, bool | float | str | ArrayLike | None | dict[str, Any]
     ] = dict(atol=1e-8, btol=1e-8, show=False)
     assert lsmr_options is not None
     default_opts.update(lsmr_options)
-    resids = []
+    block_compat = set(default_opts).issubset(_BLOCK_LSMR_OPTIONS)
+    if block and not block_compat:
+        unsupported = sorted(set(default_opts).difference(_BLOCK_LSMR_OPTIONS))
+        raise ValueError(
+            "block cannot be used with the lsmr option(s): " + ", ".join(unsupported)
+        )
+    resids: list[Float64Array | None] = []
+    digests = []
     for i in range(y.shape[1]):
-        _y = y[:, i : i + 1]
-
         variable_digest = ""
         if use_cache:
             hasher = hash_func()
-            hasher.update(ascontiguousarray(_y.data))
+            hasher.update(ascontiguousarray(y[:, i : i + 1].data))
             variable_digest = hasher.hexdigest()
-
-        if use_cache and variable_digest in _VARIABLE_CACHE[regressor_hash]:
-            resid = _VARIABLE_CACHE[regressor_hash][variable_digest]
-        else:
-            beta = lsmr(x, _y, **default_opts)[0]
-            resid = y[:, i : i + 1] - (x.dot(sp.csc_matrix(beta[:, None]))).A
-            _VARIABLE_CACHE[regressor_hash][variable_digest] = resid
+        digests.append(variable_digest)
+        resid = cache.get(regressor_hash, variable_digest) if use_cache else None
         resids.append(resid)
+    missing = [i for i, resid in enumerate(resids) if resid is None]
+    if block is None:
+        block = block_compat and len(missing) >= BLOCK_LSMR_MIN_COLUMNS
+    if block and missing:
+        beta = block_lsmr(
+            x,
+            y[:, missing],
+            atol=float(cast(float, default_opts["atol"])),
+            btol=float(cast(float, default_opts["btol"])),
+            conlim=float(cast(float, default_opts.get("conlim", 1e8))),
+            maxiter=cast(Union[int, None], default_opts.get("maxiter", None)),
+            n_jobs=n_jobs,
+        ).x
+        fitted = asarray(x @ beta)
+        for j, i in enumerate(missing):
+            resids[i] = y[:, i : i + 1] - fitted[:, j : j + 1]
+    elif missing:
+        betas = column_lsmr(x, y[:, missing], n_jobs=n_jobs, **default_opts)
+        for j, i in enumerate(missing):
+            beta = betas[:, j]
+            resid = y[:, i : i + 1] - (x.dot(sp.csc_matrix(beta[:, None]))).toarray()
+            resids[i] = resid
+    if use_cache:
+        for i in missing:
+            cache.put(regressor_hash, digests[i], cast(Float64Array, resids[i]))
     return column_stack(resids)
 
 
@@ -706,6 +1116,7 @@ class AbsorbingLS:
         self._num_params = 0
         self._regressors: sp.csc_matrix | None = None
         self._regressors_hash: tuple[tuple[str, ...], ...] | None = None
+        self._absorb_info: tuple[int, float] | None = None
 
     def _drop_missing(self) -> BoolArray:
         missing = require(self.dependent.isnull.to_numpy(), requirements="W")
@@ -838,6 +1249,7 @@ class AbsorbingLS:
         absorb_options: None
         | (dict[str, bool | float | str | ArrayLike | None | dict[str, Any]]),
         method: str,
+        n_jobs: int | None = 1,
     ) -> None:
         weights = (
             cast(Float64Array, self.weights.ndarray) if self._is_weighted else None
@@ -853,6 +1265,14 @@ class AbsorbingLS:
                 "using HDFE. HDFE requires that the model is unweighted and that the "
                 "absorbed regressors include only fixed effects (dummy variables)."
             )
+        use_demean = method in DEMEAN_METHODS
+        if use_demean and (self._absorb_inter.cont.shape[1] or self._interaction_list):
+            raise RuntimeError(
+                f"{method} has been set as the method but the model cannot be "
+                "estimated using iterative demeaning. Iterative demeaning requires "
+                "that the absorbed regressors include only fixed effects (dummy "
+                "variables)."
+            )
         areg = AbsorbingRegressor(
             cat=self._absorb_inter.cat,
             cont=self._absorb_inter.cont,
@@ -881,7 +1301,17 @@ class AbsorbingLS:
         absorb_options = {} if absorb_options is None else absorb_options
         assert isinstance(self._regressors, sp.csc_matrix)
         if self._regressors.shape[1] > 0:
-            if use_hdfe:
+            if use_demean:
+                cats = self._absorb_inter.cat
+                codes = column_stack([asarray(cats[col].cat.codes) for col in cats])
+                raw = column_stack((self._dependent.ndarray, self._exog.ndarray))
+                demeaned = general_group_demean(
+                    raw, codes, weights, method=method, **absorb_options
+                )
+                self._absorb_info = (demeaned.iterations, demeaned.tolerance)
+                dep_resid = demeaned.values[:, :1]
+                exog_resid = demeaned.values[:, 1:]
+            elif use_hdfe:
                 from pyhdfe import create
 
                 absorb_options["drop_singletons"] = False
@@ -898,6 +1328,7 @@ class AbsorbingLS:
                     dep_exog,
                     use_cache,
                     self._regressors_hash,
+                    n_jobs=n_jobs,
                     **absorb_options,
                 )
                 dep_resid = resid[:, :1]
@@ -951,6 +1382,7 @@ class AbsorbingLS:
         | (dict[str, bool | float | str | ArrayLike | None | dict[str, Any]]) = None,
         use_cache: bool = True,
         lsmr_options: dict[str, float | bool] | None = None,
+        n_jobs: int | None = 1,
         **cov_config: Any,
     ) -> AbsorbingLSResults:
         """
@@ -980,11 +1412,23 @@ class AbsorbingLS:
             * "hdfe" - Force HDFE. Raises RuntimeError if the model contains
               continuous variables or continuous-binary interactions to absorb or
               if the model is weighted.
+            * "ap" - Alternating projections using group means.
+            * "irons-tuck" - Alternating projections with Irons-Tuck
+              acceleration.
+            * "cg" - Conjugate gradient using group sums.
+
+            The final three methods support weights and raise RuntimeError if
+            the model contains continuous variables or continuous-binary
+            interactions to absorb.
 
         absorb_options : dict
             Dictionary of options to pass to the absorber. Passed to either
             scipy.sparse.linalg.lsmr or pyhdfe.create depending on the method used
-            to absorb the absorbed regressors.
+            to absorb the absorbed regressors. When using "ap", "irons-tuck" or
+            "cg", the supported options are ``tol`` and ``max_iter``. When
+            using LSMR, ``block`` can be used to force (True) or disable
+            (False) solving for all variables jointly using block LSMR, which
+            is used by default when there are many variables to absorb.
         use_cache : bool
             Flag indicating whether the variables, once purged from the
             absorbed variables and interactions, should be stored in the cache,
@@ -998,6 +1442,10 @@ class AbsorbingLS:
 
                Use absorb_options to pass options
 
+        n_jobs : {int, None}
+            Number of threads used to absorb variables when using LSMR. -1
+            uses all CPUs. The estimates do not depend on the number of
+            threads.
         **cov_config
             Additional parameters to pass to covariance estimator. The list
             of optional parameters differ according to ``cov_type``. See
@@ -1040,7 +1488,7 @@ class AbsorbingLS:
             )
             absorb_options = {k: v for k, v in lsmr_options.items()}
         if self._absorbed_dependent is None:
-            self._first_time_fit(use_cache, absorb_options, method)
+            self._first_time_fit(use_cache, absorb_options, method, n_jobs)
 
         exog_resid = self.absorbed_exog.to_numpy()
         dep_resid = self.absorbed_dependent.to_numpy()
@@ -1196,6 +1644,11 @@ class AbsorbingLS:
             "original_index": self._original_index,
             "absorbed_effects": absorbed_effects,
             "absorbed_r2": r2_absorbed,
+            "absorb_iterations": None,
+            "absorb_tolerance": None,
         }
+        if self._absorb_info is not None:
+            out["absorb_iterations"] = self._absorb_info[0]
+            out["absorb_tolerance"] = self._absorb_info[1]
 
         return out
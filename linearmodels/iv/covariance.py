@@ -4,6 +4,7 @@ Covariance estimation for 2SLS and LIML IV estimators
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any, Callable, Union, cast
 
 from mypy_extensions import VarArg
@@ -13,18 +14,20 @@ from numpy import (
     ceil,
     cos,
     empty,
-    int64,
     ndarray,
     ones,
     pi,
     sin,
     sum as npsum,
-    unique,
     zeros,
 )
 from numpy.linalg import inv, pinv
 
-from linearmodels.shared.covariance import cov_cluster, cov_kernel
+from linearmodels.shared.covariance import (
+    cluster_structures,
+    cov_cluster,
+    cov_kernel,
+)
 from linearmodels.typing import AnyArray, Float64Array, Numeric, OptionalNumeric
 
 KernelWeight = Union[
@@ -267,11 +270,28 @@ class HomoskedasticCovariance:
         self._debiased = debiased
         self.eps = y - x @ params
         self._kappa = kappa
-        self._pinvz = pinv(z)
         nobs, nvar = x.shape
         self._scale: float = nobs / (nobs - nvar) if self._debiased else 1.0
         self._name = "Unadjusted Covariance (Homoskedastic)"
 
+    @cached_property
+    def _pinvz(self) -> Float64Array:
+        """Pseudo-inverse of the instruments"""
+        return pinv(self.z)
+
+    def _share_cache(self, other: HomoskedasticCovariance) -> None:
+        """
+        Reuse quantities already computed by an estimator of the same model
+
+        Parameters
+        ----------
+        other : HomoskedasticCovariance
+            Covariance estimator constructed using the same data and
+            parameters.
+        """
+        if "_pinvz" in other.__dict__:
+            self.__dict__["_pinvz"] = other.__dict__["_pinvz"]
+
     def __str__(self) -> str:
         out = self._name
         out += f"\nDebiased: {self._debiased}"
@@ -611,14 +631,12 @@ class ClusteredCovariance(HomoskedasticCovariance):
         if clusters.shape[0] != nobs:
             raise ValueError(CLUSTER_ERR.format(nobs, clusters.shape[0]))
         self._clusters = clusters
+        structures = cluster_structures(clusters)
         if clusters.ndim == 1:
-            self._num_clusters = [len(unique(clusters))]
+            self._num_clusters = [structures[0].ngroups]
             self._num_clusters_str = str(self._num_clusters[0])
         else:
-            self._num_clusters = [
-                len(unique(clusters[:, 0])),
-                len(unique(clusters[:, 1])),
-            ]
+            self._num_clusters = [structures[0].ngroups, structures[1].ngroups]
             self._num_clusters_str = ", ".join(map(str, self._num_clusters))
         if clusters is not None and clusters.shape[0] != nobs:
             raise ValueError(CLUSTER_ERR.format(nobs, clusters.shape[0]))
@@ -643,22 +661,19 @@ class ClusteredCovariance(HomoskedasticCovariance):
 
         nobs = x.shape[0]
         clusters = self._clusters
+        structures = cluster_structures(clusters)
         if self._clusters.ndim == 1:
-            s = cov_cluster(xhat_e, clusters)
+            s = cov_cluster(xhat_e, structures[0])
             s = rescale(s, self._num_clusters[0], nobs)
         else:
-            s0 = cov_cluster(xhat_e, clusters[:, 0].squeeze())
+            s0 = cov_cluster(xhat_e, structures[0])
             s0 = rescale(s0, self._num_clusters[0], nobs)
 
-            s1 = cov_cluster(xhat_e, clusters[:, 1].squeeze())
+            s1 = cov_cluster(xhat_e, structures[1])
             s1 = rescale(s1, self._num_clusters[1], nobs)
 
-            c0 = clusters[:, 0] - clusters[:, 0].min() + 1
-            c1 = clusters[:, 1] - clusters[:, 1].min() + 1
-            c01 = (c0 * (c1.max() + 1) + c1).astype(int64)
-            s01 = cov_cluster(xhat_e, c01.squeeze())
-            nc = len(unique(c01))
-            s01 = rescale(s01, nc, nobs)
+            s01 = cov_cluster(xhat_e, structures[2])
+            s01 = rescale(s01, structures[2].ngroups, nobs)
 
             s = s0 + s1 - s01
 
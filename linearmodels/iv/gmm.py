@@ -14,7 +14,7 @@ from linearmodels.iv.covariance import (
     HomoskedasticCovariance,
     kernel_optimal_bandwidth,
 )
-from linearmodels.shared.covariance import cov_cluster, cov_kernel
+from linearmodels.shared.covariance import cluster_structures, cov_cluster, cov_kernel
 from linearmodels.typing import AnyArray, Float64Array
 
 
@@ -312,12 +312,12 @@ class OneWayClusteredWeightMatrix(HomoskedasticWeightMatrix):
                 "clusters has the wrong nobs. Expected {}, "
                 "got {}".format(nobs, clusters.shape[0])
             )
-        clusters = asarray(clusters).copy().squeeze()
+        structure = cluster_structures(asarray(clusters).squeeze())[0]
 
-        s = cov_cluster(ze, clusters)
+        s = cov_cluster(ze, structure)
 
         if self._debiased:
-            num_clusters = len(unique(clusters))
+            num_clusters = structure.ngroups
             scale = (nobs - 1) / (nobs - nvar) * num_clusters / (num_clusters - 1)
             s *= scale
 
@@ -3,6 +3,7 @@ Instrumental variable estimators
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, TypeVar, Union, cast
 import warnings
 
@@ -477,6 +478,19 @@ class _IVModelBase:
 
         return out
 
+    def _update_cov(
+        self,
+        cov_estimator: CovarianceEstimator,
+        cov_type: str,
+        debiased: bool,
+        cov_config: Mapping[str, Any],
+    ) -> CovarianceEstimator:
+        raise NotImplementedError(
+            "Changing the covariance estimator is not supported for GMM "
+            "estimators since the weighting matrix affects the parameter "
+            "estimates. Use fit to re-estimate the model."
+        )
+
 
 class _IVLSModelBase(_IVModelBase):
     r"""
@@ -605,6 +619,47 @@ class _IVLSModelBase(_IVModelBase):
         q = vpmzv_sqinv @ (ex1.T @ ex1) @ vpmzv_sqinv
         return min(eigvalsh(q))
 
+    def _update_cov(
+        self,
+        cov_estimator: CovarianceEstimator,
+        cov_type: str,
+        debiased: bool,
+        cov_config: Mapping[str, Any],
+    ) -> CovarianceEstimator:
+        """
+        Construct a covariance estimator reusing the data of a fitted estimator
+
+        Parameters
+        ----------
+        cov_estimator : CovarianceEstimator
+            Covariance estimator used when fitting the model
+        cov_type : str
+            Name of the covariance estimator to construct
+        debiased : bool
+            Flag indicating whether to debias the covariance estimator
+        cov_config : Mapping
+            Additional covariance options
+
+        Returns
+        -------
+        CovarianceEstimator
+            Covariance estimator using the weighted data and parameters of
+            cov_estimator and any quantities already computed by it
+        """
+        estimator = COVARIANCE_ESTIMATORS[cov_type]
+        cov_config = {k: v for k, v in cov_config.items() if k != "center"}
+        new_estimator = estimator(
+            cov_estimator.x,
+            cov_estimator.y,
+            cov_estimator.z,
+            cov_estimator.params,
+            debiased=debiased,
+            kappa=cov_estimator._kappa,
+            **cov_config,
+        )
+        new_estimator._share_cache(cov_estimator)
+        return new_estimator
+
     def fit(
         self, *, cov_type: str = "robust", debiased: bool = False, **cov_config: Any
     ) -> OLSResults | IVResults:
@@ -8,7 +8,7 @@ from linearmodels.compat.statsmodels import Summary
 from collections.abc import Sequence
 import datetime as dt
 from functools import cached_property
-from typing import Any, Union
+from typing import Any, TypeVar, Union
 
 from numpy import (
     array,
@@ -39,6 +39,7 @@ from linearmodels.shared.hypotheses import (
     quadratic_form_test,
 )
 from linearmodels.shared.io import _str, add_star, pval_format
+from linearmodels.shared.utility import copy_without_cache
 from linearmodels.typing import ArrayLike, Float64Array
 
 
@@ -481,6 +482,9 @@ class _LSModelResultsBase(_SummaryStr):
         )
 
 
+_OLSResultsT = TypeVar("_OLSResultsT", bound="OLSResults")
+
+
 class OLSResults(_LSModelResultsBase):
     """
     Results from OLS model estimation
@@ -500,6 +504,66 @@ class OLSResults(_LSModelResultsBase):
     ) -> None:
         super().__init__(results, model)
 
+    def with_cov(
+        self: _OLSResultsT,
+        cov_type: str,
+        *,
+        debiased: bool | None = None,
+        **cov_config: Any,
+    ) -> _OLSResultsT:
+        """
+        Results with a different parameter covariance estimator
+
+        Parameters
+        ----------
+        cov_type : str
+            Name of covariance estimator. See the model's ``fit`` method for
+            the supported estimators.
+        debiased : bool
+            Flag indicating whether to debias the covariance estimator. If
+            not provided, the value used when fitting the model is used.
+        **cov_config
+            Additional covariance-specific options. See the model's ``fit``
+            method for details.
+
+        Returns
+        -------
+        results
+            Results that are identical except for the parameter covariance
+            and the statistics that depend on it.
+
+        Notes
+        -----
+        The new covariance estimator is constructed from the weighted data,
+        instruments and parameters stored by the covariance estimator used
+        in estimation so that the parameters are not re-estimated. The
+        projection onto the instruments is reused when it has already been
+        computed.
+
+        Examples
+        --------
+        >>> res = mod.fit(cov_type="unadjusted")
+        >>> res_robust = res.with_cov("robust")
+        >>> res_kernel = res.with_cov("kernel", kernel="parzen", bandwidth=5)
+        """
+        debiased = self._debiased if debiased is None else bool(debiased)
+        cov_estimator = self.model._update_cov(
+            self._cov_estimator, cov_type, debiased, cov_config
+        )
+        cov = cov_estimator.cov
+        out = copy_without_cache(self)
+        out._cov = DataFrame(cov, columns=self._vars, index=self._vars)
+        out._cov_type = cov_type
+        out._cov_config = cov_estimator.config
+        out._cov_estimator = cov_estimator
+        out._debiased = debiased
+        out._s2 = float(squeeze(cov_estimator.s2))
+        out._f_statistic = self.model._f_statistic(
+            asarray(self._params)[:, None], cov, debiased
+        )
+        out._datetime = dt.datetime.now()
+        return out
+
     def _out_of_sample(
         self,
         exog: ArrayLike | None,
@@ -617,6 +681,8 @@ class AbsorbingLSResults(_LSModelResultsBase):
         super().__init__(results, model)
         self._absorbed_rsquared = results["absorbed_r2"]
         self._absorbed_effects = results["absorbed_effects"]
+        self._absorb_iterations = results["absorb_iterations"]
+        self._absorb_tolerance = results["absorb_tolerance"]
 
     def _top_right(self) -> list[tuple[str, str]]:
         f_stat = _str(self.f_statistic.stat)
@@ -643,6 +709,26 @@ class AbsorbingLSResults(_LSModelResultsBase):
         """Fitted values from only absorbed terms"""
         return self._absorbed_effects()
 
+    @property
+    def absorb_iterations(self) -> int | None:
+        """
+        Number of iterations used to absorb the fixed effects
+
+        None unless the fixed effects were absorbed using one of the
+        iterative demeaning methods ("ap", "irons-tuck" or "cg").
+        """
+        return self._absorb_iterations
+
+    @property
+    def absorb_tolerance(self) -> float | None:
+        """
+        Maximum absolute scaled change in the final absorbing iteration
+
+        None unless the fixed effects were absorbed using one of the
+        iterative demeaning methods ("ap", "irons-tuck" or "cg").
+        """
+        return self._absorb_tolerance
+
     @property
     def df_absorbed(self) -> int:
         """Number of variables absorbed"""
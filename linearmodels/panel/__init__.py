@@ -8,7 +8,7 @@ from linearmodels.panel.model import (
 )
 
 from .results import compare
-from .utility import generate_panel_data
+from .utility import FixedEffectsAbsorber, generate_panel_data
 
 __all__ = [
     "PanelOLS",
@@ -19,4 +19,5 @@ __all__ = [
     "FamaMacBeth",
     "compare",
     "generate_panel_data",
+    "FixedEffectsAbsorber",
 ]
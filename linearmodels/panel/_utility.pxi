@@ -1,4 +1,7 @@
-from linearmodels.typing import IntArray
+from linearmodels.typing import Float64Array, IntArray
 
 
 def _drop_singletons(meta: IntArray, orig_dest: IntArray) -> None: ...
+def _group_sum(
+    values: Float64Array, codes: IntArray, ngroups: int
+) -> Float64Array: ...
@@ -1,6 +1,8 @@
 # cython: boundscheck=False, wraparound=False, language_level=3
 
 
+import numpy as np
+
 cimport numpy as np
 
 ctypedef fused any_int:
@@ -91,3 +93,32 @@ def _drop_singletons(any_int[:, ::1] meta, any_int[:, ::1] orig_dest):
             while next_count == 1:
                 # Follow singleton chains
                 _remove_node(next_node, meta, orig_dest, &next_node, &next_count)
+
+
+def _group_sum(const double[:, ::1] values, const np.int64_t[::1] codes, Py_ssize_t ngroups):
+    """
+    Accumulate the rows of values into the group indicated by codes
+
+    Parameters
+    ----------
+    values : ndarray
+        C-contiguous array of values to sum with shape (nobs, nvar)
+    codes : ndarray
+        Group codes with values in [0, ngroups) (nobs,)
+    ngroups : int
+        Number of groups
+
+    Returns
+    -------
+    ndarray
+        Array of group sums with shape (ngroups, nvar)
+    """
+    cdef Py_ssize_t i, j, g, nobs = values.shape[0], nvar = values.shape[1]
+    out = np.zeros((ngroups, nvar))
+    cdef double[:, ::1] out_view = out
+    with nogil:
+        for i in range(nobs):
+            g = codes[i]
+            for j in range(nvar):
+                out_view[g, j] += values[i, j]
+    return out
@@ -1,20 +1,21 @@
 from __future__ import annotations
 
+import copy
 from functools import cached_property
 from typing import Any, Union
 
 import numpy as np
 from numpy.linalg import inv
-from pandas import DataFrame, MultiIndex
+from pandas import DataFrame
+from scipy.sparse import csc_matrix
 
 from linearmodels.iv.covariance import (
     CLUSTER_ERR,
     KERNEL_LOOKUP,
-    cov_cluster,
     cov_kernel,
     kernel_optimal_bandwidth,
 )
-from linearmodels.shared.covariance import cluster_union, group_debias_coefficient
+from linearmodels.shared.covariance import cov_cluster_multiway
 from linearmodels.shared.typed_getters import (
     get_array_like,
     get_bool,
@@ -123,17 +124,36 @@ class HomoskedasticCovariance:
         eps = self.eps
         return self._scale * float(np.squeeze(eps.T @ eps)) / self._nobs
 
+    @cached_property
+    def xpxi(self) -> Float64Array:
+        """Inverse of the scaled regressor cross-product, (X'X/n)^{-1}"""
+        x = self._x
+        return inv(x.T @ x / self._nobs)
+
     @cached_property
     def cov(self) -> Float64Array:
         """Estimated covariance"""
-        x = self._x
-        out = self.s2 * inv(x.T @ x)
+        out = self.s2 * self.xpxi / self._nobs
         return (out + out.T) / 2
 
     def deferred_cov(self) -> Float64Array:
         """Covariance calculation deferred until executed"""
         return self.cov
 
+    def _share_cache(self, other: HomoskedasticCovariance) -> None:
+        """
+        Reuse quantities already computed by an estimator of the same model
+
+        Parameters
+        ----------
+        other : HomoskedasticCovariance
+            Covariance estimator constructed using the same data and
+            parameters.
+        """
+        for attr in ("xpxi", "time_scores"):
+            if attr in other.__dict__ and hasattr(type(self), attr):
+                self.__dict__[attr] = other.__dict__[attr]
+
 
 class HeteroskedasticCovariance(HomoskedasticCovariance):
     r"""
@@ -203,7 +223,7 @@ class HeteroskedasticCovariance(HomoskedasticCovariance):
         """Estimated covariance"""
         x = self._x
         nobs = x.shape[0]
-        xpxi = inv(x.T @ x / nobs)
+        xpxi = self.xpxi
         eps = self.eps
         xe = x * eps
         xeex = self._scale * xe.T @ xe / nobs
@@ -214,7 +234,7 @@ class HeteroskedasticCovariance(HomoskedasticCovariance):
 
 class ClusteredCovariance(HomoskedasticCovariance):
     r"""
-    One-way (Rogers) or two-way clustered covariance estimation
+    One-way (Rogers), two-way or multi-way clustered covariance estimation
 
     Parameters
     ----------
@@ -235,9 +255,13 @@ class ClusteredCovariance(HomoskedasticCovariance):
         columns in x, e.g., fixed effects.  Covariance estimators are always
         adjusted for extra_df irrespective of the setting of debiased
     clusters : ndarray
-        nobs by 1 or nobs by 2 array of cluster group ids
+        nobs by ncluster array of cluster group ids
     group_debias : bool
         Flag indicating whether to apply small-number of groups adjustment.
+    psd_correction : bool
+        Flag indicating whether to replace any negative eigenvalues of the
+        multi-way score covariance by 0 to ensure that the covariance is
+        positive semi-definite.
 
     Notes
     -----
@@ -253,11 +277,15 @@ class ClusteredCovariance(HomoskedasticCovariance):
 
         \hat{\Sigma}_{xx} = X'X
 
-    and :math:`\hat{S}_{\mathcal{G}}` is a one- or two-way cluster covariance
-    of the scores.  Two-way clustering is implemented by summing up the two
-    one-way cluster covariances and then subtracting the one-way clustering
-    covariance computed using the group formed from the intersection of the
-    two groups.
+    and :math:`\hat{S}_{\mathcal{G}}` is a one- or multi-way cluster
+    covariance of the scores.  Two-way clustering is implemented by summing
+    up the two one-way cluster covariances and then subtracting the one-way
+    clustering covariance computed using the group formed from the
+    intersection of the two groups. Clustering using three or more variables
+    uses the inclusion-exclusion estimator of Cameron, Gelbach and Miller,
+    which adds the one-way covariances computed using intersections of an
+    odd number of variables and subtracts those computed using an even
+    number.
 
     Two small sample adjustment are available.  ``debias=True`` will account
     for regressors in the main model. ``group_debias=True`` will provide a
@@ -270,7 +298,7 @@ class ClusteredCovariance(HomoskedasticCovariance):
     where g is the number of distinct groups and n is the number of
     observations.
     """
-    ALLOWED_KWARGS = ("clusters", "group_debias")
+    ALLOWED_KWARGS = ("clusters", "group_debias", "psd_correction")
 
     def __init__(
         self,
@@ -284,6 +312,7 @@ class ClusteredCovariance(HomoskedasticCovariance):
         extra_df: int = 0,
         clusters: ArrayLike | None = None,
         group_debias: bool = False,
+        psd_correction: bool = False,
     ) -> None:
         super().__init__(
             y, x, params, entity_ids, time_ids, debiased=debiased, extra_df=extra_df
@@ -293,9 +322,9 @@ class ClusteredCovariance(HomoskedasticCovariance):
         clusters = np.asarray(clusters).squeeze()
         assert clusters is not None
         self._group_debias = bool(group_debias)
-        dim1 = 1 if clusters.ndim == 1 else clusters.shape[1]
-        if clusters.ndim > 2 or dim1 > 2:
-            raise ValueError("Only 1 or 2-way clustering supported.")
+        self._psd_correction = bool(psd_correction)
+        if clusters.ndim > 2:
+            raise ValueError("clusters must be a 1 or 2-dimensional array.")
         nobs = y.shape[0]
         if clusters.shape[0] != nobs:
             raise ValueError(CLUSTER_ERR.format(nobs, clusters.shape[0]))
@@ -307,30 +336,16 @@ class ClusteredCovariance(HomoskedasticCovariance):
         """Estimated covariance"""
         x = self._x
         nobs = x.shape[0]
-        xpxi = inv(x.T @ x / nobs)
+        xpxi = self.xpxi
 
         eps = self.eps
         xe = x * eps
-        if self._clusters.ndim == 1:
-            xeex = cov_cluster(xe, self._clusters)
-            if self._group_debias:
-                xeex *= group_debias_coefficient(self._clusters)
-
-        else:
-            clusters0 = self._clusters[:, 0]
-            clusters1 = self._clusters[:, 1]
-            xeex0 = cov_cluster(xe, clusters0)
-            xeex1 = cov_cluster(xe, clusters1)
-
-            clusters01 = cluster_union(self._clusters)
-            xeex01 = cov_cluster(xe, clusters01)
-
-            if self._group_debias:
-                xeex0 *= group_debias_coefficient(clusters0)
-                xeex1 *= group_debias_coefficient(clusters1)
-                xeex01 *= group_debias_coefficient(clusters01)
-
-            xeex = xeex0 + xeex1 - xeex01
+        xeex = cov_cluster_multiway(
+            xe,
+            self._clusters,
+            group_debias=self._group_debias,
+            psd=self._psd_correction,
+        )
 
         xeex *= self._scale
         out = (xpxi @ xeex @ xpxi) / nobs
@@ -423,26 +438,91 @@ class DriscollKraay(HomoskedasticCovariance):
         self._kernel = kernel if kernel is not None else self.DEFAULT_KERNEL
         self._bandwidth = bandwidth
 
+    @cached_property
+    def time_scores(self) -> Float64Array:
+        """
+        Scores summed within each time period
+
+        Returns
+        -------
+        ndarray
+            nperiods by nvar array of the sums of the scores in each time
+            period, ordered by time id.
+
+        Notes
+        -----
+        The time ids are mapped to consecutive integer codes using
+        ``numpy.bincount`` and the scores are aggregated in a single pass
+        using a sparse time indicator matrix weighted by the residuals.
+        Periods without any observations are excluded.
+        """
+        assert self._time_ids is not None
+        time_ids = np.asarray(self._time_ids).reshape(self._nobs)
+        if (
+            time_ids.dtype.kind in "iub"
+            and time_ids.shape[0] > 0
+            and time_ids.min() >= 0
+            and time_ids.max() <= 2 * time_ids.shape[0]
+        ):
+            present = np.bincount(time_ids) > 0
+            codes = (np.cumsum(present) - 1)[time_ids]
+            nperiods = int(present.sum())
+        else:
+            _, codes = np.unique(time_ids, return_inverse=True)
+            codes = np.reshape(codes, -1)
+            nperiods = int(codes.max()) + 1 if codes.shape[0] else 0
+        nobs = codes.shape[0]
+        # Time indicator weighted by the residuals so that the scores
+        # x * eps are never formed
+        weighted_indicator = csc_matrix(
+            (np.reshape(self.eps, nobs), codes, np.arange(nobs + 1)),
+            shape=(nperiods, nobs),
+        )
+        return np.asarray(weighted_indicator @ self._x)
+
+    def reweight(
+        self, *, kernel: str | None = None, bandwidth: float | None = None
+    ) -> DriscollKraay:
+        """
+        Covariance estimator with a different kernel or bandwidth
+
+        Parameters
+        ----------
+        kernel : str
+            Name of one of the supported kernels. If None, uses the
+            Newey-West kernel.
+        bandwidth : int
+            Non-negative integer to use as bandwidth.  If not provided a
+            rule-of-thumb value is used.
+
+        Returns
+        -------
+        DriscollKraay
+            Covariance estimator that reuses the time period scores of this
+            estimator.
+        """
+        out = copy.copy(self)
+        out.__dict__.pop("cov", None)
+        out._kernel = kernel if kernel is not None else self.DEFAULT_KERNEL
+        out._bandwidth = bandwidth
+        out.__dict__["time_scores"] = self.time_scores
+        return out
+
     @cached_property
     def cov(self) -> Float64Array:
         """Estimated covariance"""
         x = self._x
         nobs = x.shape[0]
-        xpxi = inv(x.T @ x / nobs)
-        eps = self.eps
+        xpxi = self.xpxi
 
-        xe = x * eps
-        assert self._time_ids is not None
-        xe_df = DataFrame(xe, index=self._time_ids.squeeze())
-        xe_df = xe_df.groupby(level=0).sum()
-        xe_df.sort_index(inplace=True)
-        xe_nobs = xe_df.shape[0]
+        time_scores = self.time_scores
+        xe_nobs = time_scores.shape[0]
         bw = self._bandwidth
         if self._bandwidth is None:
             bw = float(np.floor(4 * (xe_nobs / 100) ** (2 / 9)))
         assert bw is not None
         w = KERNEL_LOOKUP[self._kernel](bw, xe_nobs - 1)
-        xeex = cov_kernel(np.asarray(xe_df), w) * (xe_nobs / nobs)
+        xeex = cov_kernel(time_scores, w) * (xe_nobs / nobs)
         xeex *= self._scale
 
         out = (xpxi @ xeex @ xpxi) / nobs
@@ -540,21 +620,37 @@ class ACCovariance(HomoskedasticCovariance):
         self._kernel = kernel if kernel is not None else self.DEFAULT_KERNEL
         self._bandwidth = bandwidth
 
-    def _single_cov(self, xe: Float64Array, bw: float) -> Float64Array:
-        nobs = xe.shape[0]
-        w = KERNEL_LOOKUP[self._kernel](bw, nobs - 1)
-        return cov_kernel(xe, w)
+    def _kernel_weights(self, lengths: IntArray, bw: float) -> Float64Array:
+        """
+        Kernel weights for each distinct entity length, scaled by the length
+
+        Row i contains the weights used for entities with lengths[i]
+        observations divided by lengths[i], padded with zeros.
+        """
+        weights = []
+        for length in lengths:
+            _bw = min(length - 1.0, bw)
+            w = np.asarray(KERNEL_LOOKUP[self._kernel](_bw, length - 1), dtype=float)
+            w = w.copy()
+            # Lag 0 always has weight 1
+            w[0] = 1.0
+            weights.append(w / length)
+        max_lags = max(w.shape[0] for w in weights)
+        table = np.zeros((len(weights), max_lags))
+        for i, w in enumerate(weights):
+            table[i, : w.shape[0]] = w
+        return table
 
     @cached_property
     def cov(self) -> Float64Array:
         """Estimated covariance"""
         x = self._x
         nobs = x.shape[0]
-        xpxi = inv(x.T @ x / nobs)
+        xpxi = self.xpxi
         eps = self.eps
         assert self._time_ids is not None
-        time_ids = np.unique(self._time_ids.squeeze())
-        nperiods = len(time_ids)
+        time_ids = np.asarray(self._time_ids).reshape(nobs)
+        nperiods = np.unique(time_ids).shape[0]
         bw = self._bandwidth
         if self._bandwidth is None:
             bw = float(np.floor(4 * (nperiods / 100) ** (2 / 9)))
@@ -562,18 +658,32 @@ class ACCovariance(HomoskedasticCovariance):
 
         xe = x * eps
         assert self._entity_ids is not None
-        index = [self._entity_ids.squeeze(), self._time_ids.squeeze()]
-        xe_df = DataFrame(xe, index=index)
-        xe_df = xe_df.sort_index(level=[0, 1])
-        xe_index = xe_df.index
-        assert isinstance(xe_index, MultiIndex)
-        entities = xe_index.levels[0]
-        nentity = len(entities)
-        xeex = np.zeros((xe_df.shape[1], xe_df.shape[1]))
-        for entity in entities:
-            _xe = np.asarray(xe_df.loc[entity])
-            _bw = min(_xe.shape[0] - 1.0, bw)
-            xeex += self._single_cov(_xe, _bw)
+        entity_ids = np.asarray(self._entity_ids).reshape(nobs)
+        order = np.lexsort((time_ids, entity_ids))
+        if np.any(order[1:] < order[:-1]):
+            xe = xe[order]
+            entity_ids = entity_ids[order]
+        k = xe.shape[1]
+        if nobs == 0:
+            return np.zeros((k, k))
+        starts = np.r_[True, entity_ids[1:] != entity_ids[:-1]]
+        entity_codes = np.cumsum(starts) - 1
+        nentity = int(entity_codes[-1]) + 1
+        entity_lengths = np.bincount(entity_codes)
+        lengths, length_codes = np.unique(entity_lengths, return_inverse=True)
+        table = self._kernel_weights(lengths, bw)
+        # Weight table index of the entity of each observation
+        row_table = np.reshape(length_codes, -1)[entity_codes]
+
+        xeex = (xe * table[row_table, 0][:, None]).T @ xe
+        for j in range(1, table.shape[1]):
+            # Pairs (t, t + j) within the same entity
+            same = entity_codes[j:] == entity_codes[:-j]
+            row_weight = np.where(same, table[row_table[:-j], j], 0.0)
+            if not np.any(row_weight):
+                continue
+            op = (xe[:-j] * row_weight[:, None]).T @ xe[j:]
+            xeex += op + op.T
         xeex /= nentity
         xeex *= self._scale
 
@@ -748,6 +858,7 @@ def setup_covariance_estimator(
     kernel = get_string(cov_config, "kernel")
     bandwidth = get_float(cov_config, "bandwidth")
     group_debias = get_bool(cov_config, "group_debias")
+    psd_correction = get_bool(cov_config, "psd_correction")
     clusters = get_array_like(cov_config, "clusters")
 
     if estimator is HomoskedasticCovariance:
@@ -769,6 +880,7 @@ def setup_covariance_estimator(
             extra_df=extra_df,
             clusters=clusters,
             group_debias=group_debias,
+            psd_correction=psd_correction,
         )
     elif estimator is DriscollKraay:
         return DriscollKraay(
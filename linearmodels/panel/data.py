@@ -18,6 +18,12 @@ from pandas import (
 )
 from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype, is_string_dtype
 
+from linearmodels.panel.utility import (
+    DEMEAN_METHODS,
+    FixedEffectsAbsorber,
+    general_group_demean,
+    group_demean,
+)
 from linearmodels.shared.utility import ensure_unique_column, panel_to_frame
 from linearmodels.typing import (
     AnyArray,
@@ -125,6 +131,19 @@ def expand_categoricals(x: DataFrame, drop_first: bool) -> DataFrame:
     )
 
 
+def _default_var_names(var_name: str, k: int) -> list[Label]:
+    """Variable names used when the input does not contain names"""
+    var_str = var_name + ".{0:0>" + str(int(np.log10(k) + 0.01)) + "}"
+    return [var_name] if k == 1 else [var_str.format(i) for i in range(k)]
+
+
+def _check_time_level(time: Index) -> None:
+    if not (is_numeric_dtype(time.dtype) or is_datetime64_any_dtype(time.dtype)):
+        raise ValueError(
+            "The index on the time dimension must be either " "numeric or date-like"
+        )
+
+
 class PanelData:
     """
     Abstraction to handle alternative formats for panel data
@@ -235,8 +254,7 @@ class PanelData:
                 x = x[None, :, :]
 
             k, t, n = x.shape
-            var_str = var_name + ".{0:0>" + str(int(np.log10(k) + 0.01)) + "}"
-            variables = [var_name] if k == 1 else [var_str.format(i) for i in range(k)]
+            variables = _default_var_names(var_name, k)
             entity_str = "entity.{0:0>" + str(int(np.log10(n) + 0.01)) + "}"
             entities = [entity_str.format(i) for i in range(n)]
             time = list(range(t))
@@ -253,18 +271,199 @@ class PanelData:
             self._frame = expand_categoricals(self._frame, drop_first)
             self._frame = self._frame.astype(np.float64, copy=False)
 
-        time_index = Series(self.index.levels[1])
-        if not (
-            is_numeric_dtype(time_index.dtype)
-            or is_datetime64_any_dtype(time_index.dtype)
-        ):
-            raise ValueError(
-                "The index on the time dimension must be either " "numeric or date-like"
-            )
+        _check_time_level(self.index.levels[1])
         # self._k, self._t, self._n = self.panel.shape
         self._k, self._t, self._n = self.shape
         self._frame.index.set_names(index_names, inplace=True)
 
+    @classmethod
+    def from_codes(
+        cls,
+        values: ArrayLike,
+        entity_codes: ArrayLike,
+        time_codes: ArrayLike,
+        *,
+        var_names: Sequence[Label] | None = None,
+        entities: Sequence[Label] | Index | None = None,
+        time: Sequence[Label] | Index | None = None,
+        var_name: str = "x",
+    ) -> PanelData:
+        """
+        Construct from a 2-d array and integer entity and time codes
+
+        Parameters
+        ----------
+        values : array_like
+            Array with shape (nobs, nvar) containing the variables. A 1-d
+            array is treated as a single variable.
+        entity_codes : array_like
+            Integer array with nobs elements containing the entity of each
+            observation, coded 0, 1, ..., nentity - 1.
+        time_codes : array_like
+            Integer array with nobs elements containing the time period of
+            each observation, coded 0, 1, ..., ntime - 1.
+        var_names : list-like
+            Names of the variables. If not provided, names are constructed
+            from var_name.
+        entities : list-like
+            Entity labels, one for each code. If not provided, the codes are
+            used as labels.
+        time : list-like
+            Time labels, one for each code. Must be numeric or date-like. If
+            not provided, the codes are used as labels.
+        var_name : str
+            Variable name to use when var_names is not provided.
+
+        Returns
+        -------
+        PanelData
+            Panel data using the values without copying
+
+        Notes
+        -----
+        The values are used without copying when they are a float64 array,
+        so changes to the input are reflected in the panel. Other inputs
+        are converted to float64. Categorical variables are not expanded to
+        dummies and the pairs of entity and time codes are assumed to be
+        unique.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from linearmodels.panel.data import PanelData
+        >>> values = np.random.standard_normal((6, 2))
+        >>> entity = np.array([0, 0, 0, 1, 1, 1])
+        >>> time = np.array([0, 1, 2, 0, 1, 2])
+        >>> data = PanelData.from_codes(values, entity, time, var_names=["y", "x"])
+        """
+        arr = np.asarray(values, dtype=np.float64)
+        if arr.ndim == 1:
+            arr = arr[:, None]
+        if arr.ndim != 2:
+            raise ValueError("values must be a 1-d or 2-d array")
+        nobs = arr.shape[0]
+        codes = []
+        for name, value in (("entity_codes", entity_codes), ("time_codes", time_codes)):
+            code = np.asarray(value)
+            if code.shape != (nobs,) or not np.issubdtype(code.dtype, np.integer):
+                raise ValueError(
+                    f"{name} must be a 1-d integer array with one element per row "
+                    "of values"
+                )
+            codes.append(code)
+        return cls._from_codes(
+            arr, codes[0], codes[1], var_names, entities, time, var_name
+        )
+
+    @classmethod
+    def from_array(
+        cls,
+        values: NumericArray,
+        *,
+        var_names: Sequence[Label] | None = None,
+        entities: Sequence[Label] | Index | None = None,
+        time: Sequence[Label] | Index | None = None,
+        var_name: str = "x",
+    ) -> PanelData:
+        """
+        Construct from a 3-d array with shape (nvar, nobs, nentity)
+
+        Parameters
+        ----------
+        values : ndarray
+            Array with shape (nvar, nobs, nentity) where nobs is the number
+            of time periods. A 2-d array is treated as (nobs, nentity).
+        var_names : list-like
+            Names of the variables. If not provided, names are constructed
+            from var_name.
+        entities : list-like
+            Entity labels. If not provided, 0, 1, ..., nentity - 1 are used.
+        time : list-like
+            Time labels. Must be numeric or date-like. If not provided,
+            0, 1, ..., nobs - 1 are used.
+        var_name : str
+            Variable name to use when var_names is not provided.
+
+        Returns
+        -------
+        PanelData
+            Panel data using the values without copying
+
+        Notes
+        -----
+        The values are used without copying when they are a C-contiguous
+        float64 array. The rows of the DataFrame view are then ordered by
+        time period and then by entity. Unlike ``PanelData(values)``, which
+        copies the data and orders the rows by entity, the entity labels
+        default to integers rather than strings.
+        """
+        arr = np.asarray(values, dtype=np.float64)
+        if arr.ndim == 2:
+            arr = arr[None, :, :]
+        if arr.ndim != 3:
+            raise ValueError("values must be a 2-d or 3-d array")
+        k, t, n = arr.shape
+        arr = np.ascontiguousarray(arr)
+        entity_codes = np.tile(np.arange(n), t)
+        time_codes = np.repeat(np.arange(t), n)
+        return cls._from_codes(
+            arr.reshape(k, t * n).T,
+            entity_codes,
+            time_codes,
+            var_names,
+            entities,
+            time,
+            var_name,
+        )
+
+    @classmethod
+    def _from_codes(
+        cls,
+        values: Float64Array,
+        entity_codes: IntArray,
+        time_codes: IntArray,
+        var_names: Sequence[Label] | None,
+        entities: Sequence[Label] | Index | None,
+        time: Sequence[Label] | Index | None,
+        var_name: str,
+    ) -> PanelData:
+        """Construct the panel without the validation and copies in __init__"""
+        levels = []
+        counts = []
+        for code, labels in ((entity_codes, entities), (time_codes, time)):
+            ncode = int(code.max()) + 1 if code.shape[0] else 0
+            level = Index(labels) if labels is not None else pd.RangeIndex(ncode)
+            if code.shape[0] and (code.min() < 0 or ncode > level.shape[0]):
+                raise ValueError("codes must be between 0 and the number of labels - 1")
+            if not level.is_unique:
+                raise ValueError("entity and time labels must be unique")
+            levels.append(level)
+            counts.append(np.count_nonzero(np.bincount(code, minlength=level.shape[0])))
+        _check_time_level(levels[1])
+        k = values.shape[1]
+        if var_names is None:
+            var_names = _default_var_names(var_name, k)
+        elif len(var_names) != k:
+            raise ValueError("var_names must have one element per variable")
+        index = MultiIndex(
+            levels=levels,
+            codes=[entity_codes, time_codes],
+            names=["entity", "time"],
+            verify_integrity=False,
+        )
+        out = cls.__new__(cls)
+        out._var_name = var_name
+        out._convert_dummies = False
+        out._drop_first = True
+        out._panel = None
+        out._frame = DataFrame(
+            values, index=index, columns=Index(var_names), copy=False
+        )
+        out._original = out._frame
+        out._k, out._t, out._n = k, counts[1], counts[0]
+        out._shape = (out._k, out._t, out._n)
+        return out
+
     @property
     def panel(self) -> _Panel:
         """pandas Panel view of data"""
@@ -383,6 +582,53 @@ class PanelData:
         index = self.index
         return np.asarray(index.codes[1])[:, None]
 
+    def _array_demean_values(
+        self, weights: PanelData | None
+    ) -> tuple[Float64Array, Float64Array | None] | None:
+        """
+        Convert data and weights for use in the array-based demeaning engine
+
+        Returns None when the engine cannot be used. The engine requires
+        numeric data without missing values. Data with missing values are
+        demeaned using pandas, which skips missing values when computing
+        group means.
+        """
+        frames = [self._frame]
+        if weights is not None:
+            frames.append(weights.dataframe)
+        arrays = []
+        for frame in frames:
+            if not all(is_numeric_dtype(dt) for dt in frame.dtypes):
+                return None
+            values = np.asarray(frame, dtype=float)
+            if np.isnan(values).any():
+                return None
+            arrays.append(values)
+        w = arrays[1] if weights is not None else None
+        return arrays[0], w
+
+    def _with_values(
+        self, values: Float64Array, columns: Sequence[Label] | None = None
+    ) -> PanelData:
+        """
+        Construct a PanelData sharing the index of this panel
+
+        Skips the validation and copy in __init__ since the index is known to
+        be valid. The columns of this panel are used if columns is None.
+        """
+        out = PanelData.__new__(PanelData)
+        out.__dict__.update(self.__dict__)
+        columns = self._frame.columns if columns is None else columns
+        out._frame = DataFrame(
+            values, index=self._frame.index, columns=columns, copy=False
+        )
+        out._original = out._frame
+        out._panel = None
+        out.__dict__.pop("_fake_panel", None)
+        out._k = out._frame.shape[1]
+        out._shape = (out._k, self._t, self._n)
+        return out
+
     def _demean_both_low_mem(self, weights: PanelData | None) -> PanelData:
         groups = PanelData(
             DataFrame(np.c_[self.entity_ids, self.time_ids], index=self._frame.index),
@@ -422,17 +668,38 @@ class PanelData:
         return PanelData(resid)
 
     def general_demean(
-        self, groups: PanelDataLike, weights: PanelData | None = None
+        self,
+        groups: PanelDataLike | FixedEffectsAbsorber,
+        weights: PanelData | None = None,
+        *,
+        method: str = "ap",
+        tol: float = 1e-8,
+        max_iter: int | None = None,
     ) -> PanelData:
         """
         Multi-way demeaning using only groupby
 
         Parameters
         ----------
-        groups : PanelData
-            Arrays with the same size containing group identifiers
+        groups : {PanelData, FixedEffectsAbsorber}
+            Arrays with the same size containing group identifiers, or a
+            precomputed FixedEffectsAbsorber constructed from the group
+            identifiers and weights
         weights : PanelData
-            Weights to use in the weighted demeaning
+            Weights to use in the weighted demeaning. Must be None when
+            groups is a FixedEffectsAbsorber since the absorber's weights
+            are used.
+        method : {"ap", "irons-tuck", "cg"}
+            Algorithm used when there is more than one group variable.
+            "ap" uses alternating projections, "irons-tuck" accelerates
+            alternating projections using Irons-Tuck extrapolation, and "cg"
+            uses preconditioned conjugate gradient. See
+            :func:`linearmodels.panel.utility.general_group_demean`.
+        tol : float
+            Convergence tolerance for the maximum absolute scaled change
+            between iterations
+        max_iter : int
+            Maximum number of iterations. If None, iterates until convergence.
 
         Returns
         -------
@@ -441,10 +708,63 @@ class PanelData:
 
         Notes
         -----
-        Iterates until convergence
+        Iterates until convergence. Uses array-based group sums when the data
+        and weights are numeric and contain no missing values, and pandas
+        groupby otherwise. Only "ap" is available when data contain missing
+        values.
         """
+        return self._general_demean(
+            groups, weights, method=method, tol=tol, max_iter=max_iter
+        )[0]
+
+    def _general_demean(
+        self,
+        groups: PanelDataLike | FixedEffectsAbsorber,
+        weights: PanelData | None = None,
+        *,
+        method: str = "ap",
+        tol: float = 1e-8,
+        max_iter: int | None = None,
+    ) -> tuple[PanelData, int, float]:
+        """
+        Multi-way demeaning that also returns convergence information
+
+        Returns
+        -------
+        demeaned : PanelData
+            Weighted, demeaned data according to groups
+        iterations : int
+            Number of iterations used
+        tolerance : float
+            Maximum absolute scaled change in the final iteration
+        """
+        if method not in DEMEAN_METHODS:
+            raise ValueError(f"method must be one of {', '.join(DEMEAN_METHODS)}")
+        if isinstance(groups, FixedEffectsAbsorber):
+            arrays = self._array_demean_values(None)
+            if arrays is None:
+                raise ValueError(
+                    "A FixedEffectsAbsorber requires numeric data without missing "
+                    "values."
+                )
+            res = general_group_demean(
+                arrays[0], groups, weights, method=method, tol=tol, max_iter=max_iter
+            )
+            return self._with_values(res.values), res.iterations, res.tolerance
         if not isinstance(groups, PanelData):
             groups = PanelData(groups)
+        arrays = self._array_demean_values(weights)
+        if arrays is not None:
+            values, w = arrays
+            groups_arr = groups.values2d.astype(np.int64, copy=False)
+            res = general_group_demean(
+                values, groups_arr, w, method=method, tol=tol, max_iter=max_iter
+            )
+            return self._with_values(res.values), res.iterations, res.tolerance
+        if method != "ap":
+            raise ValueError(
+                f"method {method} requires data and weights without missing values."
+            )
         if weights is None:
             weights = PanelData(
                 DataFrame(
@@ -496,7 +816,7 @@ class PanelData:
         current: DataFrame = demean_pass(previous, weights_df, root_w)
         if groups.shape[1] == 1:
             current.index = self._frame.index
-            return PanelData(current)
+            return PanelData(current), 1, 0.0
 
         exclude = np.ptp(np.asarray(self._frame), 0) == 0
         max_rmse = np.sqrt(np.asarray(self._frame).var(0).max())
@@ -506,12 +826,19 @@ class PanelData:
         scale[exclude] = replacement[exclude]
         scale = scale[None, :]
 
-        while np.max(np.abs(np.asarray(current) - np.asarray(previous)) / scale) > 1e-8:
+        def max_change() -> float:
+            return np.max(np.abs(np.asarray(current) - np.asarray(previous)) / scale)
+
+        iterations = 1
+        change = max_change()
+        while change > tol and (max_iter is None or iterations < max_iter):
             previous = current
             current = demean_pass(previous, weights_df, root_w)
+            iterations += 1
+            change = max_change()
         current.index = self._frame.index
 
-        return PanelData(current)
+        return PanelData(current), iterations, float(change)
 
     @overload
     def demean(
@@ -585,6 +912,14 @@ class PanelData:
                 return self._demean_both_low_mem(weights)
 
         level = 0 if group == "entity" else 1
+        arrays = self._array_demean_values(weights)
+        if arrays is not None:
+            values, w = arrays
+            codes = self.index.codes[level]
+            out_arr = group_demean(values, codes, w)
+            if not return_panel:
+                return out_arr
+            return self._with_values(out_arr)
         if weights is None:
             group_mu = self._frame.groupby(level=level).transform("mean")
             out = self._frame - group_mu
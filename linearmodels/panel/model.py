@@ -11,7 +11,6 @@ import numpy as np
 from pandas import Categorical, DataFrame, Index, MultiIndex, Series, get_dummies
 from scipy.linalg import lstsq as sp_lstsq
 from scipy.sparse import csc_matrix, diags
-from scipy.sparse.linalg import lsmr
 
 from linearmodels.panel.covariance import (
     ACCovariance,
@@ -31,7 +30,9 @@ from linearmodels.panel.results import (
     RandomEffectsResults,
 )
 from linearmodels.panel.utility import (
+    DEMEAN_METHODS,
     AbsorbingEffectWarning,
+    FixedEffectsAbsorber,
     absorbing_warn_msg,
     check_absorbed,
     dummy_matrix,
@@ -50,7 +51,12 @@ from linearmodels.shared.hypotheses import (
     InvalidTestStatistic,
     WaldTestStatistic,
 )
-from linearmodels.shared.linalg import has_constant
+from linearmodels.shared.linalg import (
+    BLOCK_LSMR_MIN_COLUMNS,
+    block_lsmr,
+    column_lsmr,
+    has_constant,
+)
 from linearmodels.shared.typed_getters import get_panel_data_like
 from linearmodels.shared.utility import AttrDict, ensure_unique_column, panel_to_frame
 from linearmodels.typing import (
@@ -86,7 +92,9 @@ def _lstsq(
         cond = float(max(x.shape) * eps)
     else:
         cond = rcond
-    return sp_lstsq(x, y, cond=cond, lapack_driver="gelsy")
+    params, resid, rank, sv = sp_lstsq(x, y, cond=cond, lapack_driver="gelsy")
+    # The solution is a view into a nobs-length work array, so copy to release it
+    return params.copy(), resid, rank, sv
 
 
 def panel_structure_stats(ids: IntArray, name: str) -> Series:
@@ -709,6 +717,10 @@ class _PanelModelBase:
             loglik=loglik,
             not_null=self._not_null,
             original_index=self._original_index,
+            cov_estimator=cov,
+            fit_options={},
+            keep_data=True,
+            fit_kwargs={},
         )
         return res
 
@@ -769,6 +781,66 @@ class _PanelModelBase:
 
         return cov_config_upd
 
+    def _cov_extra_df(
+        self,
+        cov_type: str,
+        fit_options: Mapping[str, Any],
+        cov_config: dict[str, bool | float | str | IntArray | DataFrame | PanelData],
+    ) -> int:
+        """Extra degrees of freedom consumed, removing extra_df from cov_config"""
+        if "extra_df" not in cov_config:
+            return 0
+        _extra_df = cov_config.pop("extra_df")
+        assert isinstance(_extra_df, (str, int))
+        return int(_extra_df)
+
+    def _update_cov(
+        self,
+        cov: CovarianceEstimator,
+        cov_type: str,
+        debiased: bool,
+        fit_options: Mapping[str, Any],
+        cov_config: Mapping[str, bool | float | str | IntArray | DataFrame | PanelData],
+    ) -> CovarianceEstimator:
+        """
+        Construct a covariance estimator reusing the data of a fitted estimator
+
+        Parameters
+        ----------
+        cov : CovarianceEstimator
+            Covariance estimator used when fitting the model
+        cov_type : str
+            Name of the covariance estimator to construct
+        debiased : bool
+            Flag indicating whether to debias the covariance estimator
+        fit_options : Mapping
+            Options used when fitting the model that affect the covariance
+        cov_config : Mapping
+            Additional covariance options
+
+        Returns
+        -------
+        CovarianceEstimator
+            Covariance estimator using the transformed data, residuals and
+            any quantities already computed by cov.
+        """
+        cov_config = self._setup_clusters(cov_config)
+        extra_df = self._cov_extra_df(cov_type, fit_options, cov_config)
+        new_cov = setup_covariance_estimator(
+            self._cov_estimators,
+            cov_type,
+            cov._y,
+            cov._x,
+            cov._params,
+            cov._entity_ids,
+            cov._time_ids,
+            debiased=debiased,
+            extra_df=extra_df,
+            **cov_config,
+        )
+        new_cov._share_cache(cov)
+        return new_cov
+
     def predict(
         self,
         params: ArrayLike,
@@ -942,6 +1014,7 @@ class PooledOLS(_PanelModelBase):
         *,
         cov_type: str = "unadjusted",
         debiased: bool = True,
+        keep_data: bool = True,
         **cov_config: bool | float | str | IntArray | DataFrame | PanelData,
     ) -> PanelResults:
         """
@@ -954,6 +1027,11 @@ class PooledOLS(_PanelModelBase):
         debiased : bool
             Flag indicating whether to debiased the covariance estimator using
             a degree of freedom adjustment.
+        keep_data : bool
+            Flag indicating whether to store residuals, fitted values and
+            estimated effects on the results. If False, only parameters, their
+            covariance and summary statistics are retained and the residual-type
+            values are recomputed from the model when accessed.
         **cov_config
             Additional covariance-specific options.  See Notes.
 
@@ -975,11 +1053,14 @@ class PooledOLS(_PanelModelBase):
         * "unadjusted", "homoskedastic" - Assume residual are homoskedastic
         * "robust", "heteroskedastic" - Control for heteroskedasticity using
           White's estimator
-        * "clustered` - One- or two-way clustering.  Configuration options are:
+        * "clustered` - One-, two- or multi-way clustering.  Configuration
+          options are:
 
-          * ``clusters`` - Input containing 1 or 2 variables.
+          * ``clusters`` - Input containing one or more variables.
             Clusters should be integer values, although other types will
             be coerced to integer values by treating as categorical variables
+          * ``psd_correction`` - Boolean flag indicating whether to ensure that
+            multi-way cluster covariances are positive semi-definite
           * ``cluster_entity`` - Boolean flag indicating to use entity
             clusters
           * ``cluster_time`` - Boolean indicating to use time clusters
@@ -1056,6 +1137,7 @@ class PooledOLS(_PanelModelBase):
                 fitted=fitted,
                 effects=effects,
                 idiosyncratic=idiosyncratic,
+                keep_data=keep_data,
             )
         )
 
@@ -1163,6 +1245,11 @@ class PanelOLS(_PanelModelBase):
         check can reduce the time required to validate a model specification.
         Results may be numerically unstable if this check is skipped and
         the matrix is not full rank.
+    absorber : FixedEffectsAbsorber
+        Precomputed fixed effects structure, usually taken from the
+        ``absorber`` property of a model with the same effects, weights and
+        sample. When provided, the absorber is used to remove the effects
+        and to drop singletons, so that only the new columns are demeaned.
 
     Notes
     -----
@@ -1210,6 +1297,7 @@ class PanelOLS(_PanelModelBase):
         singletons: bool = True,
         drop_absorbed: bool = False,
         check_rank: bool = True,
+        absorber: FixedEffectsAbsorber | None = None,
     ) -> None:
         super().__init__(dependent, exog, weights=weights, check_rank=check_rank)
 
@@ -1221,7 +1309,15 @@ class PanelOLS(_PanelModelBase):
         self._has_effect = entity_effects or time_effects or self.other_effects
         self._drop_absorbed = drop_absorbed
         self._singleton_index = None
+        self._demean_method = "ap"
+        self._demean_options: dict[str, float | int | None] = {}
+        self._demean_info: tuple[int, float] | None = None
+        self._absorber = absorber
+        self._model_absorber: FixedEffectsAbsorber | None = None
+        self._pre_singleton_index: Index | None = None
+        self._singleton_retain: BoolArray | None = None
         self._drop_singletons()
+        self._validate_absorber()
 
     def _collect_effects(self) -> NumericArray:
         if not self._has_effect:
@@ -1241,8 +1337,18 @@ class PanelOLS(_PanelModelBase):
     def _drop_singletons(self) -> None:
         if self._singletons or not self._has_effect:
             return
-        effects = self._collect_effects()
-        retain = in_2core_graph(effects)
+        absorber = self._absorber
+        if (
+            absorber is not None
+            and absorber._singleton_drop is not None
+            and absorber._pre_singleton_index is not None
+            and absorber._pre_singleton_index.equals(self.dependent.index)
+        ):
+            retain = ~absorber._singleton_drop
+        else:
+            retain = in_2core_graph(self._collect_effects())
+        self._pre_singleton_index = self.dependent.index
+        self._singleton_retain = retain
 
         if np.all(retain):
             return
@@ -1267,6 +1373,80 @@ class PanelOLS(_PanelModelBase):
         # Reverify exog matrix
         self._check_exog_rank()
 
+    def _validate_absorber(self) -> None:
+        """Check that a user-provided absorber matches the model"""
+        absorber = self._absorber
+        if absorber is None:
+            return
+        if not self._has_effect:
+            raise ValueError("absorber can only be used with models that have effects.")
+        neffects = int(self.entity_effects) + int(self.time_effects)
+        if self.other_effects:
+            assert self._other_effect_cats is not None
+            neffects += self._other_effect_cats.dataframe.shape[1]
+        nobs = self.dependent.dataframe.shape[0]
+        if len(absorber.ngroups) != neffects or absorber.nobs != nobs:
+            raise ValueError(
+                "absorber does not match the model's effects or sample. The "
+                "absorber must be constructed from the same effects and "
+                "observations."
+            )
+        if absorber.index is not None and not absorber.index.equals(
+            self.dependent.index
+        ):
+            raise ValueError(
+                "absorber was constructed for a different sample than the sample "
+                "used in the model."
+            )
+        w = self.weights.values2d
+        weighted = bool(np.any(w != 1.0))
+        absorber_w = absorber.weights
+        if weighted != (absorber_w is not None) or (
+            absorber_w is not None and not np.allclose(absorber_w, w)
+        ):
+            raise ValueError("absorber and model weights must be identical.")
+
+    @property
+    def absorber(self) -> FixedEffectsAbsorber:
+        """
+        Precomputed fixed effects structure for the model's effects and sample
+
+        Returns
+        -------
+        FixedEffectsAbsorber
+            Absorber containing the group codes and group weight sums of the
+            model's effects. If singletons were removed, the absorber also
+            records the observations dropped so that other models using the
+            absorber do not repeat the search for singletons.
+
+        Notes
+        -----
+        Pass the absorber to other models with the same effects, weights and
+        sample, but different regressors, to avoid recomputing the effect
+        structure.
+
+        Examples
+        --------
+        >>> from linearmodels import PanelOLS
+        >>> mod = PanelOLS(y, x1, entity_effects=True, time_effects=True)
+        >>> absorber = mod.absorber
+        >>> mod2 = PanelOLS(y, x2, entity_effects=True, time_effects=True,
+        ...                 absorber=absorber)
+        """
+        if self._absorber is not None:
+            return self._absorber
+        if self._model_absorber is None:
+            w = self.weights.values2d
+            weights = w if np.any(w != 1.0) else None
+            absorber = FixedEffectsAbsorber(
+                self._collect_effects(), weights, index=self.dependent.index
+            )
+            if self._singleton_retain is not None:
+                absorber._pre_singleton_index = self._pre_singleton_index
+                absorber._singleton_drop = ~self._singleton_retain
+            self._model_absorber = absorber
+        return self._model_absorber
+
     def __str__(self) -> str:
         out = super().__str__()
         additional = (
@@ -1364,6 +1544,7 @@ class PanelOLS(_PanelModelBase):
         singletons: bool = True,
         drop_absorbed: bool = False,
         check_rank: bool = True,
+        absorber: FixedEffectsAbsorber | None = None,
     ) -> PanelOLS:
         """
         Create a model from a formula
@@ -1397,6 +1578,8 @@ class PanelOLS(_PanelModelBase):
             check can reduce the time required to validate a model
             specification. Results may be numerically unstable if this check
             is skipped and the matrix is not full rank.
+        absorber : FixedEffectsAbsorber
+            Precomputed fixed effects structure. See :class:`PanelOLS`.
 
         Returns
         -------
@@ -1425,12 +1608,13 @@ class PanelOLS(_PanelModelBase):
             singletons=singletons,
             drop_absorbed=drop_absorbed,
             check_rank=check_rank,
+            absorber=absorber,
         )
         mod.formula = formula
         return mod
 
     def _lsmr_path(
-        self,
+        self, n_jobs: int | None = 1
     ) -> tuple[Float64Array, Float64Array, Float64Array, Float64Array, Float64Array]:
         """Sparse implementation, works for all scenarios"""
         y = cast(Float64Array, self.dependent.values2d)
@@ -1463,23 +1647,22 @@ class PanelOLS(_PanelModelBase):
         if self._is_weighted:
             wd = wd.multiply(root_w_sparse)
 
-        wx_mean_l = []
-        for i in range(x.shape[1]):
-            cond_mean = lsmr(wd, wx[:, i], atol=1e-8, btol=1e-8)[0]
-            cond_mean /= cond
-            wx_mean_l.append(cond_mean)
-        wx_mean = np.column_stack(wx_mean_l)
-        wy_mean = lsmr(wd, wy, atol=1e-8, btol=1e-8)[0]
-        wy_mean /= cond
-        wy_mean = wy_mean[:, None]
+        wyx = np.column_stack((wy, wx))
+        if wyx.shape[1] >= BLOCK_LSMR_MIN_COLUMNS:
+            wyx_mean = block_lsmr(wd, wyx, atol=1e-8, btol=1e-8, n_jobs=n_jobs).x
+        else:
+            wyx_mean = column_lsmr(wd, wyx, atol=1e-8, btol=1e-8, n_jobs=n_jobs)
+        wyx_mean /= cond[:, None]
+        wy_mean = wyx_mean[:, :1]
+        wx_mean = wyx_mean[:, 1:]
 
         wx_mean = csc_matrix(wx_mean)
         wy_mean = csc_matrix(wy_mean)
 
         # Purge fitted, weighted values
         sp_cond = diags(cond, format="csc")
-        wx = wx - (wd @ sp_cond @ wx_mean).A
-        wy = wy - (wd @ sp_cond @ wy_mean).A
+        wx = wx - (wd @ sp_cond @ wx_mean).toarray()
+        wy = wy - (wd @ sp_cond @ wy_mean).toarray()
 
         if self.has_constant:
             wy += wy_gm
@@ -1566,23 +1749,14 @@ class PanelOLS(_PanelModelBase):
             )
         return low_memory
 
-    def _fast_path(
-        self, low_memory: bool
-    ) -> tuple[Float64Array, Float64Array, Float64Array]:
-        """Dummy-variable free estimation without weights"""
-        _y = self.dependent.values2d
-        _x = self.exog.values2d
-        ybar = np.asarray(_y.mean(0))
-
-        if not self._has_effect:
-            return _y, _x, ybar
-
-        y_gm = ybar
-        x_gm = _x.mean(0)
-
-        y = self.dependent
-        x = self.exog
+    def _iterative_demean_groups(self, low_memory: bool) -> PanelData | None:
+        """
+        Group variables to remove using iterative demeaning
 
+        Returns None when the effects are removed without iterating, either
+        because there is a single effect or because two-way effects are
+        removed using dummy variables.
+        """
         if self.other_effects:
             assert self._other_effect_cats is not None
             groups = self._other_effect_cats
@@ -1594,20 +1768,67 @@ class PanelOLS(_PanelModelBase):
                     effect = self.dependent.time_ids
                 col = ensure_unique_column("additional.effect", groups.dataframe)
                 groups.dataframe[col] = effect
-            y = cast(PanelData, y.general_demean(groups))
-            x = cast(PanelData, x.general_demean(groups))
+            return groups
+        if self.entity_effects and self.time_effects and low_memory:
+            return PanelData(
+                DataFrame(
+                    np.c_[self.dependent.entity_ids, self.dependent.time_ids],
+                    index=self.dependent.index,
+                ),
+                convert_dummies=False,
+                copy=False,
+            )
+        return None
+
+    def _joint_demean(
+        self, low_memory: bool, weights: PanelData | None = None
+    ) -> tuple[Float64Array, Float64Array]:
+        """
+        Remove the effects from the dependent and exog in a single pass
+
+        The dependent and exog are stacked so that group codes, group weight
+        sums and the convergence check are shared across all columns. If the
+        model was constructed with an absorber, the absorber is used.
+        """
+        y = self.dependent
+        yx = np.column_stack([y.values2d, self.exog.values2d])
+        if self._absorber is not None:
+            res = self._absorber.demean(
+                yx, method=self._demean_method, **self._demean_options
+            )
+            self._demean_info = (res.iterations, res.tolerance)
+            return res.values[:, :1], res.values[:, 1:]
+        joint = y._with_values(yx, columns=list(range(yx.shape[1])))
+        groups = self._iterative_demean_groups(low_memory)
+        if groups is not None:
+            demeaned, iterations, tol = joint._general_demean(
+                groups, weights, method=self._demean_method, **self._demean_options
+            )
+            self._demean_info = (iterations, tol)
         elif self.entity_effects and self.time_effects:
-            y = cast(PanelData, y.demean("both", low_memory=low_memory))
-            x = cast(PanelData, x.demean("both", low_memory=low_memory))
+            demeaned = joint.demean("both", weights=weights, low_memory=low_memory)
         elif self.entity_effects:
-            y = cast(PanelData, y.demean("entity"))
-            x = cast(PanelData, x.demean("entity"))
+            demeaned = joint.demean("entity", weights=weights)
         else:  # self.time_effects
-            y = cast(PanelData, y.demean("time"))
-            x = cast(PanelData, x.demean("time"))
+            demeaned = joint.demean("time", weights=weights)
+        values = demeaned.values2d
+        return values[:, :1], values[:, 1:]
 
-        y_arr = y.values2d
-        x_arr = x.values2d
+    def _fast_path(
+        self, low_memory: bool
+    ) -> tuple[Float64Array, Float64Array, Float64Array]:
+        """Dummy-variable free estimation without weights"""
+        _y = self.dependent.values2d
+        _x = self.exog.values2d
+        ybar = np.asarray(_y.mean(0))
+
+        if not self._has_effect:
+            return _y, _x, ybar
+
+        y_gm = ybar
+        x_gm = _x.mean(0)
+
+        y_arr, x_arr = self._joint_demean(low_memory)
 
         if self.has_constant:
             y_arr = y_arr + y_gm
@@ -1638,36 +1859,7 @@ class PanelOLS(_PanelModelBase):
 
         y = self.dependent
         x = self.exog
-
-        if self.other_effects:
-            assert self._other_effect_cats is not None
-            groups = self._other_effect_cats
-            if self.entity_effects or self.time_effects:
-                groups = groups.copy()
-                if self.entity_effects:
-                    effect = self.dependent.entity_ids
-                else:
-                    effect = self.dependent.time_ids
-                col = ensure_unique_column("additional.effect", groups.dataframe)
-                groups.dataframe[col] = effect
-            wy = y.general_demean(groups, weights=self.weights)
-            wx = x.general_demean(groups, weights=self.weights)
-        elif self.entity_effects and self.time_effects:
-            wy = cast(
-                PanelData, y.demean("both", weights=self.weights, low_memory=low_memory)
-            )
-            wx = cast(
-                PanelData, x.demean("both", weights=self.weights, low_memory=low_memory)
-            )
-        elif self.entity_effects:
-            wy = cast(PanelData, y.demean("entity", weights=self.weights))
-            wx = cast(PanelData, x.demean("entity", weights=self.weights))
-        else:  # self.time_effects
-            wy = cast(PanelData, y.demean("time", weights=self.weights))
-            wx = cast(PanelData, x.demean("time", weights=self.weights))
-
-        wy_arr = wy.values2d
-        wx_arr = wx.values2d
+        wy_arr, wx_arr = self._joint_demean(low_memory, weights=self.weights)
 
         if self.has_constant:
             wy_arr += wy_gm
@@ -1712,6 +1904,17 @@ class PanelOLS(_PanelModelBase):
                 is_nested[i] = len(np.unique(ec)) == e_count
         return bool(np.all(is_nested))
 
+    def _cov_extra_df(
+        self,
+        cov_type: str,
+        fit_options: Mapping[str, Any],
+        cov_config: dict[str, bool | float | str | IntArray | DataFrame | PanelData],
+    ) -> int:
+        count_effects = bool(fit_options["count_effects"])
+        if fit_options["auto_df"]:
+            count_effects = self._determine_df_adjustment(cov_type, **cov_config)
+        return int(fit_options["neffects"]) if count_effects else 0
+
     def _determine_df_adjustment(
         self,
         cov_type: str,
@@ -1743,6 +1946,10 @@ class PanelOLS(_PanelModelBase):
         debiased: bool = True,
         auto_df: bool = True,
         count_effects: bool = True,
+        demean_method: str = "ap",
+        demean_options: dict[str, float | int | None] | None = None,
+        n_jobs: int | None = 1,
+        keep_data: bool = True,
         **cov_config: bool | float | str | IntArray | DataFrame | PanelData,
     ) -> PanelEffectsResults:
         """
@@ -1778,6 +1985,26 @@ class PanelOLS(_PanelModelBase):
             Flag indicating that the covariance estimator should be adjusted
             to account for the estimation of effects in the model. Only used
             if ``auto_df=False``.
+        demean_method : {"ap", "irons-tuck", "cg"}
+            Algorithm used when effects are removed by iterative demeaning,
+            which occurs when the model includes other effects or when
+            two-way effects are estimated using the low-memory algorithm.
+            "ap" uses alternating projections, "irons-tuck" uses alternating
+            projections with Irons-Tuck acceleration, and "cg" uses
+            preconditioned conjugate gradient.
+        demean_options : dict
+            Options passed to the iterative demeaning algorithm. Supported
+            keys are ``tol`` (default 1e-8), the convergence tolerance, and
+            ``max_iter`` (default None), the maximum number of iterations.
+        n_jobs : {int, None}
+            Number of threads used to remove the effects from the variables
+            when ``use_lsmr`` is True. -1 uses all CPUs. The estimates do not
+            depend on the number of threads.
+        keep_data : bool
+            Flag indicating whether to store residuals, fitted values and
+            estimated effects on the results. If False, only parameters, their
+            covariance and summary statistics are retained and the residual-type
+            values are recomputed from the model when accessed.
         **cov_config
             Additional covariance-specific options.  See Notes.
 
@@ -1799,11 +2026,14 @@ class PanelOLS(_PanelModelBase):
         * "unadjusted", "homoskedastic" - Assume residual are homoskedastic
         * "robust", "heteroskedastic" - Control for heteroskedasticity using
           White's estimator
-        * "clustered` - One- or two-way clustering.  Configuration options are:
+        * "clustered` - One-, two- or multi-way clustering.  Configuration
+          options are:
 
-          * ``clusters`` - Input containing 1 or 2 variables.
+          * ``clusters`` - Input containing one or more variables.
             Clusters should be integer valued, although other types will
             be coerced to integer values by treating as categorical variables
+          * ``psd_correction`` - Boolean flag indicating whether to ensure that
+            multi-way cluster covariances are positive semi-definite
           * ``cluster_entity`` - Boolean flag indicating to use entity
             clusters
           * ``cluster_time`` - Boolean indicating to use time clusters
@@ -1818,9 +2048,16 @@ class PanelOLS(_PanelModelBase):
         """
 
         weighted = np.any(self.weights.values2d != 1.0)
+        if demean_method not in DEMEAN_METHODS:
+            raise ValueError(
+                f"demean_method must be one of {', '.join(DEMEAN_METHODS)}"
+            )
+        self._demean_method = demean_method
+        self._demean_options = {} if demean_options is None else dict(demean_options)
+        self._demean_info = None
 
         if use_lsmr:
-            y, x, ybar, y_effects, x_effects = self._lsmr_path()
+            y, x, ybar, y_effects, x_effects = self._lsmr_path(n_jobs)
         elif use_lsdv:
             y, x, ybar, y_effects, x_effects = self._slow_path()
         else:
@@ -1889,6 +2126,9 @@ class PanelOLS(_PanelModelBase):
         nobs = self.dependent.dataframe.shape[0]
         df_model = x.shape[1] + neffects
         df_resid = nobs - df_model
+        fit_options = dict(
+            neffects=neffects, auto_df=auto_df, count_effects=count_effects
+        )
         # Check clusters if singletons were removed
         cov_config = self._setup_clusters(cov_config)
         if auto_df:
@@ -2008,8 +2248,27 @@ class PanelOLS(_PanelModelBase):
                 effects=effects,
                 fitted=fitted,
                 idiosyncratic=idiosyncratic,
+                demean_iterations=None,
+                demean_tolerance=None,
+                fit_options=fit_options,
+                keep_data=keep_data,
+                fit_kwargs=dict(
+                    use_lsdv=use_lsdv,
+                    use_lsmr=use_lsmr,
+                    low_memory=low_memory,
+                    auto_df=auto_df,
+                    count_effects=count_effects,
+                    demean_method=demean_method,
+                    demean_options=demean_options,
+                    n_jobs=n_jobs,
+                ),
             )
         )
+        if self._demean_info is not None:
+            res.update(
+                demean_iterations=self._demean_info[0],
+                demean_tolerance=self._demean_info[1],
+            )
 
         return PanelEffectsResults(res)
 
@@ -2093,6 +2352,7 @@ class BetweenOLS(_PanelModelBase):
         reweight: bool = False,
         cov_type: str = "unadjusted",
         debiased: bool = True,
+        keep_data: bool = True,
         **cov_config: bool | float | str | IntArray | DataFrame | PanelData,
     ) -> PanelResults:
         """
@@ -2109,6 +2369,11 @@ class BetweenOLS(_PanelModelBase):
         debiased : bool
             Flag indicating whether to debiased the covariance estimator using
             a degree of freedom adjustment.
+        keep_data : bool
+            Flag indicating whether to store residuals, fitted values and
+            estimated effects on the results. If False, only parameters, their
+            covariance and summary statistics are retained and the residual-type
+            values are recomputed from the model when accessed.
         **cov_config
             Additional covariance-specific options.  See Notes.
 
@@ -2130,11 +2395,14 @@ class BetweenOLS(_PanelModelBase):
         * "unadjusted", "homoskedastic" - Assume residual are homoskedastic
         * "robust", "heteroskedastic" - Control for heteroskedasticity using
           White's estimator
-        * "clustered` - One- or two-way clustering.  Configuration options are:
+        * "clustered` - One-, two- or multi-way clustering.  Configuration
+          options are:
 
-          * ``clusters`` - Input containing 1 or 2 variables.
+          * ``clusters`` - Input containing one or more variables.
             Clusters should be integer values, although other types will
             be coerced to integer values by treating as categorical variables
+          * ``psd_correction`` - Boolean flag indicating whether to ensure that
+            multi-way cluster covariances are positive semi-definite
 
         When using a clustered covariance estimator, all cluster ids must be
         identical within an entity.
@@ -2214,6 +2482,8 @@ class BetweenOLS(_PanelModelBase):
                 fitted=fitted,
                 effects=effects,
                 idiosyncratic=idiosyncratic,
+                keep_data=keep_data,
+                fit_kwargs=dict(reweight=reweight),
             )
         )
 
@@ -2374,6 +2644,7 @@ class FirstDifferenceOLS(_PanelModelBase):
         *,
         cov_type: str = "unadjusted",
         debiased: bool = True,
+        keep_data: bool = True,
         **cov_config: bool | float | str | IntArray | DataFrame | PanelData,
     ) -> PanelResults:
         """
@@ -2386,6 +2657,11 @@ class FirstDifferenceOLS(_PanelModelBase):
         debiased : bool
             Flag indicating whether to debiased the covariance estimator using
             a degree of freedom adjustment.
+        keep_data : bool
+            Flag indicating whether to store residuals, fitted values and
+            estimated effects on the results. If False, only parameters, their
+            covariance and summary statistics are retained and the residual-type
+            values are recomputed from the model when accessed.
         **cov_config
             Additional covariance-specific options.  See Notes.
 
@@ -2410,9 +2686,11 @@ class FirstDifferenceOLS(_PanelModelBase):
           White's estimator
         * "clustered` - White's.  Configuration options are:
 
-          * ``clusters`` - Input containing 1 or 2 variables.
+          * ``clusters`` - Input containing one or more variables.
             Clusters should be integer values, although other types will
             be coerced to integer values by treating as categorical variables
+          * ``psd_correction`` - Boolean flag indicating whether to ensure that
+            multi-way cluster covariances are positive semi-definite
           * ``cluster_entity`` - Boolean flag indicating to use entity
             clusters
 
@@ -2516,6 +2794,7 @@ class FirstDifferenceOLS(_PanelModelBase):
                 fitted=fitted,
                 effects=effects,
                 idiosyncratic=idiosyncratic,
+                keep_data=keep_data,
             )
         )
 
@@ -2677,6 +2956,7 @@ class RandomEffects(_PanelModelBase):
         small_sample: bool = False,
         cov_type: str = "unadjusted",
         debiased: bool = True,
+        keep_data: bool = True,
         **cov_config: bool | float | str | IntArray | DataFrame | PanelData,
     ) -> RandomEffectsResults:
         """
@@ -2692,6 +2972,11 @@ class RandomEffects(_PanelModelBase):
         debiased : bool
             Flag indicating whether to debiased the covariance estimator using
             a degree of freedom adjustment.
+        keep_data : bool
+            Flag indicating whether to store residuals, fitted values and
+            estimated effects on the results. If False, only parameters, their
+            covariance and summary statistics are retained and the residual-type
+            values are recomputed from the model when accessed.
         **cov_config
             Additional covariance-specific options.  See Notes.
 
@@ -2713,11 +2998,14 @@ class RandomEffects(_PanelModelBase):
         * "unadjusted", "homoskedastic" - Assume residual are homoskedastic
         * "robust", "heteroskedastic" - Control for heteroskedasticity using
           White's estimator
-        * "clustered` - One- or two-way clustering.  Configuration options are:
+        * "clustered` - One-, two- or multi-way clustering.  Configuration
+          options are:
 
-          * ``clusters`` - Input containing 1 or 2 variables.
+          * ``clusters`` - Input containing one or more variables.
             Clusters should be integer values, although other types will
             be coerced to integer values by treating as categorical variables
+          * ``psd_correction`` - Boolean flag indicating whether to ensure that
+            multi-way cluster covariances are positive semi-definite
           * ``cluster_entity`` - Boolean flag indicating to use entity
             clusters
           * ``cluster_time`` - Boolean indicating to use time clusters
@@ -2845,6 +3133,8 @@ class RandomEffects(_PanelModelBase):
                 fitted=fitted,
                 effects=effects,
                 idiosyncratic=idiosyncratic,
+                keep_data=keep_data,
+                fit_kwargs=dict(small_sample=small_sample),
             )
         )
 
@@ -2951,12 +3241,54 @@ class FamaMacBeth(_PanelModelBase):
                 stacklevel=3,
             )
 
+    def _update_cov(
+        self,
+        cov: CovarianceEstimator,
+        cov_type: str,
+        debiased: bool,
+        fit_options: Mapping[str, Any],
+        cov_config: Mapping[str, bool | float | str | IntArray | DataFrame | PanelData],
+    ) -> CovarianceEstimator:
+        if cov_type not in (
+            "robust",
+            "unadjusted",
+            "homoskedastic",
+            "heteroskedastic",
+            "kernel",
+        ):
+            raise ValueError("Unknown cov_type")
+        unknown = set(cov_config).difference(("bandwidth", "kernel"))
+        if unknown:
+            raise ValueError(
+                "FamaMacBeth only supports the covariance options bandwidth and "
+                f"kernel. Unknown options: {', '.join(sorted(unknown))}"
+            )
+        assert isinstance(cov, FamaMacBethCovariance)
+        bandwidth = cov_config.get("bandwidth", None)
+        if cov_type != "kernel":
+            bandwidth = 0.0
+        elif bandwidth is not None:
+            assert isinstance(bandwidth, (int, float))
+            bandwidth = float(bandwidth)
+        kernel = cov_config.get("kernel", None)
+        return FamaMacBethCovariance(
+            cov._y,
+            cov._x,
+            cov._params,
+            cov.all_params,
+            debiased=debiased,
+            kernel=None if kernel is None else str(kernel),
+            bandwidth=bandwidth,
+        )
+
     def fit(
         self,
         cov_type: str = "unadjusted",
         debiased: bool = True,
         bandwidth: float | None = None,
         kernel: str | None = None,
+        *,
+        keep_data: bool = True,
     ) -> FamaMacBethResults:
         """
         Estimate model parameters
@@ -2973,6 +3305,11 @@ class FamaMacBeth(_PanelModelBase):
             automatically computed.
         kernel : str
             The kernel to use.  None chooses the default kernel.
+        keep_data : bool
+            Flag indicating whether to store residuals, fitted values and
+            estimated effects on the results. If False, only parameters, their
+            covariance and summary statistics are retained and the residual-type
+            values are recomputed from the model when accessed.
 
         Returns
         -------
@@ -3113,6 +3450,7 @@ class FamaMacBeth(_PanelModelBase):
                 all_params=all_params,
                 avg_r2=avg_r2,
                 avg_adj_r2=avg_adj_r2,
+                keep_data=keep_data,
             )
         )
         return FamaMacBethResults(res)
@@ -5,7 +5,7 @@ from linearmodels.compat.statsmodels import Summary
 from collections.abc import Mapping
 import datetime as dt
 from functools import cached_property
-from typing import Any, Union
+from typing import Any, TypeVar, Union
 
 from formulaic.utils.context import capture_context
 import numpy as np
@@ -17,7 +17,7 @@ from linearmodels.iv.results import default_txt_fmt, stub_concat, table_concat
 from linearmodels.shared.base import _ModelComparison, _SummaryStr
 from linearmodels.shared.hypotheses import WaldTestStatistic, quadratic_form_test
 from linearmodels.shared.io import _str, add_star, pval_format
-from linearmodels.shared.utility import AttrDict
+from linearmodels.shared.utility import AttrDict, copy_without_cache
 from linearmodels.typing import ArrayLike, Float64Array
 
 __all__ = [
@@ -29,6 +29,9 @@ __all__ = [
 ]
 
 
+_PanelResultsT = TypeVar("_PanelResultsT", bound="PanelResults")
+
+
 class PanelResults(_SummaryStr):
     """
     Results container for panel data models that do not include effects
@@ -69,6 +72,31 @@ class PanelResults(_SummaryStr):
         self._idiosyncratic = res.idiosyncratic
         self._original_index = res.original_index
         self._not_null = res.not_null
+        self._cov_estimator = res.cov_estimator
+        self._fit_options = res.fit_options
+        self._fit_kwargs = res.fit_kwargs
+        self._keep_data = True
+        if not res.keep_data:
+            self._drop_data()
+
+    def _drop_data(self) -> None:
+        """Evaluate the covariance and release the residual-type values"""
+        self.__dict__["cov"] = self.cov
+        self._keep_data = False
+        self._deferred_cov = None
+        self._cov_estimator = None
+        self._resids = None
+        self._wresids = None
+        self._index = None
+        self._fitted = None
+        self._effects = None
+        self._idiosyncratic = None
+
+    def _full_results(self: _PanelResultsT) -> _PanelResultsT:
+        """Results that include the residual-type values, re-estimating if needed"""
+        if self._keep_data:
+            return self
+        return self.model.fit(**self._fit_kwargs)
 
     @property
     def params(self) -> Series:
@@ -471,7 +499,8 @@ class PanelResults(_SummaryStr):
         These residuals are from the estimated model. They will not have the
         same shape as the original data whenever the model is estimated on
         transformed data which has a different shape."""
-        return Series(self._resids.squeeze(), index=self._index, name="residual")
+        res = self._full_results()
+        return Series(res._resids.squeeze(), index=res._index, name="residual")
 
     def _out_of_sample(
         self,
@@ -542,13 +571,14 @@ class PanelResults(_SummaryStr):
         if not (exog is None and data is None):
             context = capture_context(1)
             return self._out_of_sample(exog, data, missing, context=context)
+        res = self._full_results()
         out = []
         if fitted:
-            out.append(self.fitted_values)
+            out.append(res.fitted_values)
         if effects:
-            out.append(self.estimated_effects)
+            out.append(res.estimated_effects)
         if idiosyncratic:
-            out.append(self.idiosyncratic)
+            out.append(res.idiosyncratic)
         if len(out) == 0:
             raise ValueError("At least one output must be selected")
         out_df: DataFrame = concat(out, axis=1)
@@ -560,7 +590,7 @@ class PanelResults(_SummaryStr):
     @property
     def fitted_values(self) -> Series:
         """Fitted values"""
-        return self._fitted
+        return self._full_results()._fitted
 
     @property
     def estimated_effects(self) -> Series:
@@ -571,7 +601,7 @@ class PanelResults(_SummaryStr):
         -----
         NaN filled when models do not include effects.
         """
-        return self._effects
+        return self._full_results()._effects
 
     @property
     def idiosyncratic(self) -> Series:
@@ -586,13 +616,14 @@ class PanelResults(_SummaryStr):
         estimates only depend on the model estimated through the estimation
         of parameters and inclusion of effects, if any.
         """
-        return self._idiosyncratic
+        return self._full_results()._idiosyncratic
 
     @property
     def wresids(self) -> Series:
         """Weighted model residuals"""
+        res = self._full_results()
         return Series(
-            self._wresids.squeeze(), index=self._index, name="weighted residual"
+            res._wresids.squeeze(), index=res._index, name="weighted residual"
         )
 
     @property
@@ -741,6 +772,71 @@ class PanelResults(_SummaryStr):
             self.params, self.cov, restriction=restriction, value=value, formula=formula
         )
 
+    def with_cov(
+        self: _PanelResultsT,
+        cov_type: str,
+        *,
+        debiased: bool | None = None,
+        **cov_config: bool | float | str | ArrayLike | DataFrame,
+    ) -> _PanelResultsT:
+        """
+        Results with a different parameter covariance estimator
+
+        Parameters
+        ----------
+        cov_type : str
+            Name of covariance estimator. See the model's ``fit`` method for
+            the supported estimators.
+        debiased : bool
+            Flag indicating whether to debias the covariance estimator. If
+            not provided, the value used when fitting the model is used.
+        **cov_config
+            Additional covariance-specific options. See the model's ``fit``
+            method for details.
+
+        Returns
+        -------
+        results
+            Results that are identical except for the parameter covariance
+            and the statistics that depend on it.
+
+        Notes
+        -----
+        The new covariance estimator is constructed from the transformed data
+        and residuals stored by the covariance estimator used in estimation
+        so that effects are not removed again and parameters are not
+        re-estimated. Quantities that do not depend on the choice of
+        covariance estimator, such as the inverse of the regressor
+        cross-product, are reused. When the model was estimated with
+        ``keep_data=False``, the model is re-estimated to reconstruct the
+        covariance estimator and the returned results also do not store the
+        residual-type values.
+
+        Examples
+        --------
+        >>> res = mod.fit(cov_type="robust")
+        >>> res_clustered = res.with_cov("clustered", cluster_entity=True)
+        >>> res_dk = res.with_cov("kernel", kernel="bartlett", bandwidth=4)
+        """
+        debiased = self._debiased if debiased is None else bool(debiased)
+        if not self._keep_data:
+            out = self._full_results().with_cov(
+                cov_type, debiased=debiased, **cov_config
+            )
+            out._drop_data()
+            return out
+        cov = self.model._update_cov(
+            self._cov_estimator, cov_type, debiased, self._fit_options, cov_config
+        )
+        out = copy_without_cache(self)
+        out._cov_estimator = cov
+        out._deferred_cov = cov.deferred_cov
+        out._cov_type = cov.name
+        out._debiased = debiased
+        out._s2 = cov.s2
+        out._datetime = dt.datetime.now()
+        return out
+
 
 class PanelEffectsResults(PanelResults):
     """
@@ -758,7 +854,35 @@ class PanelEffectsResults(PanelResults):
         self._sigma2_eps = res.sigma2_eps
         self._sigma2_effects = res.sigma2_effects
         self._r2_ex_effects = res.r2_ex_effects
-        self._effects = res.effects
+        self._demean_iterations = res.demean_iterations
+        self._demean_tolerance = res.demean_tolerance
+
+    @property
+    def demean_iterations(self) -> int | None:
+        """
+        Number of iterations used to remove the effects
+
+        Returns
+        -------
+        {int, None}
+            Number of iterations used by the iterative demeaning algorithm.
+            None if the effects were removed without iterating.
+        """
+        return self._demean_iterations
+
+    @property
+    def demean_tolerance(self) -> float | None:
+        """
+        Convergence tolerance achieved when removing the effects
+
+        Returns
+        -------
+        {float, None}
+            Maximum absolute scaled change in the final iteration of the
+            iterative demeaning algorithm. None if the effects were removed
+            without iterating.
+        """
+        return self._demean_tolerance
 
     @property
     def f_pooled(self) -> WaldTestStatistic:
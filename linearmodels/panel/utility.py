@@ -4,7 +4,7 @@ from collections import defaultdict
 from typing import NamedTuple, TypeVar, cast
 
 import numpy as np
-from pandas import DataFrame, concat, date_range
+from pandas import DataFrame, Index, concat, date_range
 import scipy.sparse as sp
 
 from linearmodels.shared.utility import panel_to_frame
@@ -18,6 +18,13 @@ try:
 except ImportError:
     HAS_CYTHON = False
 
+try:
+    from linearmodels.panel._utility import _group_sum
+
+    HAS_CYTHON_GROUP_SUM = True
+except ImportError:
+    HAS_CYTHON_GROUP_SUM = False
+
 
 class AbsorbingEffectError(Exception):
     pass
@@ -280,9 +287,479 @@ def _py_drop_singletons(meta: IntArray, orig_dest: IntArray) -> None:
                 next_node, next_count = _remove_node(next_node, meta, orig_dest)
 
 
+def _py_group_sum(values: Float64Array, codes: IntArray, ngroups: int) -> Float64Array:
+    """
+    Accumulate the rows of values into the group indicated by codes
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of values to sum with shape (nobs, nvar)
+    codes : ndarray
+        Group codes with values in [0, ngroups) (nobs,)
+    ngroups : int
+        Number of groups
+
+    Returns
+    -------
+    ndarray
+        Array of group sums with shape (ngroups, nvar)
+    """
+    out = np.empty((ngroups, values.shape[1]))
+    for i in range(values.shape[1]):
+        out[:, i] = np.bincount(codes, weights=values[:, i], minlength=ngroups)
+    return out
+
+
 if not HAS_CYTHON:
     _drop_singletons = _py_drop_singletons  # noqa: F811
 
+if not HAS_CYTHON_GROUP_SUM:
+    _group_sum = _py_group_sum  # noqa: F811
+
+
+def group_codes(groups: ArrayLike) -> tuple[IntArray, int]:
+    """
+    Convert group identifiers to dense, zero-based integer codes
+
+    Parameters
+    ----------
+    groups : array_like
+        One-dimensional array of integer group identifiers (nobs,)
+
+    Returns
+    -------
+    codes : ndarray
+        Contiguous int64 codes in [0, ngroups) (nobs,)
+    ngroups : int
+        Number of groups. Groups without observations are allowed when the
+        input identifiers are already non-negative and not much larger
+        than the number of observations.
+    """
+    codes = np.asarray(groups).ravel()
+    if codes.shape[0] == 0:
+        return np.empty(0, dtype=np.int64), 0
+    if np.issubdtype(codes.dtype, np.integer):
+        cmin, cmax = int(codes.min()), int(codes.max())
+        if cmin >= 0 and cmax < 2 * codes.shape[0]:
+            return np.ascontiguousarray(codes, dtype=np.int64), cmax + 1
+    _, inverse = np.unique(codes, return_inverse=True)
+    inverse = np.ascontiguousarray(inverse.ravel(), dtype=np.int64)
+    return inverse, int(inverse.max()) + 1
+
+
+def group_sum(values: Float64Array, codes: IntArray, ngroups: int) -> Float64Array:
+    """
+    Compute group sums of the columns of a 2-d array
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of values to sum with shape (nobs, nvar)
+    codes : ndarray
+        Integer group codes in [0, ngroups) produced by group_codes (nobs,)
+    ngroups : int
+        Number of groups
+
+    Returns
+    -------
+    ndarray
+        Array of group sums with shape (ngroups, nvar)
+
+    Notes
+    -----
+    Uses a compiled kernel when available. Falls back to one call to
+    np.bincount per column.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    codes = np.ascontiguousarray(codes, dtype=np.int64)
+    return _group_sum(values, codes, ngroups)
+
+
+def _group_weight_sum(
+    codes: IntArray, ngroups: int, weights: Float64Array | None
+) -> Float64Array:
+    """Sum of weights (or observation count) by group"""
+    if weights is None:
+        denom = np.bincount(codes, minlength=ngroups).astype(np.float64)
+    else:
+        denom = np.bincount(codes, weights=weights.ravel(), minlength=ngroups)
+    return denom[:, None]
+
+
+def _group_mean(
+    values: Float64Array,
+    codes: IntArray,
+    ngroups: int,
+    denom: Float64Array,
+    out: Float64Array | None = None,
+) -> Float64Array:
+    """
+    Group means broadcast to observations, NaN when a group's weights sum to 0
+
+    out may be values since the group sums are computed before out is written.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mu = group_sum(values, codes, ngroups) / denom
+    return np.take(mu, codes, axis=0, out=out)
+
+
+def group_demean(
+    values: Float64Array, groups: ArrayLike, weights: Float64Array | None = None
+) -> Float64Array:
+    """
+    Remove (weighted) group means from each column of values
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of values to demean with shape (nobs, nvar)
+    groups : array_like
+        Integer group identifiers (nobs,)
+    weights : ndarray
+        Observation weights (nobs, 1). If None, unit weights are used.
+
+    Returns
+    -------
+    ndarray
+        Demeaned values. If weights are provided, the returned values are
+        scaled by the square root of the weights so that they can be used in
+        WLS estimation.
+    """
+    codes, ngroups = group_codes(groups)
+    denom = _group_weight_sum(codes, ngroups, weights)
+    if weights is None:
+        out = _group_mean(values, codes, ngroups, denom)
+        return np.subtract(values, out, out=out)
+    w = weights.reshape((-1, 1))
+    out = np.multiply(w, values)
+    _group_mean(out, codes, ngroups, denom, out=out)
+    np.subtract(values, out, out=out)
+    out *= np.sqrt(w)
+    return out
+
+
+class DemeanResult(NamedTuple):
+    """
+    Typed namedtuple holding the output of multi-way demeaning
+
+    Parameters
+    ----------
+    values : ndarray
+        Demeaned values scaled by the square root of the weights
+    iterations : int
+        Number of iterations used. For "ap" and "irons-tuck" this is the
+        number of full demeaning passes over all groups. For "cg" this is
+        the number of conjugate-gradient steps.
+    tolerance : float
+        Maximum absolute scaled change in the final iteration
+    """
+
+    values: Float64Array
+    iterations: int
+    tolerance: float
+
+
+DEMEAN_METHODS = ("ap", "irons-tuck", "cg")
+
+
+def _demean_scale(values: Float64Array) -> Float64Array:
+    """Column scales used to assess convergence of iterative demeaning"""
+    exclude = np.ptp(values, 0) == 0
+    max_rmse = np.sqrt(values.var(0).max())
+    scale = values.std(0, ddof=1)
+    exclude = exclude | (scale < 1e-14 * max_rmse)
+    replacement = np.maximum(scale, 1)
+    scale[exclude] = replacement[exclude]
+    return scale[None, :]
+
+
+def general_group_demean(
+    values: Float64Array,
+    groups: ArrayLike | FixedEffectsAbsorber,
+    weights: Float64Array | None = None,
+    *,
+    method: str = "ap",
+    tol: float = 1e-8,
+    max_iter: int | None = None,
+) -> DemeanResult:
+    """
+    Multi-way (weighted) demeaning
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of values to demean with shape (nobs, nvar)
+    groups : {array_like, FixedEffectsAbsorber}
+        Integer group identifiers with shape (nobs, ngroup_vars) or a
+        precomputed FixedEffectsAbsorber
+    weights : ndarray
+        Observation weights (nobs, 1). If None, unit weights are used. Must
+        be None if groups is a FixedEffectsAbsorber.
+    method : {"ap", "irons-tuck", "cg"}
+        Algorithm used to remove the group means:
+
+        * "ap" - Alternating projections (method of alternating projections)
+        * "irons-tuck" - Alternating projections with Irons-Tuck (vector
+          Aitken) acceleration applied after every two passes
+        * "cg" - Conjugate gradient on the normal equations of the group
+          dummy design, preconditioned by the group weight sums
+
+    tol : float
+        Convergence tolerance for the maximum absolute change between
+        iterations, scaled by the standard deviation of each column
+    max_iter : int
+        Maximum number of iterations. If None, iterates until convergence.
+
+    Returns
+    -------
+    DemeanResult
+        Demeaned values and convergence information
+
+    Notes
+    -----
+    Group codes and group weight sums are computed once and reused across
+    iterations. A single grouping variable is always removed in one pass.
+    """
+    if isinstance(groups, FixedEffectsAbsorber):
+        if weights is not None:
+            raise ValueError(
+                "weights cannot be used with a FixedEffectsAbsorber. The weights "
+                "used to construct the absorber are used."
+            )
+        absorber = groups
+    else:
+        absorber = FixedEffectsAbsorber(groups, weights)
+    return absorber.demean(values, method=method, tol=tol, max_iter=max_iter)
+
+
+class FixedEffectsAbsorber:
+    """
+    Precomputed fixed effect structure for repeated (weighted) demeaning
+
+    Parameters
+    ----------
+    groups : array_like
+        Integer group identifiers with shape (nobs, ngroup_vars). Each column
+        contains the codes of one effect.
+    weights : array_like
+        Observation weights (nobs,) or (nobs, 1). If None, unit weights are
+        used.
+    index : Index
+        Optional index identifying the observations that the absorber applies
+        to. Used to verify that the absorber matches a model's sample.
+
+    Notes
+    -----
+    The dense group codes and the group weight sums are computed once when
+    the absorber is created. Demeaning new columns only requires group sums
+    of the new data, so the absorber can be reused across models that
+    share the same effects and the same sample but differ in regressors.
+
+    Examples
+    --------
+    >>> from linearmodels.panel import FixedEffectsAbsorber
+    >>> import numpy as np
+    >>> rs = np.random.default_rng(0)
+    >>> groups = rs.integers(0, 10, size=(1000, 2))
+    >>> absorber = FixedEffectsAbsorber(groups)
+    >>> res = absorber.demean(rs.standard_normal((1000, 3)))
+    """
+
+    def __init__(
+        self,
+        groups: ArrayLike,
+        weights: ArrayLike | None = None,
+        *,
+        index: Index | None = None,
+    ) -> None:
+        groups_arr = np.asarray(groups)
+        if groups_arr.ndim == 1:
+            groups_arr = groups_arr[:, None]
+        if groups_arr.ndim != 2:
+            raise ValueError("groups must be 1 or 2-dimensional")
+        self._nobs = nobs = groups_arr.shape[0]
+        self._weighted = weights is not None
+        if weights is None:
+            self._root_w = np.ones((nobs, 1))
+        else:
+            w = np.asarray(weights, dtype=float).reshape((-1, 1))
+            if w.shape[0] != nobs:
+                raise ValueError("weights must have the same number of rows as groups")
+            self._root_w = np.sqrt(w)
+        weights_arr = self._root_w**2 if self._weighted else None
+        self._levels: list[tuple[IntArray, int, Float64Array]] = []
+        for i in range(groups_arr.shape[1]):
+            codes, ngroups = group_codes(groups_arr[:, i])
+            denom = _group_weight_sum(codes, ngroups, weights_arr)
+            self._levels.append((codes, ngroups, denom))
+        if index is not None and index.shape[0] != nobs:
+            raise ValueError("index must have the same number of rows as groups")
+        self._index = index
+        self._pre_singleton_index: Index | None = None
+        self._singleton_drop: BoolArray | None = None
+
+    @property
+    def nobs(self) -> int:
+        """Number of observations"""
+        return self._nobs
+
+    @property
+    def ngroups(self) -> list[int]:
+        """Number of groups in each effect"""
+        return [ngroups for _, ngroups, _ in self._levels]
+
+    @property
+    def weights(self) -> Float64Array | None:
+        """Observation weights (nobs, 1), or None if unweighted"""
+        return self._root_w**2 if self._weighted else None
+
+    @property
+    def index(self) -> Index | None:
+        """Index of the observations the absorber applies to, if known"""
+        return self._index
+
+    def _demean_pass(self, current: Float64Array) -> Float64Array:
+        """Remove each effect once from root_w-scaled data"""
+        current = current.copy()
+        buffer = np.empty_like(current)
+        root_w = self._root_w
+        for codes, ngroups, denom in self._levels:
+            if self._weighted:
+                np.multiply(root_w, current, out=buffer)
+                _group_mean(buffer, codes, ngroups, denom, out=buffer)
+                buffer *= root_w
+            else:
+                _group_mean(current, codes, ngroups, denom, out=buffer)
+            current -= buffer
+        return current
+
+    def demean(
+        self,
+        values: ArrayLike,
+        *,
+        method: str = "ap",
+        tol: float = 1e-8,
+        max_iter: int | None = None,
+    ) -> DemeanResult:
+        """
+        Remove the effects from the columns of values
+
+        Parameters
+        ----------
+        values : array_like
+            Array of values to demean with shape (nobs, nvar)
+        method : {"ap", "irons-tuck", "cg"}
+            Algorithm used to remove the group means. See
+            :func:`general_group_demean`.
+        tol : float
+            Convergence tolerance for the maximum absolute change between
+            iterations, scaled by the standard deviation of each column
+        max_iter : int
+            Maximum number of iterations. If None, iterates until convergence.
+
+        Returns
+        -------
+        DemeanResult
+            Demeaned values, scaled by the square root of the weights, and
+            convergence information
+        """
+        if method not in DEMEAN_METHODS:
+            raise ValueError(f"method must be one of {', '.join(DEMEAN_METHODS)}")
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            values = values[:, None]
+        if values.shape[0] != self._nobs:
+            raise ValueError("values must have the same number of rows as the groups")
+        root_w = self._root_w
+        wvalues = root_w * values if self._weighted else values
+        if len(self._levels) == 1:
+            return DemeanResult(self._demean_pass(wvalues), 1, 0.0)
+
+        scale = _demean_scale(values)
+        max_iter = np.inf if max_iter is None else max_iter
+        if method == "cg":
+            return _cg_demean(wvalues, root_w, self._levels, scale, tol, max_iter)
+
+        previous = wvalues
+        current = self._demean_pass(previous)
+        iterations = 1
+        change = np.max(np.abs(current - previous) / scale)
+        while change > tol and iterations < max_iter:
+            previous = current
+            if method == "irons-tuck":
+                gx = self._demean_pass(previous)
+                ggx = self._demean_pass(gx)
+                iterations += 2
+                delta_gx = ggx - gx
+                delta2 = delta_gx - (gx - previous)
+                num = (delta_gx * delta2).sum(0)
+                denom = (delta2 * delta2).sum(0)
+                coef = np.divide(num, denom, out=np.zeros_like(num), where=denom > 0)
+                current = ggx - coef * delta_gx
+            else:
+                current = self._demean_pass(previous)
+                iterations += 1
+            change = np.max(np.abs(current - previous) / scale)
+        return DemeanResult(current, iterations, float(change))
+
+
+def _cg_demean(
+    wvalues: Float64Array,
+    root_w: Float64Array,
+    levels: list[tuple[IntArray, int, Float64Array]],
+    scale: Float64Array,
+    tol: float,
+    max_iter: float,
+) -> DemeanResult:
+    """
+    Preconditioned conjugate gradient demeaning
+
+    Solves D'WD b = D'W y column-by-column where D contains the group
+    dummies, and returns the weighted residual root_w * (y - D b). The group
+    weight sums, which form the diagonal of D'WD, are used as the
+    preconditioner.
+    """
+
+    def design(coef: list[Float64Array]) -> Float64Array:
+        out = np.zeros_like(wvalues)
+        for (codes, _, _), c in zip(levels, coef):
+            out += c[codes]
+        return root_w * out
+
+    def design_t(resid: Float64Array) -> list[Float64Array]:
+        wresid = root_w * resid
+        return [group_sum(wresid, codes, ngroups) for codes, ngroups, _ in levels]
+
+    with np.errstate(divide="ignore"):
+        inv_denoms = [np.where(denom > 0, 1.0 / denom, 0.0) for _, _, denom in levels]
+
+    def inner(a: list[Float64Array], b: list[Float64Array]) -> Float64Array:
+        return sum((ai * bi).sum(0) for ai, bi in zip(a, b))
+
+    current = wvalues.copy()
+    resid = design_t(current)
+    precond = [inv * r for inv, r in zip(inv_denoms, resid)]
+    direction = [p.copy() for p in precond]
+    rz = inner(resid, precond)
+    iterations = 0
+    change = np.inf
+    while change > tol and iterations < max_iter:
+        step = design(direction)
+        step_direction = design_t(step)
+        curvature = inner(direction, step_direction)
+        alpha = np.divide(rz, curvature, out=np.zeros_like(rz), where=curvature > 0)
+        current -= alpha * step
+        resid = [r - alpha * sd for r, sd in zip(resid, step_direction)]
+        precond = [inv * r for inv, r in zip(inv_denoms, resid)]
+        rz_new = inner(resid, precond)
+        beta = np.divide(rz_new, rz, out=np.zeros_like(rz), where=rz > 0)
+        direction = [p + beta * d for p, d in zip(precond, direction)]
+        rz = rz_new
+        iterations += 1
+        change = np.max(np.abs(alpha * step) / scale)
+    return DemeanResult(current, iterations, float(change))
+
 
 def in_2core_graph(cats: ArrayLike) -> BoolArray:
     """
@@ -1,29 +1,331 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import cached_property
+from itertools import combinations
+from typing import Literal
+
 from numpy import (
+    add,
+    all as npall,
     any as npany,
     arange,
     argsort,
+    asarray,
+    ascontiguousarray,
+    clip,
+    concatenate,
     cumsum,
+    empty,
+    flatnonzero,
+    int64,
     lexsort,
     r_,
     unique,
-    where,
     zeros,
 )
+from numpy.linalg import eigh
+from scipy.fft import next_fast_len, rfft
 
 from linearmodels.typing import AnyArray, Float64Array, IntArray
 
+try:
+    from xxhash import xxh64 as hash_func
+except ImportError:
+    from hashlib import sha256 as hash_func
 
-def group_debias_coefficient(clusters: IntArray) -> float:
-    r"""
-    Compute the group debiasing scale.
+
+class ClusterStructure:
+    """
+    Precomputed codes, sort order and group boundaries of a cluster variable
 
     Parameters
     ----------
     clusters : ndarray
         One-dimensional array containing cluster group membership.
 
+    Notes
+    -----
+    The structure is computed once and can be reused to compute cluster
+    sums of any number of arrays, the small-sample debiasing coefficient
+    and intersections with other cluster variables.
+    """
+
+    def __init__(self, clusters: AnyArray) -> None:
+        clusters = asarray(clusters)
+        if clusters.ndim == 2 and clusters.shape[1] == 1:
+            clusters = clusters[:, 0]
+        if clusters.ndim != 1:
+            raise ValueError("clusters must be one-dimensional")
+        nobs = clusters.shape[0]
+        self._nobs = nobs
+        self._order: IntArray | None = None
+        if nobs > 0 and not npall(clusters[1:] >= clusters[:-1]):
+            self._order = argsort(clusters, kind="stable")
+            clusters = clusters[self._order]
+        starts = r_[True, clusters[1:] != clusters[:-1]] if nobs else zeros(0, bool)
+        self._locs = flatnonzero(starts)
+        sorted_codes = cumsum(starts, dtype=int64) - 1
+        if self._order is None:
+            self._codes = sorted_codes
+        else:
+            self._codes = empty(nobs, dtype=int64)
+            self._codes[self._order] = sorted_codes
+
+    @property
+    def nobs(self) -> int:
+        """Number of observations"""
+        return self._nobs
+
+    @property
+    def ngroups(self) -> int:
+        """Number of distinct clusters"""
+        return self._locs.shape[0]
+
+    @property
+    def codes(self) -> IntArray:
+        """Integer cluster codes in 0, 1, ..., ngroups - 1"""
+        return self._codes
+
+    @property
+    def order(self) -> IntArray | None:
+        """Permutation that sorts the clusters, or None if already sorted"""
+        return self._order
+
+    @property
+    def locs(self) -> IntArray:
+        """Location of the first observation of each cluster in sorted order"""
+        return self._locs
+
+    @cached_property
+    def debias_coefficient(self) -> float:
+        """Small number of groups debiasing coefficient"""
+        g = self.ngroups
+        n = self._nobs
+        return (g / (g - 1)) * ((n - 1) / n)
+
+    def group_sums(self, z: Float64Array) -> Float64Array:
+        """
+        Compute cluster sums
+
+        Parameters
+        ----------
+        z : ndarray
+            nobs by k array
+
+        Returns
+        -------
+        ndarray
+            ngroups by k array of sums of z within each cluster
+        """
+        if self._nobs == 0:
+            return zeros((0, z.shape[1]))
+        if self._order is not None:
+            z = z[self._order]
+        return add.reduceat(z, self._locs, axis=0)
+
+    def intersect(self, other: ClusterStructure) -> ClusterStructure:
+        """
+        Construct the structure of the intersection with another cluster
+
+        Parameters
+        ----------
+        other : ClusterStructure
+            Cluster structure with the same number of observations
+
+        Returns
+        -------
+        ClusterStructure
+            Structure where each cluster contains observations that share
+            the same cluster in both structures
+        """
+        if other.nobs != self._nobs:
+            raise ValueError("other must have the same number of observations")
+        return ClusterStructure(self._codes * other.ngroups + other.codes)
+
+
+_STRUCTURE_CACHE: OrderedDict[
+    tuple[object, ...], list[ClusterStructure]
+] = OrderedDict()
+_STRUCTURE_CACHE_SIZE = 8
+
+KERNEL_FFT_MIN_LAGS = 32
+
+
+def cluster_subsets(ndim: int) -> list[tuple[int, ...]]:
+    """
+    Subsets of cluster variables used in multi-way clustering
+
+    Parameters
+    ----------
+    ndim : int
+        Number of cluster variables
+
+    Returns
+    -------
+    list[tuple[int, ...]]
+        The 2**ndim - 1 non-empty subsets of range(ndim), ordered by size
+    """
+    return [
+        subset
+        for size in range(1, ndim + 1)
+        for subset in combinations(range(ndim), size)
+    ]
+
+
+def _cluster_structures(clusters: AnyArray) -> list[ClusterStructure]:
+    ndim = clusters.shape[1]
+    lookup: dict[tuple[int, ...], ClusterStructure] = {}
+    for subset in cluster_subsets(ndim):
+        if len(subset) == 1:
+            lookup[subset] = ClusterStructure(clusters[:, subset[0]])
+        else:
+            lookup[subset] = lookup[subset[:-1]].intersect(lookup[subset[-1:]])
+    return list(lookup.values())
+
+
+def cluster_structures(clusters: AnyArray) -> list[ClusterStructure]:
+    """
+    Construct the cluster structures required by multi-way clustering
+
+    Parameters
+    ----------
+    clusters : ndarray
+        nobs by ndim array of cluster group membership.
+
+    Returns
+    -------
+    list[ClusterStructure]
+        Structures of the intersections of all non-empty subsets of the
+        cluster variables, in the order of cluster_subsets. When ndim is 1,
+        this is the structure of the cluster variable. When ndim is 2, the
+        structures of the two variables and of their intersection.
+
+    Notes
+    -----
+    Intersections are computed by combining the codes of a smaller
+    intersection with the codes of one additional variable so that each
+    intersection only requires sorting integer codes.
+
+    Structures are cached using a digest of the cluster values so that
+    repeated covariance estimates using the same clusters do not recompute
+    sort orders.
+    """
+    clusters = asarray(clusters)
+    if clusters.ndim == 1:
+        clusters = clusters[:, None]
+    if clusters.dtype.hasobject:
+        return _cluster_structures(clusters)
+    hasher = hash_func()
+    hasher.update(ascontiguousarray(clusters).view("u1").data)
+    key = (clusters.shape, clusters.dtype.str, hasher.hexdigest())
+    if key in _STRUCTURE_CACHE:
+        _STRUCTURE_CACHE.move_to_end(key)
+        return _STRUCTURE_CACHE[key]
+    structures = _cluster_structures(clusters)
+    _STRUCTURE_CACHE[key] = structures
+    while len(_STRUCTURE_CACHE) > _STRUCTURE_CACHE_SIZE:
+        _STRUCTURE_CACHE.popitem(last=False)
+    return structures
+
+
+def psd_correction(s: Float64Array) -> Float64Array:
+    """
+    Ensure a symmetric matrix is positive semi-definite
+
+    Parameters
+    ----------
+    s : ndarray
+        Symmetric matrix
+
+    Returns
+    -------
+    ndarray
+        Matrix with any negative eigenvalues replaced by 0
+
+    Notes
+    -----
+    This is the eigenvalue correction suggested by Cameron, Gelbach and
+    Miller (2011) for multi-way cluster covariance estimators, which are
+    not guaranteed to be positive semi-definite.
+    """
+    s = (s + s.T) / 2
+    vals, vecs = eigh(s)
+    if npall(vals >= 0):
+        return s
+    vals = clip(vals, 0, None)
+    return (vecs * vals) @ vecs.T
+
+
+def cov_cluster_multiway(
+    z: Float64Array,
+    clusters: AnyArray,
+    *,
+    group_debias: bool = False,
+    psd: bool = False,
+) -> Float64Array:
+    r"""
+    Multi-way cluster covariance estimator
+
+    Parameters
+    ----------
+    z : ndarray
+        n by k mean zero data array
+    clusters : ndarray
+        n by ndim array of cluster group membership
+    group_debias : bool
+        Flag indicating whether to apply the small number of groups
+        adjustment to each component.
+    psd : bool
+        Flag indicating whether to replace negative eigenvalues of the
+        estimate by 0.
+
+    Returns
+    -------
+    ndarray
+       k by k cluster asymptotic covariance
+
+    Notes
+    -----
+    The estimator of Cameron, Gelbach and Miller (2011) is
+
+    .. math::
+
+       \hat{S} = \sum_{r=1}^{d} (-1)^{r+1} \sum_{|\mathcal{I}|=r}
+                  \hat{S}_{\mathcal{I}}
+
+    where :math:`\hat{S}_{\mathcal{I}}` is the one-way cluster covariance
+    computed using the intersection of the cluster variables in
+    :math:`\mathcal{I}`. When ndim is 1 this is the one-way estimator and
+    when ndim is 2 this is the two-way estimator.
+    """
+    structures = cluster_structures(clusters)
+    ndim = 1 if asarray(clusters).ndim == 1 else asarray(clusters).shape[1]
+    k = z.shape[1]
+    s = zeros((k, k))
+    for subset, structure in zip(cluster_subsets(ndim), structures):
+        component = cov_cluster(z, structure)
+        if group_debias:
+            component *= structure.debias_coefficient
+        if len(subset) % 2:
+            s += component
+        else:
+            s -= component
+    if psd:
+        s = psd_correction(s)
+    return s
+
+
+def group_debias_coefficient(clusters: IntArray | ClusterStructure) -> float:
+    r"""
+    Compute the group debiasing scale.
+
+    Parameters
+    ----------
+    clusters : {ndarray, ClusterStructure}
+        One-dimensional array containing cluster group membership, or its
+        precomputed structure.
+
     Returns
     -------
     float
@@ -39,6 +341,8 @@ def group_debias_coefficient(clusters: IntArray) -> float:
 
     where g is the number of groups and n is the sample size.
     """
+    if isinstance(clusters, ClusterStructure):
+        return clusters.debias_coefficient
     n = clusters.shape[0]
     ngroups = unique(clusters).shape[0]
     return (ngroups / (ngroups - 1)) * ((n - 1) / n)
@@ -68,7 +372,7 @@ def cluster_union(clusters: IntArray) -> IntArray:
     return union[resort_locs]
 
 
-def cov_cluster(z: Float64Array, clusters: AnyArray) -> Float64Array:
+def cov_cluster(z: Float64Array, clusters: AnyArray | ClusterStructure) -> Float64Array:
     """
     Core cluster covariance estimator
 
@@ -76,33 +380,60 @@ def cov_cluster(z: Float64Array, clusters: AnyArray) -> Float64Array:
     ----------
     z : ndarray
         n by k mean zero data array
-    clusters : ndarray
-        n by 1 array
+    clusters : {ndarray, ClusterStructure}
+        n by 1 array, or its precomputed structure
 
     Returns
     -------
     ndarray
        k by k cluster asymptotic covariance
-    """
-    num_clusters = len(unique(clusters))
 
-    sort_args = argsort(clusters)
-    clusters = clusters[sort_args]
-    locs = where(r_[True, clusters[:-1] != clusters[1:], True])[0]
-    z = z[sort_args]
+    Notes
+    -----
+    The cluster sums of z are computed in a single pass over the sorted
+    data using ``numpy.add.reduceat`` so that the covariance is computed
+    using a single matrix product of the cluster sums.
+    """
+    if not isinstance(clusters, ClusterStructure):
+        clusters = ClusterStructure(clusters)
     n, k = z.shape
-    s = zeros((k, k))
-
-    for i in range(num_clusters):
-        st, en = locs[i], locs[i + 1]
-        z_bar = z[st:en].sum(axis=0)[:, None]
-        s += z_bar @ z_bar.T
+    if n == 0:
+        return zeros((k, k))
+    z_bar = clusters.group_sums(z)
+    s = z_bar.T @ z_bar
 
     s /= n
     return s
 
 
-def cov_kernel(z: Float64Array, w: Float64Array) -> Float64Array:
+def _cov_kernel_fft(z: Float64Array, w: Float64Array) -> Float64Array:
+    n = z.shape[0]
+    nlags = w.shape[0]
+    nfft = next_fast_len(n + nlags - 1, real=True)
+    # Symmetric lag weights on the circle, lag 0 always has weight 1
+    v = zeros(nfft)
+    v[:nlags] = w
+    v[0] = 1.0
+    v[nfft - nlags + 1 :] = w[:0:-1]
+    spectral_weights = rfft(v).real
+    # Each non-zero and non-Nyquist frequency appears twice in the full FFT
+    spectral_weights[1:] *= 2
+    if nfft % 2 == 0:
+        spectral_weights[-1] /= 2
+    z_fft = rfft(z, nfft, axis=0)
+    stacked = concatenate([z_fft.real, z_fft.imag])
+    weights = concatenate([spectral_weights, spectral_weights])
+    s = (stacked * weights[:, None]).T @ stacked
+    s /= nfft
+    return (s + s.T) / 2
+
+
+def cov_kernel(
+    z: Float64Array,
+    w: Float64Array,
+    *,
+    method: Literal["auto", "direct", "fft"] = "auto",
+) -> Float64Array:
     """
     Core kernel covariance estimator
 
@@ -112,11 +443,25 @@ def cov_kernel(z: Float64Array, w: Float64Array) -> Float64Array:
         n by k mean zero data array
     w : ndarray
         m by 1
+    method : {"auto", "direct", "fft"}
+        Method used to compute the weighted sum of autocovariances.
+        "direct" computes each autocovariance using a matrix product.
+        "fft" computes all autocovariances at once using the FFT of the
+        zero-padded data. "auto" uses "fft" when the number of weights is
+        at least KERNEL_FFT_MIN_LAGS and "direct" otherwise.
 
     Returns
     -------
     ndarray
        k by k kernel asymptotic covariance
+
+    Notes
+    -----
+    The direct method has cost O(nmk^2) which is O(n^2k^2) for kernels
+    such as the Quadratic-Spectral that use all lags. The FFT method
+    computes the weighted sum of all autocovariances from the spectral
+    representation of the data and has cost O(nk log(n) + nk^2) for any
+    number of lags.
     """
     k = len(w)
     n = z.shape[0]
@@ -125,6 +470,12 @@ def cov_kernel(z: Float64Array, w: Float64Array) -> Float64Array:
             "Length of w ({}) is larger than the number "
             "of elements in z ({})".format(k, n)
         )
+    if method not in ("auto", "direct", "fft"):
+        raise ValueError("method must be one of 'auto', 'direct' or 'fft'")
+    if method == "fft" or (method == "auto" and k >= KERNEL_FFT_MIN_LAGS):
+        s = _cov_kernel_fft(z, asarray(w, dtype=float).ravel())
+        s /= n
+        return s
     s = z.T @ z
     for i in range(1, len(w)):
         op = z[i:].T @ z[:-i]
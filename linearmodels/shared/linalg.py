@@ -1,8 +1,79 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import Any, Callable, NamedTuple, TypeVar
+
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import lsmr
+
+from linearmodels.typing import Float64Array, IntArray
+
+BLOCK_LSMR_MIN_COLUMNS = 16
+"""Minimum number of right-hand sides for block_lsmr to be used by default"""
+BLOCK_LSMR_BLOCK_SIZE = 16
+"""Default number of right-hand sides advanced together by block_lsmr"""
 
-from linearmodels.typing import Float64Array
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def resolve_n_jobs(n_jobs: int | None) -> int:
+    """
+    Convert an n_jobs value to a number of workers
+
+    Parameters
+    ----------
+    n_jobs : {int, None}
+        Number of workers. None and 1 use a single worker. Negative values
+        count back from the number of CPUs so that -1 uses all CPUs.
+
+    Returns
+    -------
+    int
+        Number of workers
+    """
+    if n_jobs is None:
+        return 1
+    n_jobs = int(n_jobs)
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer or None")
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def parallel_map(
+    func: Callable[[_T], _R], items: list[_T], n_jobs: int | None = 1
+) -> list[_R]:
+    """
+    Apply a function to a list of items using a thread pool
+
+    Parameters
+    ----------
+    func : callable
+        Function to apply to each item
+    items : list
+        Items to pass to func
+    n_jobs : {int, None}
+        Number of threads. See resolve_n_jobs.
+
+    Returns
+    -------
+    list
+        Values returned by func, in the order of items
+
+    Notes
+    -----
+    Each item is processed exactly as it would be serially, so that the
+    results are identical to ``[func(item) for item in items]``.
+    """
+    n_workers = min(resolve_n_jobs(n_jobs), len(items))
+    if n_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(func, items))
 
 
 def has_constant(x: Float64Array, x_rank: int | None = None) -> tuple[bool, int]:
@@ -62,3 +133,302 @@ def inv_sqrth(x: Float64Array) -> Float64Array:
     """
     vals, vecs = np.linalg.eigh(x)
     return vecs @ np.diag(1 / np.sqrt(vals)) @ vecs.T
+
+
+class BlockLSMRResult(NamedTuple):
+    """
+    Typed namedtuple holding the output of block_lsmr
+
+    Parameters
+    ----------
+    x : ndarray
+        Least squares solutions, (ncol, nrhs)
+    istop : ndarray
+        Reason for termination of each right-hand side using the codes of
+        scipy.sparse.linalg.lsmr, (nrhs,)
+    iterations : ndarray
+        Number of iterations used by each right-hand side, (nrhs,)
+    """
+
+    x: Float64Array
+    istop: IntArray
+    iterations: IntArray
+
+
+def _column_norm(x: Float64Array) -> Float64Array:
+    return np.sqrt(np.einsum("ij,ij->j", x, x))
+
+
+def _normalize(x: Float64Array) -> Float64Array:
+    norm = _column_norm(x)
+    x /= np.where(norm > 0, norm, 1.0)
+    return norm
+
+
+def _sym_ortho(
+    a: Float64Array, b: Float64Array
+) -> tuple[Float64Array, Float64Array, Float64Array]:
+    r = np.hypot(a, b)
+    safe = np.where(r > 0, r, 1.0)
+    c = np.where(r > 0, a / safe, 1.0)
+    s = b / safe
+    return c, s, r
+
+
+def _block_lsmr(
+    a: Any,
+    at: Any,
+    b: Float64Array,
+    atol: float,
+    btol: float,
+    conlim: float,
+    maxiter: int,
+) -> BlockLSMRResult:
+    nrhs = b.shape[1]
+    ncol = a.shape[1]
+    x_out = np.zeros((ncol, nrhs))
+    istop_out = np.zeros(nrhs, dtype=np.int64)
+    iter_out = np.zeros(nrhs, dtype=np.int64)
+    ctol = 1 / conlim if conlim > 0 else 0.0
+
+    u = b.copy()
+    normb = _normalize(u)
+    beta = normb.copy()
+    v = np.asarray(at @ u)
+    alpha = _normalize(v)
+    # Columns with b = 0 or A'b = 0 have the solution x = 0
+    active = np.flatnonzero((alpha * beta) != 0)
+    u, v = u[:, active], v[:, active]
+    alpha, beta, normb = alpha[active], beta[active], normb[active]
+
+    k = active.shape[0]
+    zetabar = alpha * beta
+    alphabar = alpha.copy()
+    rho = np.ones(k)
+    rhobar = np.ones(k)
+    cbar = np.ones(k)
+    sbar = np.zeros(k)
+    h = v.copy()
+    hbar = np.zeros((ncol, k))
+    x = np.zeros((ncol, k))
+    betadd = beta.copy()
+    betad = np.zeros(k)
+    rhodold = np.ones(k)
+    tautildeold = np.zeros(k)
+    thetatilde = np.zeros(k)
+    zeta = np.zeros(k)
+    d = np.zeros(k)
+    norma2 = alpha * alpha
+    maxrbar = np.zeros(k)
+    minrbar = np.full(k, 1e100)
+
+    itn = 0
+    while itn < maxiter and k > 0:
+        itn += 1
+        u *= -alpha
+        u += np.asarray(a @ v)
+        beta = _normalize(u)
+        v *= -beta
+        v += np.asarray(at @ u)
+        alpha = np.where(beta > 0, _normalize(v), alpha)
+
+        rhoold = rho
+        c, s, rho = _sym_ortho(alphabar, beta)
+        thetanew = s * alpha
+        alphabar = c * alpha
+
+        rhobarold = rhobar
+        zetaold = zeta
+        thetabar = sbar * rho
+        rhotemp = cbar * rho
+        cbar, sbar, rhobar = _sym_ortho(cbar * rho, thetanew)
+        zeta = cbar * zetabar
+        zetabar = -sbar * zetabar
+
+        hbar *= -(thetabar * rho / (rhoold * rhobarold))
+        hbar += h
+        x += (zeta / (rho * rhobar)) * hbar
+        h *= -(thetanew / rho)
+        h += v
+
+        betahat = c * betadd
+        betadd = -s * betadd
+
+        thetatildeold = thetatilde
+        ctildeold, stildeold, rhotildeold = _sym_ortho(rhodold, thetabar)
+        thetatilde = stildeold * rhobar
+        rhodold = ctildeold * rhobar
+        betad = -stildeold * betad + ctildeold * betahat
+
+        tautildeold = (zetaold - thetatildeold * tautildeold) / rhotildeold
+        taud = (zeta - thetatilde * tautildeold) / rhodold
+        normr = np.sqrt(d + (betad - taud) ** 2 + betadd * betadd)
+
+        norma2 = norma2 + beta * beta
+        norma = np.sqrt(norma2)
+        norma2 = norma2 + alpha * alpha
+
+        maxrbar = np.maximum(maxrbar, rhobarold)
+        if itn > 1:
+            minrbar = np.minimum(minrbar, rhobarold)
+        conda = np.maximum(maxrbar, rhotemp) / np.minimum(minrbar, rhotemp)
+
+        normar = np.abs(zetabar)
+        normx = _column_norm(x)
+
+        test1 = normr / normb
+        denom = norma * normr
+        test2 = np.divide(normar, denom, out=np.full(k, np.inf), where=denom != 0)
+        test3 = 1 / conda
+        t1 = test1 / (1 + norma * normx / normb)
+        rtol = btol + atol * norma * normx / normb
+
+        istop = np.zeros(k, dtype=np.int64)
+        istop[:] = np.where(itn >= maxiter, 7, istop)
+        istop[:] = np.where(1 + test3 <= 1, 6, istop)
+        istop[:] = np.where(1 + test2 <= 1, 5, istop)
+        istop[:] = np.where(1 + t1 <= 1, 4, istop)
+        istop[:] = np.where(test3 <= ctol, 3, istop)
+        istop[:] = np.where(test2 <= atol, 2, istop)
+        istop[:] = np.where(test1 <= rtol, 1, istop)
+
+        done = istop > 0
+        if np.any(done):
+            finished = active[done]
+            x_out[:, finished] = x[:, done]
+            istop_out[finished] = istop[done]
+            iter_out[finished] = itn
+            keep = ~done
+            active = active[keep]
+            k = active.shape[0]
+            u, v, h, hbar, x = (
+                u[:, keep],
+                v[:, keep],
+                h[:, keep],
+                hbar[:, keep],
+                x[:, keep],
+            )
+            alpha, zetabar, alphabar = alpha[keep], zetabar[keep], alphabar[keep]
+            rho, rhobar, cbar, sbar = rho[keep], rhobar[keep], cbar[keep], sbar[keep]
+            betadd, betad, rhodold = betadd[keep], betad[keep], rhodold[keep]
+            tautildeold, thetatilde = tautildeold[keep], thetatilde[keep]
+            zeta, d, norma2, normb = zeta[keep], d[keep], norma2[keep], normb[keep]
+            maxrbar, minrbar = maxrbar[keep], minrbar[keep]
+    return BlockLSMRResult(x_out, istop_out, iter_out)
+
+
+def block_lsmr(
+    a: Any,
+    b: Float64Array,
+    *,
+    atol: float = 1e-6,
+    btol: float = 1e-6,
+    conlim: float = 1e8,
+    maxiter: int | None = None,
+    block_size: int | None = BLOCK_LSMR_BLOCK_SIZE,
+    n_jobs: int | None = 1,
+) -> BlockLSMRResult:
+    r"""
+    Solve least squares problems with many right-hand sides using LSMR
+
+    Parameters
+    ----------
+    a : {sparse matrix, ndarray}
+        Regressor matrix, (nobs, ncol)
+    b : ndarray
+        Right-hand sides, (nobs, nrhs)
+    atol : float
+        Stopping tolerance on the relative size of :math:`A^\prime r`
+    btol : float
+        Stopping tolerance on the relative size of the residual
+    conlim : float
+        Limit on the estimated condition number of ``a``
+    maxiter : int
+        Maximum number of iterations. Default is min(nobs, ncol).
+    block_size : int
+        Number of right-hand sides advanced together. If None, all
+        right-hand sides are solved in a single block.
+    n_jobs : {int, None}
+        Number of threads used to solve blocks in parallel. Results do not
+        depend on the number of threads. See resolve_n_jobs.
+
+    Returns
+    -------
+    BlockLSMRResult
+        Solutions, termination codes and iteration counts
+
+    Notes
+    -----
+    Each right-hand side follows the recurrences of
+    scipy.sparse.linalg.lsmr, including its stopping rules, so that the
+    solution and the number of iterations match solving each column
+    separately. Columns are advanced together so that each iteration uses
+    one sparse matrix-matrix product with :math:`A` and one with
+    :math:`A^\prime` in place of one matrix-vector product per column.
+    Convergence is tracked for each column and converged columns are
+    removed from the active block.
+    """
+    b = np.asarray(b, dtype=float)
+    if b.ndim != 2:
+        raise ValueError("b must be 2-dimensional")
+    nrhs = b.shape[1]
+    maxiter = min(a.shape) if maxiter is None else int(maxiter)
+    if sp.issparse(a):
+        # Row-major storage is faster for products with dense blocks
+        at = sp.csr_matrix(a.T)
+        a = sp.csr_matrix(a)
+    else:
+        at = a.T
+    block_size = max(nrhs, 1) if block_size is None else int(block_size)
+    if block_size < 1:
+        raise ValueError("block_size must be a positive integer")
+
+    def _solve(i: int) -> BlockLSMRResult:
+        return _block_lsmr(a, at, b[:, i : i + block_size], atol, btol, conlim, maxiter)
+
+    results = parallel_map(_solve, list(range(0, nrhs, block_size)), n_jobs)
+    if not results:
+        empty = np.empty(0, dtype=np.int64)
+        return BlockLSMRResult(np.zeros((a.shape[1], 0)), empty, empty.copy())
+    return BlockLSMRResult(
+        np.hstack([res.x for res in results]),
+        np.concatenate([res.istop for res in results]),
+        np.concatenate([res.iterations for res in results]),
+    )
+
+
+def column_lsmr(
+    a: Any,
+    b: Float64Array,
+    *,
+    n_jobs: int | None = 1,
+    **lsmr_options: Any,
+) -> Float64Array:
+    """
+    Solve least squares problems column-by-column using LSMR
+
+    Parameters
+    ----------
+    a : {sparse matrix, ndarray}
+        Regressor matrix, (nobs, ncol)
+    b : ndarray
+        Right-hand sides, (nobs, nrhs)
+    n_jobs : {int, None}
+        Number of threads used to solve columns in parallel. Results do not
+        depend on the number of threads. See resolve_n_jobs.
+    **lsmr_options
+        Options passed to scipy.sparse.linalg.lsmr
+
+    Returns
+    -------
+    ndarray
+        Least squares solutions, (ncol, nrhs)
+    """
+
+    def _solve(i: int) -> Float64Array:
+        return lsmr(a, b[:, i], **lsmr_options)[0]
+
+    solutions = parallel_map(_solve, list(range(b.shape[1])), n_jobs)
+    if not solutions:
+        return np.zeros((a.shape[1], 0))
+    return np.column_stack(solutions)
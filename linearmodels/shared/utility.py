@@ -10,6 +10,8 @@ from collections.abc import (
     Sequence,
     ValuesView,
 )
+import copy
+from functools import cached_property
 from typing import Any, Callable, Protocol, TypeVar, cast
 
 import numpy as np
@@ -145,6 +147,32 @@ class AttrDict(MutableMapping):
         return self.__private_dict__.__iter__()
 
 
+_T = TypeVar("_T")
+
+
+def copy_without_cache(obj: _T) -> _T:
+    """
+    Shallow copy of an object that discards the values of cached properties
+
+    Parameters
+    ----------
+    obj : object
+        Object to copy
+
+    Returns
+    -------
+    object
+        Shallow copy of obj where all cached properties are recomputed when
+        next accessed
+    """
+    out = copy.copy(obj)
+    for klass in type(obj).__mro__:
+        for name, attr in vars(klass).items():
+            if isinstance(attr, cached_property):
+                out.__dict__.pop(name, None)
+    return out
+
+
 def ensure_unique_column(col_name: str, df: DataFrame, addition: str = "_") -> str:
     while col_name in df:
         col_name = addition + col_name + addition
@@ -6,9 +6,11 @@ from numpy import asarray, empty, eye, ndarray, ones, sqrt, vstack, zeros
 from numpy.linalg import inv
 
 from linearmodels.asset_pricing.covariance import _HACMixin
-from linearmodels.iv.covariance import cov_cluster
-from linearmodels.panel.covariance import cluster_union
-from linearmodels.shared.covariance import group_debias_coefficient
+from linearmodels.shared.covariance import (
+    cluster_structures,
+    cluster_subsets,
+    cov_cluster_multiway,
+)
 from linearmodels.shared.utility import AttrDict
 from linearmodels.system._utility import (
     LinearConstraint,
@@ -20,7 +22,7 @@ from linearmodels.typing import Float64Array, IntArray
 
 CLUSTERS_FORMAT = """\
 clusters must be an ndarray with as shape (nobs, ncluster) where ncluster is the \
-number of clustering variables.  Clustering is only supported in 1 or 2 dimensions.
+number of clustering variables.
 """
 
 
@@ -412,9 +414,13 @@ class ClusteredCovariance(HeteroskedasticCovariance):
         Constraints used in estimation, if any
     clusters : ndarray
         Optional array of cluster id.  Must be integer valued, and have shape
-        (nobs, ncluster) where ncluster is 1 or 2.
+        (nobs, ncluster) where ncluster is 1 or more.
     group_debias : bool
         Flag indicating whether to debias by the number of groups.
+    psd_correction : bool
+        Flag indicating whether to replace any negative eigenvalues of the
+        multi-way score covariance by 0 to ensure that the covariance is
+        positive semi-definite.
 
     Notes
     -----
@@ -456,6 +462,7 @@ class ClusteredCovariance(HeteroskedasticCovariance):
         constraints: LinearConstraint | None = None,
         clusters: IntArray | None = None,
         group_debias: bool = False,
+        psd_correction: bool = False,
     ) -> None:
         super().__init__(
             x,
@@ -467,6 +474,7 @@ class ClusteredCovariance(HeteroskedasticCovariance):
             constraints=constraints,
         )
         self._group_debias = group_debias
+        self._psd_correction = bool(psd_correction)
         self._nclusters: list[int] = []
         self._clusters = self._check_clusters(clusters)
         self._str_extra["Number of Grouping Variables"] = self._clusters.shape[1]
@@ -486,46 +494,32 @@ class ClusteredCovariance(HeteroskedasticCovariance):
         elif _clusters.ndim == 1:
             _clusters = _clusters[:, None]
         shape = _clusters.shape
-        if shape[0] != self._eps.shape[0] or not 1 <= shape[1] <= 2:
+        if shape[0] != self._eps.shape[0] or shape[1] < 1:
             raise ValueError(CLUSTERS_FORMAT, ValueError)
-        from pandas import DataFrame
-
-        df = DataFrame(_clusters)
-        nunique = df.nunique()
-        if _clusters.shape[1] == 2:
-            both = df.groupby([0, 1]).ngroups
-            if both == nunique.max():
+        structures = cluster_structures(_clusters)
+        nunique = [structure.ngroups for structure in structures]
+        for subset, structure in zip(cluster_subsets(shape[1]), structures):
+            if len(subset) != 2:
+                continue
+            if structure.ngroups == max(nunique[subset[0]], nunique[subset[1]]):
                 raise ValueError(
                     "clusters must be non-nested. You must drop nested "
                     "the nested cluster before computing the clustered"
                     "covariance."
                 )
-        self._nclusters = list(nunique)
+        self._nclusters = nunique[: shape[1]]
         return _clusters
 
     def _xeex(self) -> Float64Array:
         if self._clusters.shape[1] == 0:
             # Heteroskedastic but not clustered
             return super()._xeex()
-        elif self._clusters.shape[1] == 1:
-            s = cov_cluster(self._moments, self._clusters[:, 0])
-            if self._group_debias:
-                s *= group_debias_coefficient(self._clusters[:, 0])
-            return s
-
-        else:
-            xeex0 = cov_cluster(self._moments, self._clusters[:, 0])
-            xeex1 = cov_cluster(self._moments, self._clusters[:, 1])
-
-            clusters01 = cluster_union(self._clusters)
-            xeex01 = cov_cluster(self._moments, clusters01)
-
-            if self._group_debias:
-                xeex0 *= group_debias_coefficient(self._clusters[:, 0])
-                xeex1 *= group_debias_coefficient(self._clusters[:, 1])
-                xeex01 *= group_debias_coefficient(clusters01)
-
-            return xeex0 + xeex1 - xeex01
+        return cov_cluster_multiway(
+            self._moments,
+            self._clusters,
+            group_debias=self._group_debias,
+            psd=self._psd_correction,
+        )
 
     @property
     def cov_config(self) -> AttrDict:
@@ -533,6 +527,7 @@ class ClusteredCovariance(HeteroskedasticCovariance):
         out = AttrDict([(k, v) for k, v in self._cov_config.items()])
         out["clusters"] = self._clusters
         out["group_debias"] = self._group_debias
+        out["psd_correction"] = self._psd_correction
         return out
 
 
@@ -813,6 +813,7 @@ class _SystemModelBase:
         results["wresid"] = results.resid
         results["cov_estimator"] = cov_est
         results["cov_config"] = cov_est.cov_config
+        results["cov_inputs"] = AttrDict(method="ols", beta=beta, eps=eps, sigma=sigma)
         individual = results["individual"]
         r2s = [individual[eq].r2 for eq in individual]
         results["system_r2"] = self._system_r2(eps, sigma, "ols", False, debiased, r2s)
@@ -1138,6 +1139,17 @@ class _SystemModelBase:
         results["wresid"] = wresid
         results["cov_estimator"] = cov_est
         results["cov_config"] = cov_est.cov_config
+        results["cov_inputs"] = AttrDict(
+            method="gls",
+            beta=beta,
+            sigma=sigma,
+            full_sigma=full_sigma,
+            est_sigma=est_sigma,
+            gls_eps=gls_eps.T.ravel(),
+            eps=eps.T.ravel(),
+            full_cov=full_cov,
+            iter_count=iter_count,
+        )
         individual = results["individual"]
         r2s = [individual[eq].r2 for eq in individual]
         results["system_r2"] = self._system_r2(
@@ -1212,6 +1224,51 @@ class _SystemModelBase:
 class _LSSystemModelBase(_SystemModelBase):
     """Base class for least-squares-based system estimators"""
 
+    def _update_cov(
+        self, cov_inputs: AttrDict, cov_type: str, **cov_config: bool
+    ) -> SystemResults:
+        """
+        Construct results using a different covariance estimator
+
+        Parameters
+        ----------
+        cov_inputs : AttrDict
+            Parameters, residuals and residual covariances from estimation
+        cov_type : str
+            Name of the covariance estimator to use
+        **cov_config
+            Additional covariance options
+
+        Returns
+        -------
+        SystemResults
+            Estimation results using the new covariance estimator
+        """
+        cov_type = cov_type.lower()
+        if cov_type not in COV_TYPES:
+            raise ValueError(f"Unknown cov_type: {cov_type}")
+        cov_type = COV_TYPES[cov_type]
+        if cov_inputs.method == "ols":
+            return self._multivariate_ls_finalize(
+                cov_inputs.beta,
+                cov_inputs.eps,
+                cov_inputs.sigma,
+                cov_type,
+                **cov_config,
+            )
+        return self._gls_finalize(
+            cov_inputs.beta,
+            cov_inputs.sigma,
+            cov_inputs.full_sigma,
+            cov_inputs.est_sigma,
+            cov_inputs.gls_eps,
+            cov_inputs.eps,
+            cov_inputs.full_cov,
+            cov_type,
+            cov_inputs.iter_count,
+            **cov_config,
+        )
+
     def fit(
         self,
         *,
@@ -1249,8 +1306,8 @@ class _LSSystemModelBase(_SystemModelBase):
             * "robust", "heteroskedastic" - Heteroskedasticity robust
               covariance estimator
             * "kernel" - Allows for heteroskedasticity and autocorrelation
-            * "clustered" - Allows for 1 and 2-way clustering of errors
-              (Rogers).
+            * "clustered" - Allows for 1, 2 and multi-way clustering of
+              errors (Rogers, Cameron, Gelbach and Miller).
 
         **cov_config
             Additional parameters to pass to covariance estimator. All
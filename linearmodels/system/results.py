@@ -215,12 +215,64 @@ class SystemResults(_CommonResults):
         if results.constraints is not None:
             self._num_constraints = str(results.constraints.r.shape[0])
         self._weight_estimtor = results.get("weight_estimator", None)
+        self._cov_inputs = results.get("cov_inputs", None)
 
     @property
     def model(self) -> linearmodels.system.model.IV3SLS:
         """Model used in estimation"""
         return self._model
 
+    def with_cov(self, cov_type: str, **cov_config: bool | float) -> SystemResults:
+        """
+        Results with a different parameter covariance estimator
+
+        Parameters
+        ----------
+        cov_type : str
+            Name of covariance estimator. See the model's ``fit`` method for
+            the supported estimators.
+        **cov_config
+            Additional covariance-specific options. See the model's ``fit``
+            method for details.
+
+        Returns
+        -------
+        SystemResults
+            Results that are identical except for the parameter covariance
+            and the statistics that depend on it.
+
+        Notes
+        -----
+        The results are constructed from the parameters, residuals and
+        residual covariance estimated when fitting the model so that
+        parameters are not re-estimated.
+
+        ``debiased`` cannot be changed since it affects the estimated
+        residual covariance and so the GLS parameter estimates.
+
+        Examples
+        --------
+        >>> res = mod.fit(cov_type="unadjusted")
+        >>> res_robust = res.with_cov("robust")
+        >>> res_kernel = res.with_cov("kernel", kernel="bartlett", bandwidth=4)
+        """
+        if self._cov_inputs is None:
+            raise NotImplementedError(
+                "Changing the covariance estimator is not supported for GMM "
+                "estimators since the weighting matrix affects the parameter "
+                "estimates. Use fit to re-estimate the model."
+            )
+        cov_config = dict(cov_config)
+        debiased = bool(cov_config.pop("debiased", self._debiased))
+        if debiased != self._debiased:
+            raise ValueError(
+                "debiased must match the value used when fitting the model "
+                "since it affects the estimated residual covariance."
+            )
+        return self._model._update_cov(
+            self._cov_inputs, cov_type, debiased=debiased, **cov_config
+        )
+
     @property
     def equations(self) -> AttrDict:
         """Individual equation results"""
@@ -17,12 +17,16 @@ from linearmodels.iv.absorbing import (
     _VARIABLE_CACHE,
     AbsorbingLS,
     AbsorbingRegressor,
+    DiskCache,
     Interaction,
+    MemoryCache,
     category_continuous_interaction,
     category_interaction,
     category_product,
     clear_cache,
+    get_cache,
     lsmr_annihilate,
+    set_cache,
 )
 from linearmodels.iv.model import _OLS
 from linearmodels.iv.results import AbsorbingLSResults, OLSResults
@@ -361,13 +365,13 @@ def test_category_product_not_cat(random_gen):
 
 def test_category_interaction():
     c = pd.Series(pd.Categorical([0, 0, 0, 1, 1, 1]))
-    actual = category_interaction(c, precondition=False).A
+    actual = category_interaction(c, precondition=False).toarray()
     expected = np.zeros((6, 2))
     expected[:3, 0] = 1.0
     expected[3:, 1] = 1.0
     assert_allclose(actual, expected)
 
-    actual = category_interaction(c, precondition=True).A
+    actual = category_interaction(c, precondition=True).toarray()
     cond = np.sqrt((expected**2).sum(0))
     expected /= cond
     assert_allclose(actual, expected)
@@ -381,12 +385,12 @@ def test_category_continuous_interaction():
     expected[:3, 0] = v[:3]
     expected[3:, 1] = v[3:]
 
-    assert_allclose(actual.A, expected)
+    assert_allclose(actual.toarray(), expected)
 
     actual = category_continuous_interaction(c, v, precondition=True)
     cond = np.sqrt((expected**2).sum(0))
     expected /= cond
-    assert_allclose(actual.A, expected)
+    assert_allclose(actual.toarray(), expected)
 
 
 def test_category_continuous_interaction_interwoven():
@@ -396,7 +400,7 @@ def test_category_continuous_interaction_interwoven():
     expected = np.zeros((6, 2))
     expected[::2, 0] = v[::2]
     expected[1::2, 1] = v[1::2]
-    assert_allclose(actual.A, expected)
+    assert_allclose(actual.toarray(), expected)
 
 
 def test_interaction_cat_only(cat):
@@ -406,7 +410,7 @@ def test_interaction_cat_only(cat):
     expected = category_interaction(category_product(cat), precondition=False)
     actual = interact.sparse
     assert isinstance(actual, csc_matrix)
-    assert_allclose(expected.A, actual.A)
+    assert_allclose(expected.toarray(), actual.toarray())
 
 
 def test_interaction_cont_only(cont):
@@ -416,7 +420,7 @@ def test_interaction_cont_only(cont):
     expected = cont.to_numpy()
     actual = interact.sparse
     assert isinstance(actual, csc_matrix)
-    assert_allclose(expected, actual.A)
+    assert_allclose(expected, actual.toarray())
 
 
 def test_interaction_cat_cont(cat, cont):
@@ -424,7 +428,7 @@ def test_interaction_cat_cont(cat, cont):
     assert interact.nobs == cat.shape[0]
     assert_frame_equal(cat, interact.cat)
     assert_frame_equal(cont, interact.cont)
-    base = category_interaction(category_product(cat), precondition=False).A
+    base = category_interaction(category_product(cat), precondition=False).toarray()
     expected = []
     for i in range(cont.shape[1]):
         element = base.copy()
@@ -433,13 +437,13 @@ def test_interaction_cat_cont(cat, cont):
     expected = np.column_stack(expected)
     actual = interact.sparse
     assert isinstance(actual, csc_matrix)
-    assert_allclose(expected, interact.sparse.A)
+    assert_allclose(expected, interact.sparse.toarray())
 
 
 def test_interaction_from_frame(cat, cont):
     base = Interaction(cat=cat, cont=cont)
     interact = Interaction.from_frame(pd.concat([cat, cont], axis=1))
-    assert_allclose(base.sparse.A, interact.sparse.A)
+    assert_allclose(base.sparse.toarray(), interact.sparse.toarray())
 
 
 def test_interaction_cat_bad_nobs():
@@ -458,7 +462,7 @@ def test_empty_interaction():
 def test_interaction_cat_cont_convert(cat, cont):
     base = Interaction(cat, cont)
     interact = Interaction(cat.to_numpy(), cont)
-    assert_allclose(base.sparse.A, interact.sparse.A)
+    assert_allclose(base.sparse.toarray(), interact.sparse.toarray())
 
 
 def test_absorbing_regressors(cat, cont, interact, weights):
@@ -486,7 +490,7 @@ def test_absorbing_regressors(cat, cont, interact, weights):
     assert expected.shape == actual.shape
     assert_array_equal(expected.indptr, actual.indptr)
     assert_array_equal(expected.indices, actual.indices)
-    assert_allclose(expected.A, actual.A)
+    assert_allclose(expected.toarray(), actual.toarray())
     assert expected_rank == rank
 
 
@@ -532,11 +536,11 @@ def test_against_ols(ols_data):
         if ols_data.absorb.cat.shape[1] > 0:
             dummies = dummy_matrix(ols_data.absorb.cat, precondition=False)[0]
             assert isinstance(dummies, sp.csc_matrix)
-            absorb.append(dummies.A)
+            absorb.append(dummies.toarray())
         has_dummy = ols_data.absorb.cat.shape[1] > 0
     if ols_data.interactions is not None:
         for interact in ols_data.interactions:
-            absorb.append(interact.sparse.A)
+            absorb.append(interact.sparse.toarray())
     _x = ols_data.x
     if absorb:
         absorb = np.column_stack(absorb)
@@ -610,6 +614,7 @@ def assert_results_equal(
         "model",
         "f_statistic",
         "wald_test",
+        "with_cov",
         "method",
         "kappa",
     ]
@@ -755,3 +760,143 @@ def test_lsmr_annihilate_empty():
     y = np.empty((1000, 0))
     y_out = lsmr_annihilate(x, y)
     assert y_out.shape == y.shape
+
+
+@pytest.mark.parametrize("method", ["ap", "irons-tuck", "cg"])
+@pytest.mark.parametrize("weighted", [True, False])
+def test_iterative_absorb_methods(random_gen, method, weighted):
+    nobs = 2000
+    cats = pd.DataFrame(
+        {
+            "a": pd.Categorical(random_gen.randint(0, 50, size=nobs)),
+            "b": pd.Categorical(random_gen.randint(0, 20, size=nobs)),
+        }
+    )
+    x = pd.DataFrame(random_gen.standard_normal((nobs, 2)), columns=["x0", "x1"])
+    y = pd.Series(x.sum(1) + random_gen.standard_normal(nobs), name="y")
+    w = random_gen.chisquare(5, size=nobs) / 5 if weighted else None
+    res = AbsorbingLS(y, x, absorb=cats, weights=w).fit(
+        method=method, absorb_options={"tol": 1e-12}
+    )
+    expected = AbsorbingLS(y, x, absorb=cats, weights=w).fit(
+        method="lsmr", absorb_options={"atol": 1e-12, "btol": 1e-12}
+    )
+    assert_allclose(res.params, expected.params, rtol=1e-6)
+    assert res.absorb_iterations >= 1
+    assert res.absorb_tolerance <= 1e-12
+    assert expected.absorb_iterations is None
+
+
+def test_iterative_absorb_method_continuous(random_gen):
+    nobs = 500
+    absorb = pd.DataFrame(
+        {
+            "a": pd.Categorical(random_gen.randint(0, 10, size=nobs)),
+            "c": random_gen.standard_normal(nobs),
+        }
+    )
+    x = pd.DataFrame(random_gen.standard_normal((nobs, 2)))
+    y = pd.Series(random_gen.standard_normal(nobs))
+    with pytest.raises(RuntimeError, match="iterative demeaning"):
+        AbsorbingLS(y, x, absorb=absorb).fit(method="cg")
+
+
+def test_memory_cache_lru():
+    cache = MemoryCache(max_bytes=3 * 800)
+    values = [np.full((100, 1), float(i)) for i in range(4)]
+    for i in range(3):
+        cache.put("x", str(i), values[i])
+    assert cache.get("x", "0") is values[0]
+    cache.put("x", "3", values[3])
+    stats = cache.statistics
+    assert stats.evictions == 1
+    assert stats.entries == 3
+    assert stats.nbytes == 3 * 800
+    assert cache.get("x", "1") is None
+    assert cache.get("x", "0") is values[0]
+    stats = cache.statistics
+    assert stats.hits == 2
+    assert stats.misses == 1
+    cache.put("y", "0", np.empty((1000, 1)))
+    assert "y" not in cache
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.statistics.entries == 0
+    cache.reset_statistics()
+    assert cache.statistics.hits == 0
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=2 * 1000)
+    values = np.arange(100.0)[:, None]
+    cache.put(("a", "b"), "digest", values)
+    other = DiskCache(tmp_path)
+    cached = other.get(("a", "b"), "digest")
+    assert isinstance(cached, np.memmap)
+    assert_array_equal(cached, values)
+    assert other.get(("a", "c"), "digest") is None
+    assert other.statistics.hits == 1
+    assert other.statistics.misses == 1
+    cache.put(("a", "c"), "digest", values)
+    cache.put(("a", "d"), "digest", values)
+    assert cache.statistics.evictions >= 1
+    assert cache.statistics.nbytes <= 2 * 1000
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("backend", ["memory", "disk"])
+def test_lsmr_annihilate_cache(backend, tmp_path):
+    rs = np.random.RandomState(0)
+    cat = pd.Series(pd.Categorical(rs.randint(0, 10, 500)))
+    x = csc_matrix(category_interaction(cat))
+    y = rs.standard_normal((500, 3))
+    cache = MemoryCache() if backend == "memory" else DiskCache(tmp_path)
+    direct = lsmr_annihilate(x, y, x_hash="key", cache=cache)
+    assert cache.statistics.misses == 3
+    cached = lsmr_annihilate(x, y, x_hash="key", cache=cache)
+    assert cache.statistics.hits == 3
+    assert_allclose(direct, cached)
+    previous = set_cache(cache)
+    try:
+        assert get_cache() is cache
+        lsmr_annihilate(x, y, x_hash="key")
+        assert cache.statistics.hits == 6
+    finally:
+        set_cache(previous)
+    with pytest.raises(TypeError):
+        set_cache({})
+
+
+def test_lsmr_annihilate_block():
+    rs = np.random.RandomState(0)
+    cats = [pd.Series(pd.Categorical(rs.randint(0, 20, 1000))) for _ in range(2)]
+    x = sp.hstack([category_interaction(c) for c in cats]).tocsc()
+    y = rs.standard_normal((1000, 20))
+    block = lsmr_annihilate(x, y, use_cache=False, block=True)
+    direct = lsmr_annihilate(x, y, use_cache=False, block=False)
+    default = lsmr_annihilate(x, y, use_cache=False)
+    assert_allclose(block, direct, rtol=1e-8, atol=1e-8)
+    assert_allclose(default, block)
+    with pytest.raises(ValueError, match="damp"):
+        lsmr_annihilate(x, y, use_cache=False, block=True, damp=1.0)
+
+
+@pytest.mark.parametrize("block", [False, True])
+def test_lsmr_annihilate_n_jobs(block):
+    rs = np.random.RandomState(0)
+    cats = [pd.Series(pd.Categorical(rs.randint(0, 20, 1000))) for _ in range(2)]
+    x = sp.hstack([category_interaction(c) for c in cats]).tocsc()
+    y = rs.standard_normal((1000, 40))
+    serial = lsmr_annihilate(x, y, use_cache=False, block=block)
+    parallel = lsmr_annihilate(x, y, use_cache=False, block=block, n_jobs=3)
+    assert_array_equal(serial, parallel)
+
+
+def test_fit_n_jobs():
+    gen = generate_data(2, True, 2, factor_format="pandas", ncont=0)
+    mod = AbsorbingLS(gen.y, gen.x, absorb=gen.absorb)
+    res = mod.fit(method="lsmr", use_cache=False)
+    mod = AbsorbingLS(gen.y, gen.x, absorb=gen.absorb)
+    res_par = mod.fit(method="lsmr", use_cache=False, n_jobs=-1)
+    assert_series_equal(res.params, res_par.params, check_exact=True)
@@ -42,6 +42,21 @@ def data():
 def test_cov_kernel():
     with pytest.raises(ValueError):
         cov_kernel(np.arange(100), 1 - np.arange(101) / 101)
+    with pytest.raises(ValueError, match="method must be"):
+        cov_kernel(np.ones((100, 1)), np.ones(3), method="other")
+
+
+@pytest.mark.parametrize("nlags", [1, 2, 10, 31, 32, 100, 500])
+@pytest.mark.parametrize("nobs", [500, 1001])
+def test_cov_kernel_fft(nobs, nlags):
+    rs = np.random.RandomState(nobs + nlags)
+    z = rs.standard_normal((nobs, 4))
+    w = kernel_weight_quadratic_spectral(nlags, nobs - 1)[:nlags]
+    direct = cov_kernel(z, w, method="direct")
+    fft = cov_kernel(z, w, method="fft")
+    assert_allclose(fft, direct, rtol=1e-10, atol=1e-12)
+    assert_allclose(fft, fft.T)
+    assert_allclose(cov_kernel(z, w), direct, rtol=1e-10, atol=1e-12)
 
 
 def test_kernel_bartlett():
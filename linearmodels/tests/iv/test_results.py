@@ -22,7 +22,11 @@ def model(request):
 
 def result_checker(res):
     for attr in dir(res):
-        if attr.startswith("_") or attr in ("test_linear_constraint", "wald_test"):
+        if attr.startswith("_") or attr in (
+            "test_linear_constraint",
+            "wald_test",
+            "with_cov",
+        ):
             continue
         print(attr)
         if attr == "summary":
@@ -96,3 +100,36 @@ def test_predict_no_selection(data, model):
     res = mod.fit()
     with pytest.raises(ValueError):
         res.predict(fitted=False, idiosyncratic=False, missing=True)
+
+
+@pytest.mark.parametrize("debiased", [True, False])
+@pytest.mark.parametrize(
+    "cov_type, cov_config",
+    [
+        ("robust", {}),
+        ("clustered", "clusters"),
+        ("kernel", {"bandwidth": 4}),
+        ("unadjusted", {}),
+    ],
+)
+def test_with_cov(data, cov_type, cov_config, debiased):
+    if cov_config == "clusters":
+        cov_config = {"clusters": data.clusters}
+    for model_type in (IV2SLS, IVLIML):
+        mod = model_type(data.dep, data.exog, data.endog, data.instr)
+        base = mod.fit(cov_type="unadjusted")
+        expected = mod.fit(cov_type=cov_type, debiased=debiased, **cov_config)
+        res = base.with_cov(cov_type, debiased=debiased, **cov_config)
+        assert res is not base
+        assert base.cov_type == "unadjusted"
+        assert res.cov_type == expected.cov_type
+        assert res.cov_config == expected.cov_config
+        assert_allclose(res.cov, expected.cov, rtol=1e-10)
+        assert_allclose(res.pvalues, expected.pvalues)
+        assert_allclose(res.f_statistic.stat, expected.f_statistic.stat)
+
+
+def test_with_cov_gmm(data):
+    res = IVGMM(data.dep, data.exog, data.endog, data.instr).fit()
+    with pytest.raises(NotImplementedError):
+        res.with_cov("robust")
@@ -11,6 +11,7 @@ import pytest
 
 from linearmodels.panel.data import PanelData, _Panel
 from linearmodels.panel.model import PanelOLS
+from linearmodels.panel.utility import FixedEffectsAbsorber
 from linearmodels.shared.utility import panel_to_frame
 from linearmodels.tests.panel._utility import MISSING_XARRAY, datatypes, generate_data
 
@@ -872,3 +873,135 @@ def test_fake_panel_properties(mi_df):
     assert_index_equal(panel.minor_axis, mi_df.index.levels[0])
     df = panel.to_frame()
     assert_frame_equal(df, mi_df)
+
+
+@pytest.mark.parametrize("weighted", [True, False])
+def test_demean_array_engine_matches_groupby(mi_df, weighted, monkeypatch):
+    y = PanelData(mi_df)
+    weights = None
+    if weighted:
+        w = np.random.default_rng(0).chisquare(5, size=(y.dataframe.shape[0], 1)) / 5
+        weights = PanelData(DataFrame(w, index=y.index))
+    g = DataFrame(np.c_[y.entity_ids, y.time_ids], index=y.index)
+    fast = [
+        y.demean("entity", weights=weights),
+        y.demean("time", weights=weights),
+        y.general_demean(g, weights=weights),
+    ]
+    monkeypatch.setattr(PanelData, "_array_demean_values", lambda self, w: None)
+    slow = [
+        y.demean("entity", weights=weights),
+        y.demean("time", weights=weights),
+        y.general_demean(g, weights=weights),
+    ]
+    for f, s in zip(fast, slow):
+        assert_allclose(f.values2d, s.values2d, atol=1e-12)
+        assert_frame_equal(f.dataframe.iloc[:0], s.dataframe.iloc[:0])
+
+
+def test_demean_zero_weight_group_matches_groupby(mi_df, monkeypatch):
+    y = PanelData(mi_df)
+    w = np.ones((y.dataframe.shape[0], 1))
+    w[y.entity_ids.squeeze() == 0] = 0.0
+    weights = PanelData(DataFrame(w, index=y.index))
+    fast = y.demean("entity", weights=weights)
+    assert np.all(np.isnan(fast.values2d[y.entity_ids.squeeze() == 0]))
+    monkeypatch.setattr(PanelData, "_array_demean_values", lambda self, w: None)
+    slow = y.demean("entity", weights=weights)
+    assert_allclose(fast.values2d, slow.values2d)
+
+
+def test_general_demean_absorber(mi_df):
+    y = PanelData(mi_df)
+    groups = np.c_[y.entity_ids, y.time_ids]
+    absorber = FixedEffectsAbsorber(groups)
+    expected = y.general_demean(DataFrame(groups, index=y.index))
+    res = y.general_demean(absorber)
+    assert_allclose(res.values2d, expected.values2d)
+    assert_index_equal(res.index, y.index)
+    with pytest.raises(ValueError, match="weights cannot be used"):
+        y.general_demean(absorber, weights=y.copy())
+
+
+def test_from_array():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((3, 5, 11))
+    x[1, 2, 3] = np.nan
+    data = PanelData.from_array(x)
+    expected = PanelData(x)
+    assert np.shares_memory(data.values2d, x)
+    assert data.shape == expected.shape
+    assert data.vars == expected.vars
+    assert data.time == list(range(5))
+    assert data.entities == list(range(11))
+    assert_allclose(data.values3d, expected.values3d)
+    x[0, 0, 0] = 10.0
+    assert data.dataframe.iloc[0, 0] == 10.0
+
+    time = date_range("2000-01-01", periods=5)
+    named = PanelData.from_array(
+        x, var_names=["a", "b", "c"], entities=list("abcdefghijk"), time=time
+    )
+    assert named.vars == ["a", "b", "c"]
+    assert named.dataframe.loc[("a", time[0]), "a"] == 10.0
+    single = PanelData.from_array(x[0], var_name="y")
+    assert single.vars == ["y"]
+    assert single.shape == (1, 5, 11)
+    with pytest.raises(ValueError, match="2-d or 3-d"):
+        PanelData.from_array(x[0, 0])
+    with pytest.raises(ValueError, match="numeric or date-like"):
+        PanelData.from_array(x, time=list("abcde"))
+    with pytest.raises(ValueError, match="var_names"):
+        PanelData.from_array(x, var_names=["a"])
+
+
+def test_from_array_model():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((3, 7, 51))
+    mod = PanelOLS(
+        PanelData.from_array(x[0]),
+        PanelData.from_array(x[1:]),
+        entity_effects=True,
+        time_effects=True,
+    )
+    res = mod.fit(cov_type="clustered", cluster_entity=True)
+    expected = PanelOLS(
+        PanelData(x[0]), PanelData(x[1:]), entity_effects=True, time_effects=True
+    ).fit(cov_type="clustered", cluster_entity=True)
+    assert_allclose(res.params.values, expected.params.values)
+    assert_allclose(res.cov.values, expected.cov.values)
+
+
+def test_from_codes(mi_df):
+    expected = PanelData(mi_df)
+    index = expected.index
+    values = np.ascontiguousarray(expected.values2d)
+    data = PanelData.from_codes(
+        values,
+        np.asarray(index.codes[0], dtype=np.int64),
+        np.asarray(index.codes[1], dtype=np.int64),
+        var_names=expected.vars,
+        entities=index.levels[0],
+        time=index.levels[1],
+    )
+    assert np.shares_memory(data.values2d, values)
+    assert data.shape == expected.shape
+    assert_frame_equal(
+        data.dataframe, expected.dataframe, check_index_type=False, check_names=False
+    )
+    assert_allclose(data.values3d, expected.values3d)
+    assert_equal(data.entity_ids, expected.entity_ids)
+    assert_equal(data.time_ids, expected.time_ids)
+
+    codes = np.arange(values.shape[0])
+    single = PanelData.from_codes(values[:, 0], codes % 3, codes // 3)
+    assert single.vars == ["x"]
+    assert single.shape == (1, codes[-1] // 3 + 1, 3)
+    with pytest.raises(ValueError, match="integer array"):
+        PanelData.from_codes(values, codes.astype(float), codes)
+    with pytest.raises(ValueError, match="integer array"):
+        PanelData.from_codes(values, codes[1:], codes)
+    with pytest.raises(ValueError, match="codes must be between"):
+        PanelData.from_codes(values, codes, codes, entities=[0, 1])
+    with pytest.raises(ValueError, match="unique"):
+        PanelData.from_codes(values[:2], [0, 1], [0, 1], entities=[0, 0])
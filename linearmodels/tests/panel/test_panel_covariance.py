@@ -1,8 +1,11 @@
 from typing import NamedTuple
 
 import numpy as np
+from numpy.testing import assert_allclose
+import pandas as pd
 import pytest
 
+from linearmodels.iv.covariance import KERNEL_LOOKUP
 from linearmodels.panel.covariance import (
     ACCovariance,
     ClusteredCovariance,
@@ -11,6 +14,7 @@ from linearmodels.panel.covariance import (
     HeteroskedasticCovariance,
     HomoskedasticCovariance,
 )
+from linearmodels.shared.covariance import cov_kernel
 from linearmodels.typing import Float64Array, Int64Array
 
 
@@ -191,6 +195,21 @@ def test_clustered_covariance_smoke(panel_data) -> None:
     assert cov.shape == (panel_data.k, panel_data.k)
 
 
+def test_clustered_covariance_three_way(panel_data) -> None:
+    cov = ClusteredCovariance(
+        panel_data.y,
+        panel_data.x,
+        panel_data.params,
+        panel_data.entity_ids,
+        panel_data.time_ids,
+        extra_df=0,
+        clusters=panel_data.cluster5,
+        psd_correction=True,
+    ).cov
+    assert cov.shape == (panel_data.k, panel_data.k)
+    assert np.all(np.linalg.eigvalsh(cov) >= -1e-12)
+
+
 def test_clustered_covariance_error(panel_data) -> None:
     with pytest.raises(ValueError):
         ClusteredCovariance(
@@ -200,7 +219,7 @@ def test_clustered_covariance_error(panel_data) -> None:
             panel_data.entity_ids,
             panel_data.time_ids,
             extra_df=0,
-            clusters=panel_data.cluster5,
+            clusters=panel_data.cluster5[:, :, None] * np.ones((1, 1, 2)),
         )
 
     with pytest.raises(ValueError):
@@ -245,6 +264,39 @@ def test_driscoll_kraay_smoke(panel_data) -> None:
     assert cov.shape == (panel_data.k, panel_data.k)
 
 
+@pytest.mark.parametrize("offset", [0, 1000, -5, 0.5])
+def test_driscoll_kraay_time_scores(panel_data, offset) -> None:
+    # Missing time periods and non-code time ids
+    keep = panel_data.time_ids[:, 0] % 3 != 1
+    time_ids = panel_data.time_ids[keep] + offset
+    y, x = panel_data.y[keep], panel_data.x[keep]
+    cov_est = DriscollKraay(
+        y, x, panel_data.params, panel_data.entity_ids[keep], time_ids
+    )
+    xe = x * cov_est.eps
+    expected = pd.DataFrame(xe, index=time_ids.squeeze()).groupby(level=0).sum()
+    assert_allclose(cov_est.time_scores, expected.sort_index().to_numpy())
+
+
+def test_driscoll_kraay_reweight(panel_data) -> None:
+    args = (
+        panel_data.y,
+        panel_data.x,
+        panel_data.params,
+        panel_data.entity_ids,
+        panel_data.time_ids,
+    )
+    cov_est = DriscollKraay(*args, debiased=True)
+    base = cov_est.cov
+    reweighted = cov_est.reweight(kernel="qs", bandwidth=7)
+    assert reweighted.time_scores is cov_est.time_scores
+    direct = DriscollKraay(*args, debiased=True, kernel="qs", bandwidth=7)
+    assert_allclose(reweighted.cov, direct.cov)
+    assert not np.allclose(reweighted.cov, base)
+    assert_allclose(cov_est.cov, base)
+    assert_allclose(cov_est.reweight().cov, base)
+
+
 @pytest.mark.smoke
 def test_ac_covariance_smoke(panel_data) -> None:
     cov = ACCovariance(
@@ -275,6 +327,57 @@ def test_ac_covariance_smoke(panel_data) -> None:
     assert cov.shape == (panel_data.k, panel_data.k)
 
 
+def _ac_covariance_loop(cov_est, kernel, bandwidth):
+    # Per-entity reference implementation of the AC covariance
+    x = cov_est._x
+    nobs = x.shape[0]
+    xe = x * cov_est.eps
+    entity_ids = cov_est._entity_ids.squeeze()
+    time_ids = cov_est._time_ids.squeeze()
+    nperiods = np.unique(time_ids).shape[0]
+    bw = bandwidth
+    if bw is None:
+        bw = float(np.floor(4 * (nperiods / 100) ** (2 / 9)))
+    entities = np.unique(entity_ids)
+    xeex = np.zeros((x.shape[1], x.shape[1]))
+    for entity in entities:
+        sel = entity_ids == entity
+        _xe = xe[sel][np.argsort(time_ids[sel])]
+        _bw = min(_xe.shape[0] - 1.0, bw)
+        w = KERNEL_LOOKUP[kernel](_bw, _xe.shape[0] - 1)
+        xeex += cov_kernel(_xe, w, method="direct")
+    xeex /= entities.shape[0]
+    xeex *= cov_est._scale
+    xpxi = np.linalg.inv(x.T @ x / nobs)
+    out = (xpxi @ xeex @ xpxi) / nobs
+    return (out + out.T) / 2
+
+
+@pytest.mark.parametrize("kernel", ["bartlett", "parzen", "qs"])
+@pytest.mark.parametrize("bandwidth", [None, 0, 3, 12.5, 100])
+def test_ac_covariance_against_loop(kernel, bandwidth) -> None:
+    rs = np.random.RandomState(1234)
+    n, t, k = 40, 15, 3
+    entity_ids = np.repeat(np.arange(n), t)[:, None]
+    time_ids = np.tile(np.arange(t), n)[:, None]
+    # Unbalanced, unsorted panel including single-observation entities
+    keep = rs.random_sample(n * t) < 0.7
+    keep[entity_ids[:, 0] == 3] = False
+    keep[(entity_ids[:, 0] == 3) & (time_ids[:, 0] == 4)] = True
+    perm = rs.permutation(int(keep.sum()))
+    entity_ids = entity_ids[keep][perm]
+    time_ids = time_ids[keep][perm]
+    nobs = entity_ids.shape[0]
+    x = rs.standard_normal((nobs, k))
+    params = np.ones((k, 1))
+    y = x @ params + rs.standard_normal((nobs, 1))
+    cov_est = ACCovariance(
+        y, x, params, entity_ids, time_ids, kernel=kernel, bandwidth=bandwidth
+    )
+    expected = _ac_covariance_loop(cov_est, kernel, bandwidth)
+    assert_allclose(cov_est.cov, expected, rtol=1e-10)
+
+
 def test_covariance_manager() -> None:
     cm = CovarianceManager(
         "made-up-class", HomoskedasticCovariance, HeteroskedasticCovariance
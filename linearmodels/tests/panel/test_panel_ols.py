@@ -1079,18 +1079,15 @@ def test_cluster_smoke(data):
     mod.fit(cov_type="clustered", clusters=c2, debiased=False)
     mod.fit(cov_type="clustered", cluster_entity=True, clusters=c1, debiased=False)
     mod.fit(cov_type="clustered", cluster_time=True, clusters=c1, debiased=False)
-    with pytest.raises(ValueError):
-        mod.fit(cov_type="clustered", cluster_time=True, clusters=c2, debiased=False)
-    with pytest.raises(ValueError):
-        mod.fit(cov_type="clustered", cluster_entity=True, clusters=c2, debiased=False)
-    with pytest.raises(ValueError):
-        mod.fit(
-            cov_type="clustered",
-            cluster_entity=True,
-            cluster_time=True,
-            clusters=c1,
-            debiased=False,
-        )
+    mod.fit(cov_type="clustered", cluster_time=True, clusters=c2, debiased=False)
+    mod.fit(cov_type="clustered", cluster_entity=True, clusters=c2, debiased=False)
+    mod.fit(
+        cov_type="clustered",
+        cluster_entity=True,
+        cluster_time=True,
+        clusters=c1,
+        debiased=False,
+    )
     with pytest.raises(ValueError):
         clusters = c1.dataframe.iloc[: c1.dataframe.shape[0] // 2]
         mod.fit(cov_type="clustered", clusters=clusters, debiased=False)
@@ -1555,3 +1552,118 @@ def test_absorbed_with_weights(path):
             weights=data["rand"],
             drop_absorbed=True,
         ).fit(**fit_options)
+
+
+@pytest.mark.parametrize("demean_method", ["ap", "irons-tuck", "cg"])
+def test_demean_method(data, demean_method):
+    mod = PanelOLS(data.y, data.x, weights=data.w, other_effects=data.c)
+    res = mod.fit(
+        demean_method=demean_method, demean_options={"tol": 1e-12}, use_lsdv=False
+    )
+    res_lsdv = mod.fit(use_lsdv=True)
+    assert_allclose(res.params, res_lsdv.params, rtol=1e-6, atol=1e-8)
+    assert res.demean_iterations >= 1
+    assert res.demean_tolerance <= 1e-12
+    assert res_lsdv.demean_iterations is None
+    assert res_lsdv.demean_tolerance is None
+
+
+def test_demean_method_exceptions(data):
+    mod = PanelOLS(data.y, data.x, entity_effects=True, time_effects=True)
+    with pytest.raises(ValueError, match="demean_method must be"):
+        mod.fit(demean_method="unknown")
+    res = mod.fit(low_memory=True, demean_options={"max_iter": 2})
+    assert res.demean_iterations <= 2
+
+
+def test_joint_demean_matches_separate(data):
+    mod = PanelOLS(data.y, data.x, weights=data.w, entity_effects=True)
+    weights = mod.weights
+    wy, wx = mod._joint_demean(False, weights=weights)
+    expected_y = mod.dependent.demean("entity", weights=weights).values2d
+    expected_x = mod.exog.demean("entity", weights=weights).values2d
+    assert_allclose(wy, expected_y)
+    assert_allclose(wx, expected_x)
+
+
+@pytest.mark.filterwarnings("ignore::linearmodels.shared.exceptions.SingletonWarning")
+def test_absorber_reuse(data):
+    mod = PanelOLS(
+        data.y, data.x, weights=data.w, other_effects=data.c, singletons=False
+    )
+    absorber = mod.absorber
+    assert mod.absorber is absorber
+    res = mod.fit(demean_options={"tol": 1e-12})
+    mod2 = PanelOLS(
+        data.y,
+        data.x,
+        weights=data.w,
+        other_effects=data.c,
+        singletons=False,
+        absorber=absorber,
+    )
+    assert mod2.absorber is absorber
+    res2 = mod2.fit(demean_options={"tol": 1e-12})
+    assert_allclose(res.params, res2.params, rtol=1e-8)
+    assert_allclose(res.std_errors, res2.std_errors, rtol=1e-8)
+
+
+def test_absorber_one_and_two_way(data):
+    for effects in ({"entity_effects": True}, {"time_effects": True}):
+        mod = PanelOLS(data.y, data.x, **effects)
+        res = mod.fit()
+        res2 = PanelOLS(data.y, data.x, absorber=mod.absorber, **effects).fit()
+        assert_allclose(res.params, res2.params)
+    mod = PanelOLS(data.y, data.x, entity_effects=True, time_effects=True)
+    res = mod.fit()
+    mod2 = PanelOLS(
+        data.y, data.x, entity_effects=True, time_effects=True, absorber=mod.absorber
+    )
+    res2 = mod2.fit(demean_method="cg", demean_options={"tol": 1e-12})
+    assert_allclose(res.params, res2.params, rtol=1e-6)
+    assert res2.demean_iterations >= 1
+
+
+def test_absorber_mismatch(data):
+    mod = PanelOLS(data.y, data.x, entity_effects=True)
+    absorber = mod.absorber
+    with pytest.raises(ValueError, match="effects or sample"):
+        PanelOLS(
+            data.y, data.x, entity_effects=True, time_effects=True, absorber=absorber
+        )
+    with pytest.raises(ValueError, match="weights must be identical"):
+        PanelOLS(data.y, data.x, weights=data.w, entity_effects=True, absorber=absorber)
+    with pytest.raises(ValueError, match="models that have effects"):
+        PanelOLS(data.y, data.x, absorber=absorber)
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_lsmr_block_many_regressors(weighted):
+    data = generate_data(0, "pandas", ntk=(101, 5, 20))
+    weights = data.w if weighted else None
+    mod = PanelOLS(
+        data.y, data.x, weights=weights, entity_effects=True, time_effects=True
+    )
+    res = mod.fit()
+    res_lsmr = mod.fit(use_lsmr=True)
+    assert_results_equal(res, res_lsmr, strict=False)
+
+
+@pytest.mark.parametrize("ntk", [(101, 5, 3), (101, 5, 20)])
+def test_lsmr_n_jobs(ntk):
+    data = generate_data(0, "pandas", ntk=ntk)
+    mod = PanelOLS(data.y, data.x, entity_effects=True, time_effects=True)
+    res = mod.fit(use_lsmr=True)
+    res_par = mod.fit(use_lsmr=True, n_jobs=3)
+    pd.testing.assert_series_equal(res.params, res_par.params, check_exact=True)
+
+
+def test_three_way_clustering(data):
+    mod = PanelOLS(data.y, data.x, entity_effects=True)
+    clusters = PanelData(data.vc2).dataframe.copy()
+    clusters["third"] = np.arange(clusters.shape[0]) % 7
+    res = mod.fit(cov_type="clustered", clusters=clusters)
+    res_two = mod.fit(cov_type="clustered", clusters=clusters.iloc[:, :2])
+    assert not np.allclose(res.cov, res_two.cov)
+    res_psd = mod.fit(cov_type="clustered", clusters=clusters, psd_correction=True)
+    assert np.all(np.linalg.eigvalsh(res_psd.cov) >= -1e-12)
@@ -2,14 +2,21 @@ from itertools import product
 
 import numpy as np
 from numpy.testing import assert_allclose
-from pandas.testing import assert_series_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 import pytest
 from statsmodels.tools.tools import add_constant
 
 from linearmodels.datasets import wage_panel
 from linearmodels.iv.model import IV2SLS
 from linearmodels.panel.data import PanelData
-from linearmodels.panel.model import PanelOLS, PooledOLS, RandomEffects
+from linearmodels.panel.model import (
+    BetweenOLS,
+    FamaMacBeth,
+    FirstDifferenceOLS,
+    PanelOLS,
+    PooledOLS,
+    RandomEffects,
+)
 from linearmodels.panel.results import compare
 from linearmodels.tests.panel._utility import datatypes, generate_data
 
@@ -220,3 +227,114 @@ def test_wald_test(data, constraint_formula):
 
     with pytest.raises(ValueError):
         res.wald_test(restriction, np.zeros(2), formula=constraint_formula)
+
+
+WITH_COV_MODELS = {
+    "panel_ols": lambda y, x: PanelOLS(y, x, entity_effects=True),
+    "two_way": lambda y, x: PanelOLS(y, x, entity_effects=True, time_effects=True),
+    "pooled": PooledOLS,
+    "between": BetweenOLS,
+    "first_difference": lambda y, x: FirstDifferenceOLS(y, x.iloc[:, 1:]),
+    "random_effects": RandomEffects,
+}
+WITH_COV_CONFIGS = [
+    ("robust", {}),
+    ("clustered", {"cluster_entity": True}),
+    ("clustered", {"cluster_entity": True, "cluster_time": True}),
+    ("kernel", {"bandwidth": 3}),
+    ("autocorrelated", {}),
+]
+
+
+@pytest.mark.parametrize("model", list(WITH_COV_MODELS))
+@pytest.mark.parametrize("debiased", [True, False])
+def test_with_cov(data, model, debiased):
+    data = data.set_index(["nr", "year"])
+    dependent = data.lwage
+    exog = add_constant(data[["expersq", "married", "union"]])
+    mod = WITH_COV_MODELS[model](dependent, exog)
+    base = mod.fit()
+    for cov_type, cov_config in WITH_COV_CONFIGS:
+        try:
+            expected = mod.fit(cov_type=cov_type, debiased=debiased, **cov_config)
+        except (KeyError, ValueError):
+            with pytest.raises((KeyError, ValueError)):
+                base.with_cov(cov_type, debiased=debiased, **cov_config)
+            continue
+        res = base.with_cov(cov_type, debiased=debiased, **cov_config)
+        assert type(res) is type(base)
+        assert_allclose(res.cov, expected.cov, rtol=1e-10)
+        assert_allclose(res.pvalues, expected.pvalues, rtol=1e-8)
+        assert_allclose(res.f_statistic_robust.stat, expected.f_statistic_robust.stat)
+        assert res.summary.as_text() is not None
+        assert_allclose(res.params, base.params)
+    assert_allclose(base.cov, mod.fit().cov)
+
+
+def test_with_cov_fama_macbeth(data):
+    data = data.set_index(["nr", "year"])
+    dependent = data.lwage
+    exog = add_constant(data[["expersq", "married", "union"]])
+    mod = FamaMacBeth(dependent, exog)
+    base = mod.fit()
+    res = base.with_cov("kernel", bandwidth=2)
+    assert_allclose(res.cov, mod.fit(cov_type="kernel", bandwidth=2).cov)
+    assert_allclose(res.with_cov("robust").cov, base.cov)
+    with pytest.raises(ValueError, match="Unknown cov_type"):
+        base.with_cov("clustered")
+    with pytest.raises(ValueError, match="bandwidth and kernel"):
+        base.with_cov("kernel", clusters=np.ones(10))
+
+
+def test_with_cov_reuses_driscoll_kraay_scores(data):
+    data = data.set_index(["nr", "year"])
+    exog = add_constant(data[["expersq", "married", "union"]])
+    mod = PanelOLS(data.lwage, exog, entity_effects=True)
+    res = mod.fit(cov_type="kernel")
+    assert res.cov is not None
+    res_qs = res.with_cov("kernel", kernel="qs", bandwidth=3)
+    assert res_qs._cov_estimator.time_scores is res._cov_estimator.time_scores
+    assert res_qs._cov_estimator.xpxi is res._cov_estimator.xpxi
+    expected = mod.fit(cov_type="kernel", kernel="qs", bandwidth=3)
+    assert_allclose(res_qs.cov, expected.cov)
+
+
+KEEP_DATA_MODELS = dict(WITH_COV_MODELS, fama_macbeth=FamaMacBeth)
+
+
+@pytest.mark.parametrize("model", list(KEEP_DATA_MODELS))
+def test_keep_data(data, model):
+    data = data.set_index(["nr", "year"])
+    exog = add_constant(data[["expersq", "married", "union"]])
+    mod = KEEP_DATA_MODELS[model](data.lwage, exog)
+    cov_type = "robust" if model == "between" else "kernel"
+    full = mod.fit(cov_type=cov_type)
+    lean = mod.fit(cov_type=cov_type, keep_data=False)
+    assert lean._resids is None
+    assert lean._cov_estimator is None
+    assert_allclose(lean.params, full.params)
+    assert_allclose(lean.cov, full.cov)
+    assert lean.summary.as_text() is not None
+    assert_series_equal(lean.resids, full.resids)
+    assert_series_equal(lean.wresids, full.wresids)
+    assert_frame_equal(lean.fitted_values, full.fitted_values)
+    assert_frame_equal(lean.estimated_effects, full.estimated_effects)
+    assert_frame_equal(lean.idiosyncratic, full.idiosyncratic)
+    kwargs = dict(effects=True, idiosyncratic=True, missing=True)
+    assert_frame_equal(lean.predict(**kwargs), full.predict(**kwargs))
+    assert lean._resids is None
+
+    lean_robust = lean.with_cov("robust")
+    assert lean_robust._resids is None
+    assert_allclose(lean_robust.cov, full.with_cov("robust").cov)
+
+
+def test_keep_data_fit_options(data):
+    data = data.set_index(["nr", "year"])
+    exog = add_constant(data[["expersq", "married", "union"]])
+    mod = PanelOLS(data.lwage, exog, entity_effects=True)
+    options = dict(auto_df=False, count_effects=False, low_memory=True)
+    full = mod.fit(**options)
+    lean = mod.fit(keep_data=False, **options)
+    assert_allclose(lean.with_cov("robust").cov, full.with_cov("robust").cov)
+    assert_series_equal(lean.resids, full.resids)
@@ -8,10 +8,16 @@ from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
 
 from linearmodels.panel.utility import (
     AbsorbingEffectError,
+    FixedEffectsAbsorber,
     PanelModelData,
+    _py_group_sum,
     check_absorbed,
     dummy_matrix,
+    general_group_demean,
     generate_panel_data,
+    group_codes,
+    group_demean,
+    group_sum,
     in_2core_graph,
     in_2core_graph_slow,
     not_absorbed,
@@ -204,7 +210,7 @@ def test_preconditioner_sparse():
     val_cond, cond = preconditioner(values, copy=True)
     assert_allclose(np.sqrt((values.multiply(values)).sum(0).A1), cond)
     assert id(val_cond) != id(values)
-    assert_array_equal(orig.A, values.A)
+    assert_array_equal(orig.toarray(), values.toarray())
 
 
 def test_preconditioner_subclass():
@@ -271,3 +277,86 @@ def test_all_absorbed_exception():
     x = x_orig * 1e-32
     with pytest.raises(AbsorbingEffectError, match="All exog variables have been"):
         check_absorbed(x, ["a", "b", "c"], x_orig)
+
+
+def test_group_sum_python_fallback():
+    rs = np.random.RandomState(0)
+    values = rs.standard_normal((500, 3))
+    codes = rs.randint(0, 17, size=500)
+    expected = pd.DataFrame(values).groupby(codes).sum()
+    res = group_sum(values, codes, 17)
+    assert_allclose(res, np.asarray(expected))
+    py_res = _py_group_sum(values, codes.astype(np.int64), 17)
+    assert_allclose(py_res, res)
+
+
+def test_group_codes_sparse_ids():
+    groups = np.array([1000, 7, 7, 1000, -3])
+    codes, ngroups = group_codes(groups)
+    assert ngroups == 3
+    assert_array_equal(codes, [2, 1, 1, 2, 0])
+    codes, ngroups = group_codes(np.array([3, 0, 3]))
+    assert ngroups == 4
+    assert_array_equal(codes, [3, 0, 3])
+
+
+def test_group_demean_weighted():
+    rs = np.random.RandomState(0)
+    values = rs.standard_normal((200, 2))
+    weights = rs.chisquare(5, size=(200, 1)) / 5
+    codes = rs.randint(0, 10, size=200)
+    res = group_demean(values, codes, weights)
+    df = pd.DataFrame(values * weights)
+    num = np.asarray(df.groupby(codes).transform("sum"))
+    denom = np.asarray(pd.DataFrame(weights).groupby(codes).transform("sum"))
+    expected = np.sqrt(weights) * (values - num / denom)
+    assert_allclose(res, expected)
+
+
+@pytest.mark.parametrize("method", ["ap", "irons-tuck", "cg"])
+def test_general_group_demean_methods(method):
+    rs = np.random.RandomState(0)
+    nobs = 1000
+    groups = np.column_stack(
+        [rs.randint(0, 100, nobs), rs.randint(0, 10, nobs), rs.randint(0, 30, nobs)]
+    )
+    values = rs.standard_normal((nobs, 2))
+    weights = rs.chisquare(5, size=(nobs, 1)) / 5
+    d, _ = dummy_matrix(groups, output_format="array", precondition=False)
+    root_w = np.sqrt(weights)
+    wd = root_w * d
+    expected = (
+        root_w * values - wd @ np.linalg.lstsq(wd, root_w * values, rcond=None)[0]
+    )
+    res = general_group_demean(values, groups, weights, method=method, tol=1e-12)
+    assert_allclose(res.values, expected, atol=1e-8)
+    assert res.tolerance <= 1e-12
+    assert res.iterations > 1
+
+    res = general_group_demean(values, groups, weights, method=method, max_iter=3)
+    assert res.iterations <= 4
+    with pytest.raises(ValueError, match="method must be"):
+        general_group_demean(values, groups, method="unknown")
+
+
+def test_fixed_effects_absorber():
+    rs = np.random.RandomState(0)
+    nobs = 500
+    groups = np.column_stack([rs.randint(0, 40, nobs), rs.randint(0, 7, nobs)])
+    weights = rs.chisquare(5, size=nobs) / 5
+    values = rs.standard_normal((nobs, 3))
+    absorber = FixedEffectsAbsorber(groups, weights)
+    assert absorber.nobs == nobs
+    assert absorber.ngroups == [40, 7]
+    assert_allclose(absorber.weights, weights[:, None])
+    res = absorber.demean(values, tol=1e-12)
+    expected = general_group_demean(values, groups, weights[:, None], tol=1e-12)
+    assert_allclose(res.values, expected.values)
+    res_first = absorber.demean(values[:, :1], tol=1e-12)
+    assert_allclose(res_first.values, res.values[:, :1], atol=1e-8)
+    via_function = general_group_demean(values, absorber, tol=1e-12)
+    assert_allclose(via_function.values, res.values)
+    with pytest.raises(ValueError, match="weights cannot be used"):
+        general_group_demean(values, absorber, weights[:, None])
+    with pytest.raises(ValueError, match="same number of rows"):
+        absorber.demean(values[:10])
@@ -1,3 +1,4 @@
+import os
 import pickle
 import random
 import string
@@ -8,8 +9,20 @@ from numpy.testing import assert_allclose
 import pandas as pd
 import pytest
 from scipy import stats
+import scipy.sparse as sp
+from scipy.sparse.linalg import lsmr
 
 import linearmodels
+from linearmodels.shared.covariance import (
+    ClusterStructure,
+    cluster_structures,
+    cluster_subsets,
+    cluster_union,
+    cov_cluster,
+    cov_cluster_multiway,
+    group_debias_coefficient,
+    psd_correction,
+)
 from linearmodels.shared.exceptions import missing_warning
 from linearmodels.shared.hypotheses import (
     InapplicableTestStatistic,
@@ -17,7 +30,14 @@ from linearmodels.shared.hypotheses import (
     WaldTestStatistic,
 )
 from linearmodels.shared.io import add_star, format_wide
-from linearmodels.shared.linalg import has_constant, inv_sqrth
+from linearmodels.shared.linalg import (
+    block_lsmr,
+    column_lsmr,
+    has_constant,
+    inv_sqrth,
+    parallel_map,
+    resolve_n_jobs,
+)
 from linearmodels.shared.utility import AttrDict, ensure_unique_column, panel_to_frame
 
 MISSING_PANEL = "Panel" not in dir(pd)
@@ -251,3 +271,176 @@ def test_add_star(pvalue):
 
     result = add_star("", pvalue, True)
     assert expected == result
+
+
+@pytest.mark.parametrize("block_size", [None, 1, 3])
+def test_block_lsmr(block_size):
+    rs = np.random.RandomState(0)
+    a = sp.random(500, 40, density=0.05, format="csc", random_state=rs)
+    a = sp.hstack([a, sp.eye(500, 40, format="csc")]).tocsc()
+    b = rs.standard_normal((500, 7))
+    b[:, 3] = 0.0
+    res = block_lsmr(a, b, atol=1e-10, btol=1e-10, block_size=block_size)
+    assert res.x.shape == (80, 7)
+    for i in range(b.shape[1]):
+        direct = lsmr(a, b[:, i], atol=1e-10, btol=1e-10)
+        assert_allclose(res.x[:, i], direct[0], rtol=1e-8, atol=1e-10)
+        assert res.istop[i] == direct[1]
+        assert res.iterations[i] == direct[2]
+    assert_allclose(res.x[:, 3], 0.0)
+
+    dense = block_lsmr(a.toarray(), b, atol=1e-10, btol=1e-10)
+    assert_allclose(dense.x, res.x, rtol=1e-8, atol=1e-10)
+
+
+def test_block_lsmr_exceptions():
+    a = np.eye(3)
+    with pytest.raises(ValueError, match="2-dimensional"):
+        block_lsmr(a, np.ones(3))
+    with pytest.raises(ValueError, match="block_size"):
+        block_lsmr(a, np.ones((3, 2)), block_size=0)
+    res = block_lsmr(a, np.ones((3, 0)))
+    assert res.x.shape == (3, 0)
+
+
+def test_resolve_n_jobs():
+    cpus = os.cpu_count() or 1
+    assert resolve_n_jobs(None) == 1
+    assert resolve_n_jobs(3) == 3
+    assert resolve_n_jobs(-1) == cpus
+    assert resolve_n_jobs(-cpus - 10) == 1
+    with pytest.raises(ValueError, match="n_jobs"):
+        resolve_n_jobs(0)
+    assert parallel_map(lambda v: v**2, list(range(10)), n_jobs=4) == [
+        v**2 for v in range(10)
+    ]
+
+
+def test_block_and_column_lsmr_n_jobs():
+    rs = np.random.RandomState(0)
+    a = sp.random(500, 40, density=0.05, format="csc", random_state=rs)
+    a = sp.hstack([a, sp.eye(500, 40, format="csc")]).tocsc()
+    b = rs.standard_normal((500, 9))
+    serial = block_lsmr(a, b, block_size=2)
+    parallel = block_lsmr(a, b, block_size=2, n_jobs=3)
+    np.testing.assert_array_equal(serial.x, parallel.x)
+    np.testing.assert_array_equal(serial.iterations, parallel.iterations)
+    columns = column_lsmr(a, b, atol=1e-10, btol=1e-10)
+    np.testing.assert_array_equal(
+        columns, column_lsmr(a, b, atol=1e-10, btol=1e-10, n_jobs=-1)
+    )
+    for i in range(b.shape[1]):
+        np.testing.assert_array_equal(
+            columns[:, i], lsmr(a, b[:, i], atol=1e-10, btol=1e-10)[0]
+        )
+
+
+@pytest.mark.parametrize("cluster_type", ["int", "float", "str", "sorted", "2d"])
+def test_cov_cluster(cluster_type):
+    rs = np.random.RandomState(0)
+    z = rs.standard_normal((1000, 4))
+    clusters = rs.randint(0, 37, 1000)
+    expected = np.zeros((4, 4))
+    for c in np.unique(clusters):
+        z_bar = z[clusters == c].sum(0)[:, None]
+        expected += z_bar @ z_bar.T
+    expected /= 1000
+    if cluster_type == "float":
+        clusters = clusters / 10.0
+    elif cluster_type == "str":
+        clusters = np.array([f"c{c}" for c in clusters], dtype=object)
+    elif cluster_type == "sorted":
+        order = np.argsort(clusters)
+        clusters, z = clusters[order], z[order]
+    elif cluster_type == "2d":
+        clusters = clusters[:, None]
+    assert_allclose(cov_cluster(z, clusters), expected, rtol=1e-12)
+
+
+def test_cov_cluster_empty():
+    assert_allclose(cov_cluster(np.empty((0, 3)), np.empty(0)), np.zeros((3, 3)))
+
+
+def test_cluster_structure():
+    rs = np.random.RandomState(0)
+    clusters = rs.randint(0, 25, (1000, 2))
+    z = rs.standard_normal((1000, 3))
+    structure = ClusterStructure(clusters[:, 0])
+    assert structure.nobs == 1000
+    assert structure.ngroups == 25
+    _, codes = np.unique(clusters[:, 0], return_inverse=True)
+    np.testing.assert_array_equal(structure.codes, codes)
+    assert_allclose(cov_cluster(z, structure), cov_cluster(z, clusters[:, 0]))
+    assert group_debias_coefficient(structure) == group_debias_coefficient(
+        clusters[:, 0]
+    )
+
+    ordered = ClusterStructure(np.sort(clusters[:, 0]))
+    assert ordered.order is None
+
+    inter = structure.intersect(ClusterStructure(clusters[:, 1]))
+    union = cluster_union(clusters)
+    assert inter.ngroups == np.unique(union).shape[0]
+    assert_allclose(cov_cluster(z, inter), cov_cluster(z, union))
+
+    with pytest.raises(ValueError, match="same number"):
+        structure.intersect(ClusterStructure(clusters[:10, 1]))
+    with pytest.raises(ValueError, match="one-dimensional"):
+        ClusterStructure(clusters)
+
+
+def test_cluster_structures_cache():
+    rs = np.random.RandomState(0)
+    clusters = rs.randint(0, 25, (1000, 2))
+    first = cluster_structures(clusters)
+    assert len(first) == 3
+    second = cluster_structures(clusters.copy())
+    assert all(a is b for a, b in zip(first, second))
+    assert len(cluster_structures(clusters[:, 0])) == 1
+    strings = np.array([str(v) for v in clusters[:, 0]], dtype=object)
+    assert cluster_structures(strings)[0].ngroups == 25
+
+
+def test_cov_cluster_multiway():
+    rs = np.random.RandomState(0)
+    clusters = np.column_stack(
+        [rs.randint(0, 13, 2000), rs.randint(0, 17, 2000), rs.randint(0, 5, 2000)]
+    )
+    z = rs.standard_normal((2000, 3))
+    assert cluster_subsets(3) == [
+        (0,),
+        (1,),
+        (2,),
+        (0, 1),
+        (0, 2),
+        (1, 2),
+        (0, 1, 2),
+    ]
+    expected = np.zeros((3, 3))
+    for subset in cluster_subsets(3):
+        sign = 1 if len(subset) % 2 else -1
+        inter = pd.Series(list(map(tuple, clusters[:, list(subset)]))).factorize()[0]
+        expected += sign * cov_cluster(z, inter) * group_debias_coefficient(inter)
+    multi = cov_cluster_multiway(z, clusters, group_debias=True)
+    assert_allclose(multi, expected)
+    assert len(cluster_structures(clusters)) == 7
+
+    two_way = cov_cluster_multiway(z, clusters[:, :2])
+    direct = (
+        cov_cluster(z, clusters[:, 0])
+        + cov_cluster(z, clusters[:, 1])
+        - cov_cluster(z, cluster_union(clusters[:, :2]))
+    )
+    assert_allclose(two_way, direct)
+    assert_allclose(
+        cov_cluster_multiway(z, clusters[:, 0]), cov_cluster(z, clusters[:, 0])
+    )
+
+
+def test_psd_correction():
+    s = np.array([[1.0, 2.0], [2.0, 1.0]])
+    corrected = psd_correction(s)
+    assert np.all(np.linalg.eigvalsh(corrected) >= -1e-12)
+    assert_allclose(corrected, np.full((2, 2), 1.5))
+    psd = np.eye(2)
+    assert_allclose(psd_correction(psd), psd)
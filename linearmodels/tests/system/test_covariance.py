@@ -248,6 +248,7 @@ CLUSTERS = [
     np.arange(500) % 41,
     np.column_stack([np.arange(500) % 37]),
     np.column_stack([np.arange(500) % 37, np.arange(500) % 41]),
+    np.column_stack([np.arange(500) % 37, np.arange(500) % 41, np.arange(500) % 7]),
 ]
 
 
@@ -287,8 +288,11 @@ def test_clustered_error(cov_data, debias):
             debiased=debias,
             clusters=clusters,
         )
-    clusters = np.ones((nobs, 3), dtype=int)
-    with pytest.raises(ValueError, match="clusters must be an ndarray"):
+    clusters = np.zeros((nobs, 3), dtype=int)
+    clusters[:, 0] = np.arange(nobs) % 20
+    clusters[:, 1] = np.arange(nobs) % 7
+    clusters[:, 2] = np.arange(nobs) % 40
+    with pytest.raises(ValueError, match="clusters must be non-nested"):
         ClusteredCovariance(
             x,
             eps,
@@ -418,3 +422,15 @@ def test_gmm_kernel_direct(cov_data, debias):
     direct = (direct + direct.T) / 2
     assert_allclose(direct, cov_est.cov)
     assert "kernel" in cov_est.cov_config
+
+
+def test_clustered_psd_correction(cov_data):
+    x, _, eps, sigma = cov_data
+    clusters = np.column_stack(
+        [np.arange(500) % 37, np.arange(500) % 41, np.arange(500) % 7]
+    )
+    clustered = ClusteredCovariance(
+        x, eps, sigma, sigma, clusters=clusters, psd_correction=True
+    )
+    assert clustered.cov_config["psd_correction"] is True
+    assert np.all(np.linalg.eigvalsh(clustered.cov) >= -1e-12)
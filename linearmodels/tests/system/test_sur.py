@@ -909,3 +909,29 @@ def test_unknown_method():
     mod = SUR(generate_data(k=3))
     with pytest.raises(ValueError, match="method must be 'ols' or 'gls'"):
         mod.fit(method="other")
+
+
+@pytest.mark.parametrize("method", ["ols", "gls"])
+@pytest.mark.parametrize("debiased", [True, False])
+def test_with_cov(method, debiased):
+    mod = SUR(generate_data(n=500, k=3, p=[2, 3, 4], const=True, seed=0))
+    iterate = method == "gls"
+    base = mod.fit(
+        method=method, cov_type="unadjusted", debiased=debiased, iterate=iterate
+    )
+    for cov_type, cov_config in (("robust", {}), ("kernel", {"bandwidth": 4})):
+        expected = mod.fit(
+            method=method,
+            cov_type=cov_type,
+            debiased=debiased,
+            iterate=iterate,
+            **cov_config,
+        )
+        res = base.with_cov(cov_type, **cov_config)
+        assert res.cov_estimator == expected.cov_estimator
+        assert_allclose(res.cov, expected.cov, rtol=1e-10)
+        assert_allclose(res.system_rsquared, expected.system_rsquared)
+        for eq in res.equations:
+            assert_allclose(res.equations[eq].cov, expected.equations[eq].cov)
+    with pytest.raises(ValueError):
+        base.with_cov("robust", debiased=not debiased)